@@ -34,6 +34,8 @@ class ClayBuiltWithImporter:
             raise ValueError("Missing SUPABASE_URL or SUPABASE_SERVICE_KEY in .env")
 
         self.base_url = f"{self.supabase_url}/rest/v1"
+        # One pooled client for every Supabase call in the run; close with aclose()
+        self.client = httpx.AsyncClient(timeout=30.0)
         self.stats = {
             "total_rows": 0,
             "processed": 0,
@@ -51,6 +53,10 @@ class ClayBuiltWithImporter:
             "Prefer": "return=minimal"
         }
 
+    async def aclose(self):
+        """Close the pooled Supabase connections."""
+        await self.client.aclose()
+
     def read_csv(self, csv_path: str) -> List[Dict[str, Any]]:
         """Read Clay BuiltWith CSV export"""
         print(f"\n Reading CSV: {csv_path}")
@@ -160,27 +166,26 @@ class ClayBuiltWithImporter:
                 "updated_at": now
             }
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.patch(
-                    f"{self.base_url}/leads?id=eq.{lead_id}",
-                    headers=self._headers(),
-                    json=update_data
-                )
-
-                if resp.status_code in [200, 204]:
-                    print(f"    Saved to Supabase")
-                    self.stats["processed"] += 1
-                    return True
-                else:
-                    error_msg = f"Supabase update failed: {resp.status_code} - {resp.text}"
-                    print(f"    {error_msg}")
-                    self.stats["errors"] += 1
-                    self.stats["error_details"].append({
-                        "lead_id": lead_id,
-                        "business_name": business_name,
-                        "error": error_msg
-                    })
-                    return False
+            resp = await self.client.patch(
+                f"{self.base_url}/leads?id=eq.{lead_id}",
+                headers=self._headers(),
+                json=update_data
+            )
+
+            if resp.status_code in (200, 204):
+                print(f"    Saved to Supabase")
+                self.stats["processed"] += 1
+                return True
+            else:
+                error_msg = f"Supabase update failed: {resp.status_code} - {resp.text}"
+                print(f"    {error_msg}")
+                self.stats["errors"] += 1
+                self.stats["error_details"].append({
+                    "lead_id": lead_id,
+                    "business_name": business_name,
+                    "error": error_msg
+                })
+                return False
 
         except Exception as e:
             error_msg = f"Error processing lead: {str(e)}"
@@ -254,7 +259,10 @@ async def main():
 
     # Create importer and run
     importer = ClayBuiltWithImporter()
-    await importer.import_csv(csv_path)
+    try:
+        await importer.import_csv(csv_path)
+    finally:
+        await importer.aclose()
 
 
 if __name__ == "__main__":
@@ -77,7 +77,10 @@ OPENAI_API_KEY = os.getenv("OPENAI_API_KEY", "")
 
 # RAG Settings
 RAG_EMBEDDING_MODEL = os.getenv("RAG_EMBEDDING_MODEL", "text-embedding-3-small")
-RAG_EMBEDDING_DIMENSIONS = 1536
+# text-embedding-3-* can return shorter vectors (e.g. 512) that are much
+# cheaper to ship to Supabase; the vector columns and match_* functions
+# must be declared with the same size.
+RAG_EMBEDDING_DIMENSIONS = int(os.getenv("RAG_EMBEDDING_DIMENSIONS", "1536"))
 RAG_MATCH_THRESHOLD = 0.7
 RAG_MATCH_COUNT = 5
 
@@ -32,8 +32,18 @@ try:
 except ImportError:
     from scoring import format_pain_signals_for_email  # type: ignore
 
+try:
+    from .services import get_http_client, _loads, _json_body  # type: ignore
+except ImportError:
+    from services import get_http_client, _loads, _json_body  # type: ignore
+
 
 ANTHROPIC_API_URL = "https://api.anthropic.com/v1/messages"
+ANTHROPIC_HEADERS = {
+    "Content-Type": "application/json",
+    "x-api-key": ANTHROPIC_API_KEY,
+    "anthropic-version": "2023-06-01"
+}
 
 # A/B test variants
 AB_VARIANTS = ["authority", "curiosity", "pain_point"]
@@ -155,101 +165,95 @@ async def generate_email(
     )
 
     try:
-        # Disable trust in environment proxies to avoid requiring optional
-        # dependencies like socksio (see test integrations). When trust_env=False,
-        # httpx will ignore HTTP_PROXY/HTTPS_PROXY environment variables that may
-        # point to a SOCKS proxy. Without socksio installed this would otherwise
-        # raise an error.
-        async with httpx.AsyncClient(timeout=60.0, trust_env=False) as client:
-            response = await client.post(
-                ANTHROPIC_API_URL,
-                headers={
-                    "Content-Type": "application/json",
-                    "x-api-key": ANTHROPIC_API_KEY,
-                    "anthropic-version": "2023-06-01"
-                },
-                json={
-                    "model": "claude-sonnet-4-20250514",
-                    "max_tokens": 1024,
-                    "messages": [
-                        {"role": "user", "content": prompt}
-                    ]
-                }
-            )
-
-            if response.status_code != 200:
-                return GeneratedEmail(
-                    valid=False,
-                    error=f"Claude API error: {response.status_code} - {response.text}"
-                )
+        # Shared pooled client (trust_env=False, so proxy env vars that point
+        # at a SOCKS proxy don't require socksio)
+        client = get_http_client()
+        response = await client.post(
+            ANTHROPIC_API_URL,
+            headers=ANTHROPIC_HEADERS,
+            content=_json_body({
+                "model": "claude-sonnet-4-20250514",
+                "max_tokens": 1024,
+                "messages": [
+                    {"role": "user", "content": prompt}
+                ]
+            }),
+            timeout=60.0
+        )
 
-            result = response.json()
-            content = result.get("content", [])
+        if response.status_code != 200:
+            return GeneratedEmail(
+                valid=False,
+                error=f"Claude API error: {response.status_code} - {response.text}"
+            )
 
-            if not content:
-                return GeneratedEmail(
-                    valid=False,
-                    error="Empty response from Claude"
-                )
+        result = _loads(response.content)
+        content = result.get("content", [])
 
-            # Extract text from response
-            text = content[0].get("text", "")
+        if not content:
+            return GeneratedEmail(
+                valid=False,
+                error="Empty response from Claude"
+            )
 
-            # Parse JSON from response
-            try:
-                # Handle potential markdown code blocks
-                if "```json" in text:
-                    text = text.split("```json")[1].split("```")[0].strip()
-                elif "```" in text:
-                    text = text.split("```")[1].split("```")[0].strip()
+        # Extract text from response
+        text = content[0].get("text", "")
+
+        # Parse JSON from response
+        try:
+            # Handle potential markdown code blocks
+            if "```json" in text:
+                text = text.split("```json")[1].split("```")[0].strip()
+            elif "```" in text:
+                text = text.split("```")[1].split("```")[0].strip()
+
+            email_data = _loads(text)
+        except json.JSONDecodeError as e:  # orjson's error subclasses this
+            return GeneratedEmail(
+                valid=False,
+                error=f"Failed to parse Claude response as JSON: {e}"
+            )
 
-                email_data = json.loads(text)
-            except json.JSONDecodeError as e:
+        # Validate required fields
+        required_fields = ["subject_line", "preview_text", "email_body"]
+        for field in required_fields:
+            if field not in email_data or not email_data[field]:
                 return GeneratedEmail(
                     valid=False,
-                    error=f"Failed to parse Claude response as JSON: {e}"
+                    error=f"Missing required field: {field}"
                 )
 
-            # Validate required fields
-            required_fields = ["subject_line", "preview_text", "email_body"]
-            for field in required_fields:
-                if field not in email_data or not email_data[field]:
-                    return GeneratedEmail(
-                        valid=False,
-                        error=f"Missing required field: {field}"
-                    )
-
-            # Count words
-            word_count = len(email_data["email_body"].split())
-
-            # Get confidence score
-            confidence = email_data.get("confidence_score", 0.7)
-
-            # Validate email quality
-            email = GeneratedEmail(
-                subject_line=email_data["subject_line"],
-                preview_text=email_data["preview_text"],
-                email_body=email_data["email_body"],
-                personalization_hooks=email_data.get("personalization_hooks", []),
-                confidence_score=confidence,
-                word_count=word_count,
-                valid=True
-            )
+        # Count words
+        word_count = len(email_data["email_body"].split())
+
+        # Get confidence score
+        confidence = email_data.get("confidence_score", 0.7)
+
+        # Validate email quality
+        email = GeneratedEmail(
+            subject_line=email_data["subject_line"],
+            preview_text=email_data["preview_text"],
+            email_body=email_data["email_body"],
+            personalization_hooks=email_data.get("personalization_hooks", []),
+            confidence_score=confidence,
+            word_count=word_count,
+            valid=True
+        )
 
-            # Quality checks
-            validation_errors = validate_email(email, lead)
-            if validation_errors:
-                email.valid = False
-                email.error = "; ".join(validation_errors)
-                email.confidence_score = min(email.confidence_score, 0.4)
+        # Quality checks
+        validation_errors = validate_email(email, lead)
+        if validation_errors:
+            email.valid = False
+            email.error = "; ".join(validation_errors)
+            email.confidence_score = min(email.confidence_score, 0.4)
 
-            # Check confidence threshold
-            if email.confidence_score < EMAIL_CONFIDENCE_THRESHOLD:
-                email.valid = False
-                if not email.error:
-                    email.error = f"Confidence score {email.confidence_score} below threshold {EMAIL_CONFIDENCE_THRESHOLD}"
+        # Check confidence threshold
+        if email.confidence_score < EMAIL_CONFIDENCE_THRESHOLD:
+            email.valid = False
+            if not email.error:
+                email.error = f"Confidence score {email.confidence_score} below threshold {EMAIL_CONFIDENCE_THRESHOLD}"
 
-            return email
+        return email
 
     except httpx.TimeoutException:
         return GeneratedEmail(
@@ -87,7 +87,7 @@ class TechEnrichment:
     tech_analysis_at: str = ""  # ISO timestamp
 
 
-@dataclass
+@dataclass(slots=True)
 class VisualAnalysis:
     """Visual analysis from screenshot service"""
     visual_score: int = 50
@@ -137,7 +137,7 @@ class TrackingAnalysis:
     has_contact_form: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class TechnicalScores:
     """PageSpeed/technical analysis"""
     performance_score: int = 50
@@ -150,7 +150,7 @@ class TechnicalScores:
     cls: float = 0.0
 
 
-@dataclass
+@dataclass(slots=True)
 class DirectoryPresence:
     """Yext directory/listings data"""
     listings_score: int = 50
@@ -160,7 +160,7 @@ class DirectoryPresence:
     scan_id: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class LicenseInfo:
     """TDLR license verification"""
     license_status: str = "Unknown"
@@ -170,7 +170,7 @@ class LicenseInfo:
     expiry_date: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class ReputationData:
     """BBB reputation data"""
     bbb_rating: str = "NR"
@@ -181,7 +181,7 @@ class ReputationData:
     years_in_business: int = 0
 
 
-@dataclass
+@dataclass(slots=True)
 class AddressVerification:
     """Address verification (residential vs commercial)"""
     is_residential: bool = False
@@ -190,7 +190,7 @@ class AddressVerification:
     formatted_address: str = ""
 
 
-@dataclass
+@dataclass(slots=True)
 class OwnerExtraction:
     """Owner info extracted from website (for TDLR waterfall)"""
     owner_first_name: str = ""
@@ -232,7 +232,7 @@ class PainScore:
     proceed: bool = False
 
 
-@dataclass
+@dataclass(slots=True)
 class ContactInfo:
     """Contact enrichment from Clay"""
     owner_email: str = ""
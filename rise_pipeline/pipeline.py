@@ -11,7 +11,10 @@ This is the entry point that coordinates all pipeline stages:
 """
 import asyncio
 import argparse
+import atexit
 import logging
+import logging.handlers
+import queue
 from datetime import datetime
 from typing import Optional
 
@@ -40,13 +43,15 @@ try:
     from .services import (
         SupabaseClient, ClayClient, IntelligenceServices,
         InstantlyClient, GHLClient, FullEnrichClient, HeyReachClient,
-        QuickChartClient, RAGService, HallucinationDetector, LLMCouncil
+        QuickChartClient, RAGService, HallucinationDetector, LLMCouncil,
+        close_http_client, gather_with_concurrency
     )  # type: ignore
 except ImportError:
     from services import (
         SupabaseClient, ClayClient, IntelligenceServices,
         InstantlyClient, GHLClient, FullEnrichClient, HeyReachClient,
-        QuickChartClient, RAGService, HallucinationDetector, LLMCouncil
+        QuickChartClient, RAGService, HallucinationDetector, LLMCouncil,
+        close_http_client, gather_with_concurrency
     )  # type: ignore
 
 try:
@@ -59,11 +64,35 @@ try:
 except ImportError:
     from email_generator import generate_email, select_ab_variant  # type: ignore
 
+
+def configure_logging(level: int = logging.INFO) -> Optional[logging.handlers.QueueListener]:
+    """
+    Configure root logging through a queue.
+
+    Log calls made on the event loop only enqueue the record; a background
+    QueueListener thread does the formatting and the blocking stream write.
+    Like logging.basicConfig, this does nothing if the root logger already
+    has handlers.
+    """
+    root = logging.getLogger()
+    if root.handlers:
+        return None
+
+    handler = logging.StreamHandler()
+    handler.setFormatter(logging.Formatter('%(asctime)s - %(levelname)s - %(message)s'))
+
+    log_queue = queue.SimpleQueue()
+    listener = logging.handlers.QueueListener(log_queue, handler, respect_handler_level=True)
+    root.addHandler(logging.handlers.QueueHandler(log_queue))
+    root.setLevel(level)
+    listener.start()
+    # Flush anything still queued when the process exits
+    atexit.register(listener.stop)
+    return listener
+
+
 # Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(levelname)s - %(message)s'
-)
+configure_logging()
 logger = logging.getLogger(__name__)
 
 
@@ -86,13 +115,22 @@ class RiseLocalPipeline:
         self.use_rag = use_rag  # Use RAG for knowledge-grounded email generation
         self.use_council = use_council  # Use LLM Council for consensus-based decisions
 
-    async def process_lead(self, lead_id: str) -> PipelineResult:
+    async def aclose(self):
+        """Release pooled HTTP connections; call once when the run is finished."""
+        await self.supabase.aclose()
+        await close_http_client()
+
+    async def process_lead(self, lead_id: str, row: Optional[dict] = None) -> PipelineResult:
         """
         Process a single lead through the entire pipeline.
 
+        ``row`` is an optional pre-fetched Supabase leads row (see
+        SupabaseClient.get_leads_bulk); when given, the lead, tech and
+        contact data are built from it instead of being fetched per lead.
+
         Returns PipelineResult with status and all collected data.
         """
-        logger.info(f"Starting pipeline for lead: {lead_id}")
+        logger.info("Starting pipeline for lead: %s", lead_id)
 
         try:
             # =================================================================
@@ -100,9 +138,15 @@ class RiseLocalPipeline:
             # =================================================================
             logger.info("Stage 1: Fetching lead from Supabase")
 
-            lead = await self.supabase.get_lead(lead_id)
+            # One GET covers the lead, tech and contact columns used below
+            if row is None:
+                lead, tech, contact = await self.supabase.get_lead_bundle(lead_id)
+            else:
+                lead = await self.supabase.get_lead(lead_id, row=row)
+                tech = await self.supabase.get_tech_enrichment(lead_id, row=row)
+                contact = await self.supabase.get_contact_info(lead_id, row=row)
             if not lead:
-                logger.error(f"Lead not found: {lead_id}")
+                logger.error("Lead not found: %s", lead_id)
                 return PipelineResult(
                     lead_id=lead_id,
                     status=LeadStatus.FAILED,
@@ -112,34 +156,36 @@ class RiseLocalPipeline:
             # Update status to processing
             await self.supabase.update_lead(lead_id, {"status": "processing"})
 
-            logger.info(f"Processing: {lead.business_name} ({lead.city}, {lead.state})")
+            logger.info("Processing: %s (%s, %s)", lead.business_name, lead.city, lead.state)
 
             # =================================================================
             # STAGE 2: Tech Stack Enrichment (from imported Clay data)
             # =================================================================
             logger.info("Stage 2: Loading tech enrichment from imported Clay data")
 
-            # Get tech data that was imported via dashboard from Clay CSV
-            tech = await self.supabase.get_tech_enrichment(lead_id)
+            # Tech data imported via dashboard from Clay CSV (read in Stage 1)
 
             if tech.tech_score == 0 and not tech.has_gtm and not tech.has_ga4:
                 logger.warning("  No tech enrichment data found - was Clay CSV imported?")
                 logger.info("  Proceeding with default tech values...")
 
-            logger.info(f"Tech score: {tech.tech_score}/100, GTM: {tech.has_gtm}, GA4: {tech.has_ga4}")
+            logger.info("Tech score: %s/100, GTM: %s, GA4: %s", tech.tech_score, tech.has_gtm, tech.has_ga4)
 
             # =================================================================
             # STAGE 3: Parallel Intelligence Gathering
             # =================================================================
             logger.info("Stage 3: Gathering intelligence (parallel)")
 
-            visual, technical, directory, license_info, reputation, address = await self.intelligence.gather_all(
+            visual, technical, directory, license_info, reputation, address, owner_data = await self.intelligence.gather_all(
                 lead=lead,
                 website_url=lead.website_url
             )
 
-            logger.info(f"Visual: {visual.visual_score}, Perf: {technical.performance_score}, Listings: {directory.listings_score}")
-            logger.info(f"Address: {address.address_type} (residential={address.is_residential})")
+            logger.info(
+                "Visual: %s, Perf: %s, Listings: %s",
+                visual.visual_score, technical.performance_score, directory.listings_score
+            )
+            logger.info("Address: %s (residential=%s)", address.address_type, address.is_residential)
 
             # =================================================================
             # STAGE 4: Pain Point Scoring
@@ -156,8 +202,8 @@ class RiseLocalPipeline:
                 reputation=reputation
             )
 
-            logger.info(f"Pain score: {pain_score.score}, Status: {pain_score.status.value}")
-            logger.info(f"Top pain points: {pain_score.top_pain_points[:3]}")
+            logger.info("Pain score: %s, Status: %s", pain_score.score, pain_score.status.value)
+            logger.info("Top pain points: %s", pain_score.top_pain_points[:3])
 
             # =================================================================
             # STAGE 5: Qualification Decision
@@ -207,8 +253,17 @@ class RiseLocalPipeline:
             # =================================================================
             logger.info("Stage 6: Loading contact info from imported Clay data")
 
-            # Get contact data that was imported via dashboard from Clay CSV
-            contact = await self.supabase.get_contact_info(lead_id)
+            # Contact data imported via dashboard from Clay CSV (read in Stage 1)
+
+            # Fill name/phone gaps from the owner info already extracted from
+            # the website in Phase 2 (no second extraction call needed). The
+            # scraped email is unverified and often a shared inbox, so it is
+            # never used as the delivery address.
+            if not contact.owner_first_name and owner_data.owner_first_name:
+                contact.owner_first_name = owner_data.owner_first_name
+                contact.owner_last_name = owner_data.owner_last_name
+            if not contact.owner_phone_direct and owner_data.phone:
+                contact.owner_phone_direct = owner_data.phone
 
             # Also check if we got owner name from TDLR license
             if not contact.owner_first_name and license_info.owner_name:
@@ -220,7 +275,10 @@ class RiseLocalPipeline:
                 logger.warning("  No contact email found - was Clay Contact CSV imported?")
                 logger.info("  Will still generate email but cannot deliver...")
 
-            logger.info(f"Contact found: {contact.owner_email or 'No email'}, Verified: {contact.email_verified}, Source: {contact.contact_source or 'Clay import'}")
+            logger.info(
+                "Contact found: %s, Verified: %s, Source: %s",
+                contact.owner_email or "No email", contact.email_verified, contact.contact_source or "Clay import"
+            )
 
             # =================================================================
             # STAGE 7: Email Generation (Claude + RAG)
@@ -238,7 +296,10 @@ class RiseLocalPipeline:
                     tech_context=tech_context
                 )
                 if rag_context.get("has_context"):
-                    logger.info(f"  RAG: {len(rag_context.get('knowledge_snippets', []))} docs, {len(rag_context.get('example_templates', []))} templates")
+                    logger.info(
+                        "  RAG: %d docs, %d templates",
+                        len(rag_context.get("knowledge_snippets", [])), len(rag_context.get("example_templates", []))
+                    )
 
             ab_variant = select_ab_variant()
             email = await generate_email(
@@ -254,9 +315,9 @@ class RiseLocalPipeline:
             )
 
             if email.valid:
-                logger.info(f"Email generated: '{email.subject_line}' (confidence: {email.confidence_score})")
+                logger.info("Email generated: '%s' (confidence: %s)", email.subject_line, email.confidence_score)
             else:
-                logger.warning(f"Email generation failed: {email.error}")
+                logger.warning("Email generation failed: %s", email.error)
 
             # =================================================================
             # STAGE 8: Delivery (Instantly + HeyReach + GHL)
@@ -297,7 +358,7 @@ class RiseLocalPipeline:
                         }
                     )
                     heyreach_success = heyreach_result.get("success", False)
-                    logger.info(f"HeyReach: {heyreach_success}")
+                    logger.info("HeyReach: %s", heyreach_success)
 
                 # Create contact in GHL
                 ghl_result = await self.ghl.create_contact(
@@ -311,7 +372,10 @@ class RiseLocalPipeline:
 
                 delivery_success = instantly_result.get("success", False) or ghl_result.get("success", False)
 
-                logger.info(f"Delivery: Instantly={instantly_result.get('success')}, GHL={ghl_result.get('success')}, HeyReach={heyreach_success}")
+                logger.info(
+                    "Delivery: Instantly=%s, GHL=%s, HeyReach=%s",
+                    instantly_result.get("success"), ghl_result.get("success"), heyreach_success
+                )
             else:
                 logger.warning("Skipping delivery: No valid email or contact")
 
@@ -338,7 +402,7 @@ class RiseLocalPipeline:
                 ab_variant=ab_variant
             )
 
-            logger.info(f"Pipeline complete for {lead.business_name}: {final_status.value}")
+            logger.info("Pipeline complete for %s: %s", lead.business_name, final_status.value)
 
             return PipelineResult(
                 lead_id=lead_id,
@@ -360,7 +424,7 @@ class RiseLocalPipeline:
             )
 
         except Exception as e:
-            logger.exception(f"Pipeline failed for {lead_id}: {e}")
+            logger.exception("Pipeline failed for %s: %s", lead_id, e)
 
             # Update status to failed
             await self.supabase.update_lead(lead_id, {
@@ -499,22 +563,38 @@ class RiseLocalPipeline:
         })
 
 
-async def process_batch(lead_ids: list, concurrency: int = 3) -> list:
-    """Process multiple leads with controlled concurrency."""
-    pipeline = RiseLocalPipeline()
-    semaphore = asyncio.Semaphore(concurrency)
+async def process_batch(lead_ids: list, concurrency: int = 3, rows: Optional[dict] = None) -> list:
+    """
+    Process multiple leads with controlled concurrency.
 
-    async def process_with_semaphore(lead_id: str):
-        async with semaphore:
-            return await pipeline.process_lead(lead_id)
-
-    tasks = [process_with_semaphore(lid) for lid in lead_ids]
-    results = await asyncio.gather(*tasks, return_exceptions=True)
+    ``rows`` may map lead ID -> already-fetched Supabase row; otherwise all
+    rows are read up front in one bulk request instead of three Supabase
+    round trips per lead.
+    """
+    pipeline = RiseLocalPipeline()
 
+    if rows is None:
+        try:
+            rows = await pipeline.supabase.get_leads_bulk(lead_ids)
+        except Exception as e:
+            # Fall back to per-lead fetches inside process_lead
+            logger.warning("Bulk lead fetch failed, fetching per lead: %s", e)
+            rows = {}
+
+    try:
+        results = await gather_with_concurrency(
+            concurrency,
+            *(pipeline.process_lead(lid, row=rows.get(str(lid))) for lid in lead_ids),
+            return_exceptions=True
+        )
+    finally:
+        await pipeline.aclose()
+
+    # Results come back in lead order, so failures keep their lead ID
     return [
         r if isinstance(r, PipelineResult)
-        else PipelineResult(lead_id="unknown", status=LeadStatus.FAILED, error=str(r))
-        for r in results
+        else PipelineResult(lead_id=str(lid), status=LeadStatus.FAILED, error=str(r))
+        for lid, r in zip(lead_ids, results)
     ]
 
 
@@ -523,26 +603,31 @@ async def fetch_and_process_new_leads(limit: int = 10) -> list:
     pipeline = RiseLocalPipeline()
 
     # Query for new leads
-    response = await pipeline.supabase.client.get(
-        f"{pipeline.supabase.base_url}/leads",
-        headers=pipeline.supabase._headers(),
-        params={
-            "status": "eq.new",
-            "limit": str(limit),
-            "order": "created_at.asc"
-        }
-    )
+    try:
+        response = await pipeline.supabase.client.get(
+            pipeline.supabase.leads_url,
+            headers=pipeline.supabase._header_dict,
+            params={
+                "status": "eq.new",
+                "limit": str(limit),
+                "order": "created_at.asc"
+            }
+        )
+    finally:
+        # process_batch builds its own pipeline; this one is only for the query
+        await pipeline.supabase.aclose()
 
     if response.status_code != 200:
-        logger.error(f"Failed to fetch leads: {response.text}")
+        logger.error("Failed to fetch leads: %s", response.text)
         return []
 
     leads = response.json()
     lead_ids = [lead["id"] for lead in leads]
 
-    logger.info(f"Found {len(lead_ids)} new leads to process")
+    logger.info("Found %d new leads to process", len(lead_ids))
 
-    return await process_batch(lead_ids)
+    # The query above already returned full rows, so reuse them
+    return await process_batch(lead_ids, rows={str(lead["id"]): lead for lead in leads})
 
 
 def main():
@@ -557,8 +642,14 @@ def main():
 
     if args.lead_id:
         # Process single lead
-        pipeline = RiseLocalPipeline()
-        result = asyncio.run(pipeline.process_lead(args.lead_id))
+        async def run_single():
+            pipeline = RiseLocalPipeline()
+            try:
+                return await pipeline.process_lead(args.lead_id)
+            finally:
+                await pipeline.aclose()
+
+        result = asyncio.run(run_single())
         print(f"\nResult: {result.status.value}")
         if result.error:
             print(f"Error: {result.error}")
@@ -24,9 +24,9 @@ import argparse
 # the relative imports will fail. In that case we fall back to importing
 # the modules from the current working directory.
 try:
-    from .services import SupabaseClient, IntelligenceServices  # type: ignore
+    from .services import SupabaseClient, IntelligenceServices, _loads, close_http_client  # type: ignore
 except ImportError:
-    from services import SupabaseClient, IntelligenceServices  # type: ignore
+    from services import SupabaseClient, IntelligenceServices, _loads, close_http_client  # type: ignore
 
 try:
     from .models import Lead  # type: ignore
@@ -57,19 +57,17 @@ class Phase2Reprocessor:
         if limit:
             params["limit"] = limit
 
-        import httpx
-        async with httpx.AsyncClient(trust_env=False) as client:
-            resp = await client.get(
-                f"{self.supabase.base_url}/leads",
-                headers=self.supabase._headers(),
-                params=params
-            )
+        resp = await self.supabase.client.get(
+            self.supabase.leads_url,
+            headers=self.supabase._header_dict,
+            params=params
+        )
 
-            if resp.status_code == 200:
-                return resp.json()
-            else:
-                print(f"Error fetching leads: {resp.status_code} - {resp.text}")
-                return []
+        if resp.status_code == 200:
+            return _loads(resp.content)
+        else:
+            print(f"Error fetching leads: {resp.status_code} - {resp.text}")
+            return []
 
     async def process_lead(self, lead_data: Dict) -> bool:
         """Run Phase 2 intelligence gathering on a single lead"""
@@ -93,7 +91,7 @@ class Phase2Reprocessor:
             print(f"  Address: {lead.address}, {lead.city}, {lead.state} {lead.zip_code}")
 
             # Run all Phase 2 intelligence gathering in parallel
-            visual, technical, directory, license_info, reputation, address = await self.intelligence.gather_all(
+            visual, technical, directory, license_info, reputation, address, owner_data = await self.intelligence.gather_all(
                 lead=lead,
                 website_url=lead.website_url
             )
@@ -240,7 +238,11 @@ async def main():
     limit = None if args.all else (args.limit or 10)
 
     reprocessor = Phase2Reprocessor()
-    await reprocessor.run(limit=limit)
+    try:
+        await reprocessor.run(limit=limit)
+    finally:
+        await reprocessor.supabase.aclose()
+        await close_http_client()
 
 
 if __name__ == "__main__":
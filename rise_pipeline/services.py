@@ -1,11 +1,52 @@
 """
 External service integrations for Rise Local Pipeline
 """
-import os
+import re
+import sys
+import time
+import hashlib
+import logging
+import random
 import httpx
 import asyncio
-from typing import Optional, Dict, Any, List
+import bisect
+from collections import OrderedDict
+from contextvars import ContextVar
+from functools import lru_cache
+from typing import Optional, Dict, Any, List, Tuple, Union
+from urllib.parse import quote, urlencode, urlsplit
 import json
+import dataclasses
+
+# orjson parses and serializes several times faster than the stdlib json
+# module; fall back to json when it isn't installed. _json_body gives
+# request bytes for ``content=`` so httpx doesn't re-encode with stdlib json
+# (callers send their own Content-Type: application/json header).
+try:
+    import orjson
+
+    def _loads(data):
+        return orjson.loads(data)
+
+    def _dumps(obj) -> str:
+        return orjson.dumps(obj).decode()
+
+    def _json_body(obj) -> bytes:
+        return orjson.dumps(obj)
+except ImportError:
+    orjson = None
+
+    def _loads(data):
+        return json.loads(data)
+
+    def _dumps(obj) -> str:
+        return json.dumps(obj, separators=(",", ":"))
+
+    def _json_body(obj) -> bytes:
+        return json.dumps(obj, separators=(",", ":")).encode()
+
+# For POSTs to services that need no auth headers of their own
+_JSON_HEADERS = {"Content-Type": "application/json"}
 
 # Support both package-relative and top-level imports. When this module
 # is imported as part of the ``rise_pipeline`` package (e.g. via
@@ -14,19 +55,30 @@ import json
 # directory), the relative import will fail. In that case we fall back
 # to importing the config symbols from a top-level ``config`` module.
 try:
-    from .config import *  # type: ignore
+    from .config import (
+        SUPABASE_URL, SUPABASE_SERVICE_KEY,
+        CLAY_API_KEY, CLAY_BUILTWITH_TABLE_ID, CLAY_CONTACT_TABLE_ID,
+        TDLR_SCRAPER_URL, BBB_SCRAPER_URL, PAGESPEED_API_URL,
+        SCREENSHOT_SERVICE_URL, OWNER_EXTRACTOR_URL, ADDRESS_VERIFIER_URL,
+        ANTHROPIC_API_KEY, INSTANTLY_API_KEY, INSTANTLY_CAMPAIGN_ID,
+        GHL_API_KEY, GHL_LOCATION_ID, FULLENRICH_API_KEY, FULLENRICH_WEBHOOK_URL,
+        HEYREACH_API_KEY, HEYREACH_CAMPAIGN_ID, OPENAI_API_KEY,
+        RAG_EMBEDDING_MODEL, RAG_EMBEDDING_DIMENSIONS,
+        CLEANLAB_API_KEY, HALLUCINATION_THRESHOLD
+    )  # type: ignore
 except ImportError:
-    from config import *  # type: ignore
-
-# Additional config from environment (also in config.py)
-FULLENRICH_API_KEY = os.environ.get("FULLENRICH_API_KEY", "")
-FULLENRICH_WEBHOOK_URL = os.environ.get("FULLENRICH_WEBHOOK_URL", "")
-HEYREACH_API_KEY = os.environ.get("HEYREACH_API_KEY", "")
-HEYREACH_CAMPAIGN_ID = os.environ.get("HEYREACH_CAMPAIGN_ID", "")
-OPENAI_API_KEY = os.environ.get("OPENAI_API_KEY", "")
-RAG_EMBEDDING_MODEL = os.environ.get("RAG_EMBEDDING_MODEL", "text-embedding-3-small")
-CLEANLAB_API_KEY = os.environ.get("CLEANLAB_TLM_API_KEY", "")
-HALLUCINATION_THRESHOLD = float(os.environ.get("HALLUCINATION_THRESHOLD", "0.7"))
+    from config import (
+        SUPABASE_URL, SUPABASE_SERVICE_KEY,
+        CLAY_API_KEY, CLAY_BUILTWITH_TABLE_ID, CLAY_CONTACT_TABLE_ID,
+        TDLR_SCRAPER_URL, BBB_SCRAPER_URL, PAGESPEED_API_URL,
+        SCREENSHOT_SERVICE_URL, OWNER_EXTRACTOR_URL, ADDRESS_VERIFIER_URL,
+        ANTHROPIC_API_KEY, INSTANTLY_API_KEY, INSTANTLY_CAMPAIGN_ID,
+        GHL_API_KEY, GHL_LOCATION_ID, FULLENRICH_API_KEY, FULLENRICH_WEBHOOK_URL,
+        HEYREACH_API_KEY, HEYREACH_CAMPAIGN_ID, OPENAI_API_KEY,
+        RAG_EMBEDDING_MODEL, RAG_EMBEDDING_DIMENSIONS,
+        CLEANLAB_API_KEY, HALLUCINATION_THRESHOLD
+    )  # type: ignore
+
 # See comment above regarding relative vs absolute imports. Fall back to
 # absolute imports when executed outside of a package context.
 try:
@@ -42,222 +94,738 @@ except ImportError:
         OwnerExtraction
     )  # type: ignore
 
+logger = logging.getLogger(__name__)
+
+# Shared HTTP connection pool. Opening an ``httpx.AsyncClient`` per call
+# throws away the TCP/TLS connection every time, so service clients share one
+# pooled client instead and pass their own per-request ``timeout=``. The
+# client is bound to the event loop that created it; a fresh one is built
+# when a later ``asyncio.run`` starts a new loop. Call close_http_client()
+# on shutdown, and use set_http_client() to inject a preconfigured client
+# (e.g. one with a mock transport).
+# httpx drops idle connections after 5s by default; the pipeline's stages
+# call each upstream again well within a minute, so keep connections (and
+# their TLS sessions) around long enough to be reused.
+HTTP_POOL_LIMITS = httpx.Limits(max_connections=200, max_keepalive_connections=50, keepalive_expiry=60.0)
+# Default budget; slow endpoints override it per request with timeout=
+HTTP_TIMEOUT = httpx.Timeout(30.0, connect=10.0, pool=5.0)
+
+# HTTP/2 lets concurrent requests to the same origin (e.g. the Phase 2
+# microservices behind one gateway) multiplex over a single connection.
+# httpx only supports it when the optional ``h2`` package is installed;
+# servers that don't negotiate h2 via ALPN transparently stay on HTTP/1.1.
+try:
+    import h2  # noqa: F401
+    HTTP2_ENABLED = True
+except ImportError:
+    HTTP2_ENABLED = False
+
+_http_client: Optional[httpx.AsyncClient] = None
+_http_client_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Return the shared pooled HTTP client for the running event loop."""
+    global _http_client, _http_client_loop
+    loop = asyncio.get_running_loop()
+    if _http_client is not None and not _http_client.is_closed and _http_client_loop is None:
+        # Injected via set_http_client() outside a loop: adopt this one
+        _http_client_loop = loop
+    if _http_client is None or _http_client.is_closed or _http_client_loop is not loop:
+        # trust_env=False for the same reason as SupabaseClient.client
+        _http_client = httpx.AsyncClient(
+            timeout=HTTP_TIMEOUT, limits=HTTP_POOL_LIMITS, http2=HTTP2_ENABLED, trust_env=False
+        )
+        _http_client_loop = loop
+    return _http_client
+
+
+def set_http_client(client: httpx.AsyncClient) -> None:
+    """Use ``client`` as the shared HTTP client for all service classes."""
+    global _http_client, _http_client_loop
+    _http_client = client
+    try:
+        _http_client_loop = asyncio.get_running_loop()
+    except RuntimeError:
+        _http_client_loop = None
+
+
+async def close_http_client() -> None:
+    """Close the shared HTTP client and release its pooled connections."""
+    global _http_client, _http_client_loop
+    client, _http_client, _http_client_loop = _http_client, None, None
+    if client is not None and not client.is_closed:
+        await client.aclose()
+
+
+# Retry and circuit breaking for flaky upstreams. Connection-level failures
+# and 429/5xx responses are retried with jittered exponential backoff; read
+# timeouts are not, since the slow endpoints already have long per-call
+# budgets. After repeated exhausted retries a host's circuit opens and calls
+# fail fast (callers fall back to their neutral defaults) until it cools down.
+RETRY_ATTEMPTS = 3
+RETRY_BASE_DELAY = 0.2
+RETRY_MAX_DELAY = 3.0
+RETRY_STATUSES = frozenset((429, 500, 502, 503, 504))
+RETRY_EXCEPTIONS = (
+    httpx.ConnectError,
+    httpx.ConnectTimeout,
+    httpx.PoolTimeout,
+    httpx.ReadError,
+    httpx.RemoteProtocolError,
+)
+# Calls that aren't safe to repeat (starting a paid FullEnrich job) only retry
+# failures where the server can't have acted on the request: the connection
+# never got a request through, or a 429/503 explicitly asked for a retry.
+# Errors mid-response and other 5xx may mean the request was accepted.
+SAFE_RETRY_EXCEPTIONS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+SAFE_RETRY_STATUSES = frozenset((429, 503))
+# Upper bound on a server-requested Retry-After wait, so one throttled call
+# can't stall a batch indefinitely
+RETRY_AFTER_MAX = 30.0
+CIRCUIT_FAILURE_THRESHOLD = 5
+CIRCUIT_RESET_TIMEOUT = 60.0
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of sending a request while a host's circuit is open."""
+
+
+class _CircuitBreaker:
+    """Consecutive-failure circuit breaker for a single upstream host."""
+
+    def __init__(
+        self,
+        failure_threshold: int = CIRCUIT_FAILURE_THRESHOLD,
+        reset_timeout: float = CIRCUIT_RESET_TIMEOUT
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at = 0.0
+
+    def allow(self) -> bool:
+        if self.failures < self.failure_threshold:
+            return True
+        # Half-open: let a trial request through once the cooldown has passed
+        return time.monotonic() - self.opened_at >= self.reset_timeout
+
+    def record_success(self):
+        self.failures = 0
+
+    def record_failure(self):
+        self.failures += 1
+        if self.failures >= self.failure_threshold:
+            self.opened_at = time.monotonic()
+
+
+_circuit_breakers: Dict[str, _CircuitBreaker] = {}
+
+
+def _circuit_for(host: str) -> _CircuitBreaker:
+    breaker = _circuit_breakers.get(host)
+    if breaker is None:
+        breaker = _circuit_breakers[host] = _CircuitBreaker()
+    return breaker
+
+
+# Cap on in-flight requests per upstream host, so a burst across many leads
+# queues locally instead of tripping the upstream's rate limit (and then a
+# retry storm). Semaphores are bound to an event loop, so they are rebuilt
+# when a new loop starts, like the shared client.
+HOST_MAX_CONCURRENCY = 32
+HOST_CONCURRENCY_OVERRIDES = {
+    "app.fullenrich.com": 10,  # external bulk API; internal services keep the default
+}
+
+_host_semaphores: Dict[str, asyncio.Semaphore] = {}
+_host_semaphores_loop: Optional[asyncio.AbstractEventLoop] = None
+
+
+def _host_semaphore(host: str) -> asyncio.Semaphore:
+    global _host_semaphores_loop
+    loop = asyncio.get_running_loop()
+    if _host_semaphores_loop is not loop:
+        _host_semaphores.clear()
+        _host_semaphores_loop = loop
+    semaphore = _host_semaphores.get(host)
+    if semaphore is None:
+        limit = HOST_CONCURRENCY_OVERRIDES.get(host, HOST_MAX_CONCURRENCY)
+        semaphore = _host_semaphores[host] = asyncio.Semaphore(limit)
+    return semaphore
+
+
+def _retry_after(resp: httpx.Response) -> Optional[float]:
+    """Seconds from a numeric Retry-After header, capped; None if absent."""
+    header = resp.headers.get("Retry-After", "")
+    if header.isdigit():
+        return min(float(header), RETRY_AFTER_MAX)
+    return None
+
+
+async def _send_with_retry(method: str, url: str, idempotent: bool = True, **kwargs) -> httpx.Response:
+    """
+    Send a request on the shared client with retries and circuit breaking.
+
+    Returns the final response (which may still be a 429/5xx once retries are
+    exhausted) or raises the last transport error. Raises CircuitOpenError
+    without sending anything while the host's circuit is open. With
+    idempotent=False only SAFE_RETRY_EXCEPTIONS and SAFE_RETRY_STATUSES
+    carrying a Retry-After are retried.
+    """
+    host = urlsplit(url).netloc
+    breaker = _circuit_for(host)
+    if not breaker.allow():
+        raise CircuitOpenError(f"circuit open for {host}")
+
+    client = get_http_client()
+    semaphore = _host_semaphore(host)
+    for attempt in range(1, RETRY_ATTEMPTS + 1):
+        try:
+            # Held per attempt only, so backoff sleeps don't block the host
+            async with semaphore:
+                resp = await client.request(method, url, **kwargs)
+        except RETRY_EXCEPTIONS as e:
+            if attempt == RETRY_ATTEMPTS or not (idempotent or isinstance(e, SAFE_RETRY_EXCEPTIONS)):
+                breaker.record_failure()
+                raise
+        else:
+            if resp.status_code not in RETRY_STATUSES:
+                breaker.record_success()
+                return resp
+            # Rate-limited upstreams say how long to back off; trust them
+            wait = _retry_after(resp)
+            safe = wait is not None and resp.status_code in SAFE_RETRY_STATUSES
+            if attempt == RETRY_ATTEMPTS or not (idempotent or safe):
+                breaker.record_failure()
+                return resp
+            if wait is not None:
+                await asyncio.sleep(wait + random.uniform(0, RETRY_BASE_DELAY))
+                continue
+        # Full jitter keeps concurrent retries against one host from syncing up
+        delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * 2 ** (attempt - 1))
+        await asyncio.sleep(random.uniform(0, delay))
+
+
+if sys.version_info >= (3, 11):
+    async def gather_structured(*coros) -> List[Any]:
+        """
+        Run coroutines concurrently and return their results in order.
+
+        Uses asyncio.TaskGroup, so if one coroutine raises the others are
+        cancelled rather than left running. The first error is re-raised
+        unwrapped, matching asyncio.gather.
+        """
+        try:
+            async with asyncio.TaskGroup() as tg:
+                tasks = [tg.create_task(coro) for coro in coros]
+        except BaseExceptionGroup as eg:
+            raise eg.exceptions[0] from None
+        return [task.result() for task in tasks]
+else:
+    async def gather_structured(*coros) -> List[Any]:
+        """Run coroutines concurrently and return their results in order."""
+        return list(await asyncio.gather(*coros))
+
+
+async def gather_with_concurrency(n: int, *coros, return_exceptions: bool = False) -> List[Any]:
+    """
+    asyncio.gather, but with at most n of the coroutines running at once.
+
+    With return_exceptions=True a failing coroutine's exception is returned
+    in its slot and the rest keep running, as with asyncio.gather; otherwise
+    the first failure cancels the others (see gather_structured).
+    """
+    semaphore = asyncio.Semaphore(n)
+
+    async def bounded(coro):
+        async with semaphore:
+            return await coro
+
+    if return_exceptions:
+        return await asyncio.gather(*(bounded(coro) for coro in coros), return_exceptions=True)
+    return await gather_structured(*(bounded(coro) for coro in coros))
+
+
+# Single-field coercion helpers for JSON payloads. Missing/null values fall
+# back to the default and values that already have the right type are
+# returned as-is, so the common case costs one dict lookup and a class check.
+def _s(row: Dict[str, Any], key: str, default: str = "") -> str:
+    v = row.get(key)
+    return default if v is None else v if v.__class__ is str else str(v)
+
+
+def _i(row: Dict[str, Any], key: str, default: int = 0) -> int:
+    v = row.get(key)
+    return default if v is None else v if v.__class__ is int else int(v)
+
+
+def _first_present(row: Dict[str, Any], *keys: str, default: Any = None) -> Any:
+    # Short-circuits: later aliases are only looked up when earlier ones are
+    # missing, unlike row.get(a, row.get(b)) which always evaluates both.
+    for key in keys:
+        v = row.get(key)
+        if v is not None:
+            return v
+    return default
+
+
+def _yes_flag(value) -> str:
+    return "yes" if value else ""
+
+
+# Supabase row -> dataclass field specs: (attribute, source columns, type,
+# default). The first truthy source column wins, otherwise the default is
+# used; values that already have the target type skip re-coercion.
+_LEAD_ROW_SPEC = (
+    ("id", ("id",), str, ""),
+    ("business_name", ("business_name",), str, ""),
+    ("address", ("address_full", "address_street"), str, ""),
+    ("city", ("address_city",), str, ""),
+    ("state", ("address_state",), str, "TX"),
+    ("zip_code", ("address_zip",), str, ""),
+    ("phone", ("phone",), str, ""),
+    ("website_url", ("website",), str, ""),
+    ("google_rating", ("google_rating",), float, 0.0),
+    ("review_count", ("google_review_count",), int, 0),
+    ("place_id", ("place_id",), str, ""),
+    ("status", ("status",), str, "discovered"),
+)
+
+_TECH_ROW_SPEC = (
+    ("has_gtm", ("has_gtm",), bool, False),
+    ("has_ga4", ("has_ga4",), bool, False),
+    ("cms_platform", ("cms_platform",), str, ""),
+    ("crm_detected", ("crm_platform",), str, ""),
+    ("booking_system", ("has_booking_system",), _yes_flag, ""),
+    ("chat_widget", ("has_chat_widget",), _yes_flag, ""),
+    ("tech_score", ("tech_stack_score",), int, 0),
+)
+
+_CONTACT_ROW_SPEC = (
+    ("owner_email", ("owner_email",), str, ""),
+    ("owner_first_name", ("owner_first_name",), str, ""),
+    ("owner_last_name", ("owner_last_name",), str, ""),
+    ("owner_linkedin", ("owner_linkedin_url",), str, ""),
+    ("owner_phone_direct", ("owner_phone",), str, ""),
+    ("email_verified", ("verified_email",), bool, False),
+    ("contact_source", ("owner_source",), str, "clay_import"),
+)
+
+
+# PostgREST projections for the lead / tech / contact columns of a leads row.
+# ALL_COLS covers every column the three row specs read.
+LEAD_COLS = (
+    "id,business_name,address_full,address_street,address_city,address_state,"
+    "address_zip,phone,website,google_rating,google_review_count,place_id,status"
+)
+TECH_COLS = "has_gtm,has_ga4,cms_platform,crm_platform,has_booking_system,tech_stack_score,has_chat_widget"
+CONTACT_COLS = "owner_email,owner_first_name,owner_last_name,owner_linkedin_url,owner_phone,verified_email,owner_source"
+ALL_COLS = f"{LEAD_COLS},{TECH_COLS},{CONTACT_COLS}"
+
+
+def _parse_row(spec: tuple, row: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a Supabase row onto dataclass keyword arguments using a field spec."""
+    fields = {}
+    for attr, columns, cast, default in spec:
+        value = None
+        for column in columns:
+            value = row.get(column)
+            if value:
+                break
+        if not value:
+            value = default
+        fields[attr] = value if value.__class__ is cast else cast(value)
+    return fields
+
+
+# Intelligence microservice response -> dataclass field specs: (attribute,
+# response key, type, default). Unlike the Supabase specs, only a missing or
+# null key falls back to the default, so real zeros/empty strings are kept
+# (the same rule as _s/_i).
+_VISUAL_SPEC = (
+    ("visual_score", "visual_score", int, 50),
+    ("design_era", "design_era", str, "Unknown"),
+    ("mobile_responsive", "mobile_responsive", bool, True),
+    ("trust_signals", "trust_signals", int, 0),
+    ("has_hero_image", "has_hero_image", bool, False),
+    ("has_clear_cta", "has_clear_cta", bool, False),
+)
+
+_SOCIAL_SPEC = (
+    ("social_facebook", "facebook", str, ""),
+    ("social_instagram", "instagram", str, ""),
+    ("social_linkedin", "linkedin", str, ""),
+)
+
+_PAGESPEED_SPEC = (
+    ("performance_score", "performance_score", int, 50),
+    ("mobile_score", "mobile_score", int, 50),
+    ("seo_score", "seo_score", int, 50),
+    ("accessibility_score", "accessibility_score", int, 50),
+    ("has_https", "has_https", bool, True),
+    ("lcp_ms", "lcp_ms", int, 0),
+    ("fid_ms", "fid_ms", int, 0),
+    ("cls", "cls", float, 0.0),
+)
+
+_OWNER_SPEC = (
+    ("owner_first_name", "owner_first_name", str, ""),
+    ("owner_last_name", "owner_last_name", str, ""),
+    ("owner_full_name", "owner_full_name", str, ""),
+    ("license_number", "license_number", str, ""),
+    ("email", "email", str, ""),
+    ("phone", "phone", str, ""),
+    ("confidence", "confidence", str, "low"),
+    ("extraction_method", "extraction_method", str, ""),
+    ("error", "error", str, ""),
+)
+
+_LICENSE_SPEC = (
+    ("license_status", "license_status", str, "Unknown"),
+    ("owner_name", "owner_name", str, ""),
+    ("license_number", "license_number", str, ""),
+    ("license_type", "license_type", str, ""),
+    ("expiry_date", "license_expiry", str, ""),
+)
+
+_REPUTATION_SPEC = (
+    ("bbb_rating", "bbb_rating", str, "NR"),
+    ("bbb_accredited", "bbb_accredited", bool, False),
+    ("complaints_3yr", "complaints_3yr", int, 0),
+    ("complaints_total", "complaints_total", int, 0),
+    ("reputation_gap", "reputation_gap", float, 0.0),
+    ("years_in_business", "years_in_business", int, 0),
+)
+
+_ADDRESS_SPEC = (
+    ("is_residential", "is_residential", bool, False),
+    ("address_type", "address_type", str, "unknown"),
+    ("verified", "verified", bool, False),
+    ("formatted_address", "formatted_address", str, ""),
+)
+
+
+def _parse_payload(spec: tuple, data: Dict[str, Any]) -> Dict[str, Any]:
+    """Map a service response onto dataclass keyword arguments using a field spec."""
+    fields = {}
+    for attr, key, cast, default in spec:
+        value = data.get(key)
+        fields[attr] = default if value is None else value if value.__class__ is cast else cast(value)
+    return fields
+
 
 class SupabaseClient:
     """Supabase REST API client"""
 
+    BULK_CHUNK_SIZE = 100
+
     def __init__(self):
         self.base_url = f"{SUPABASE_URL}/rest/v1"
+        self.leads_url = f"{self.base_url}/leads"
         self._header_dict = {
             "apikey": SUPABASE_SERVICE_KEY,
             "Authorization": f"Bearer {SUPABASE_SERVICE_KEY}",
             "Content-Type": "application/json"
         }
+        # Headers are fixed for the client's lifetime, so build the PATCH
+        # variant once rather than merging dicts on every update.
+        self._update_headers = {**self._header_dict, "Prefer": "return=minimal"}
+        # Cleared if the leads table rejects the explicit column lists
+        self._narrow_select = True
         # Explicitly disable trust in environment proxies to avoid requiring
         # optional dependencies like socksio. When trust_env=False,
         # httpx will ignore environment proxy settings such as HTTP_PROXY
         # or HTTPS_PROXY, which may point to a SOCKS proxy. Without
         # socksio installed, attempting to use a SOCKS proxy would
         # otherwise raise an error. See test_integrations for context.
-        self.client = httpx.AsyncClient(timeout=30.0, trust_env=False)
-
-    def _headers(self) -> dict:
-        return self._header_dict
-
-    async def get_lead(self, lead_id: str) -> Optional[Lead]:
-        """Fetch lead by ID"""
-        async with httpx.AsyncClient(trust_env=False) as client:
-            resp = await client.get(
-                f"{self.base_url}/leads",
-                headers=self._headers(),
-                params={"id": f"eq.{lead_id}", "select": "*"}
-            )
-            if resp.status_code == 200:
-                data = resp.json()
-                if data:
-                    row = data[0]
-                    return Lead(
-                        id=str(row.get("id", "")),
-                        business_name=str(row.get("business_name", "")),
-                        address=str(row.get("address_full") or row.get("address_street") or ""),
-                        city=str(row.get("address_city", "")),
-                        state=str(row.get("address_state", "TX")),
-                        zip_code=str(row.get("address_zip", "")),
-                        phone=str(row.get("phone") or ""),
-                        website_url=str(row.get("website") or ""),
-                        google_rating=float(row.get("google_rating") or 0),
-                        review_count=int(row.get("google_review_count") or 0),
-                        place_id=str(row.get("place_id") or ""),
-                        status=str(row.get("status", "discovered"))
-                    )
-            return None
+        # All Supabase methods share this pooled client; close it with aclose().
+        self.client = httpx.AsyncClient(
+            timeout=30.0, limits=HTTP_POOL_LIMITS, http2=HTTP2_ENABLED, trust_env=False
+        )
+
+    async def aclose(self):
+        """Close the pooled connections; call once the client is done."""
+        await self.client.aclose()
+
+    async def _fetch_row(self, lead_id: str, select: str = ALL_COLS) -> Optional[Dict[str, Any]]:
+        """Fetch one leads row (the ``select`` columns); None if not found."""
+        if not self._narrow_select:
+            select = "*"
+        resp = await self.client.get(
+            self.leads_url,
+            headers=self._header_dict,
+            params={"id": f"eq.{lead_id}", "select": select}
+        )
+        if resp.status_code == 400 and select != "*":
+            # PostgREST rejects the whole query if any listed column is
+            # missing (older schemas lack some); fall back to select=*
+            logger.warning("Supabase rejected column list, using select=*: %s", resp.text[:200])
+            self._narrow_select = False
+            return await self._fetch_row(lead_id, "*")
+        if resp.status_code == 200:
+            data = _loads(resp.content)
+            if data:
+                return data[0]
+        return None
+
+    async def get_lead(self, lead_id: str, row: Optional[Dict[str, Any]] = None) -> Optional[Lead]:
+        """Fetch lead by ID (or build it from an already-fetched row)"""
+        if row is None:
+            row = await self._fetch_row(lead_id, LEAD_COLS)
+            if row is None:
+                return None
+        return Lead(**_parse_row(_LEAD_ROW_SPEC, row))
 
     async def update_lead(self, lead_id: str, data: Dict[str, Any]) -> bool:
         """Update lead record"""
-        async with httpx.AsyncClient(trust_env=False) as client:
-            resp = await client.patch(
-                f"{self.base_url}/leads",
-                headers={**self._headers(), "Prefer": "return=minimal"},
-                params={"id": f"eq.{lead_id}"},
-                json=data
-            )
-            if resp.status_code not in [200, 204]:
-                print(f"  Supabase update error ({resp.status_code}): {resp.text}")
-            return resp.status_code in [200, 204]
+        resp = await self.client.patch(
+            self.leads_url,
+            headers=self._update_headers,
+            params={"id": f"eq.{lead_id}"},
+            content=_json_body(data)
+        )
+        if resp.status_code not in (200, 204):
+            logger.warning("Supabase update error (%s): %s", resp.status_code, resp.text)
+        return resp.status_code in (200, 204)
 
     async def fetch_new_leads(self, limit: int = 10, status: str = "new") -> List[Dict]:
         """Fetch leads by status for processing (default: 'new', can also use 'discovered')"""
-        async with httpx.AsyncClient(trust_env=False) as client:
-            resp = await client.get(
-                f"{self.base_url}/leads",
-                headers=self._headers(),
-                params={
-                    "status": f"eq.{status}",
-                    "select": "*",
-                    "order": "created_at.desc",
-                    "limit": limit
-                }
+        resp = await self.client.get(
+            self.leads_url,
+            headers=self._header_dict,
+            params={
+                "status": f"eq.{status}",
+                "select": "*",
+                "order": "created_at.desc",
+                "limit": limit
+            }
+        )
+        if resp.status_code == 200:
+            return _loads(resp.content)
+        return []
+
+    async def get_leads_bulk(self, lead_ids: List[str], select: str = "*") -> Dict[str, Dict[str, Any]]:
+        """
+        Fetch lead rows for many IDs using PostgREST ``id=in.(...)``.
+
+        Returns {lead_id: row}; IDs that weren't found are simply absent.
+        IDs are requested in chunks to keep the query string bounded.
+        ``select`` narrows the columns returned (``id`` is always included).
+        """
+        if select != "*":
+            select = f"id,{select}"
+
+        async def fetch_chunk(chunk: List[str]) -> List[Dict]:
+            resp = await self.client.get(
+                self.leads_url,
+                headers=self._header_dict,
+                params={"id": f"in.({','.join(chunk)})", "select": select}
             )
             if resp.status_code == 200:
-                return resp.json()
+                return _loads(resp.content)
+            logger.warning("Supabase bulk fetch error (%s): %s", resp.status_code, resp.text)
             return []
 
-    async def get_tech_enrichment(self, lead_id: str) -> TechEnrichment:
+        ids = [str(lead_id) for lead_id in lead_ids]
+        chunks = [ids[i:i + self.BULK_CHUNK_SIZE] for i in range(0, len(ids), self.BULK_CHUNK_SIZE)]
+        # Chunks go out concurrently on the pooled client; with HTTP/2 they
+        # share one connection
+        pages = await asyncio.gather(*(fetch_chunk(chunk) for chunk in chunks))
+        return {str(row["id"]): row for page in pages for row in page}
+
+    async def get_lead_bundle(
+        self, lead_id: str
+    ) -> Tuple[Optional[Lead], TechEnrichment, ContactInfo]:
+        """
+        Fetch a lead with its tech enrichment and contact info.
+
+        All three live on the same leads row, so this is one GET instead of
+        the three that get_lead, get_tech_enrichment and get_contact_info
+        would make. The lead is None if the row doesn't exist.
+        """
+        row = await self._fetch_row(lead_id)
+        if row is None:
+            return None, TechEnrichment(), ContactInfo()
+        return (
+            Lead(**_parse_row(_LEAD_ROW_SPEC, row)),
+            TechEnrichment(**_parse_row(_TECH_ROW_SPEC, row)),
+            ContactInfo(**_parse_row(_CONTACT_ROW_SPEC, row)),
+        )
+
+    async def get_tech_enrichments_bulk(self, lead_ids: List[str]) -> Dict[str, TechEnrichment]:
+        """Tech enrichment for many leads in one query; {lead_id: TechEnrichment}."""
+        rows = await self.get_leads_bulk(lead_ids, select=TECH_COLS)
+        return {lead_id: TechEnrichment(**_parse_row(_TECH_ROW_SPEC, row)) for lead_id, row in rows.items()}
+
+    async def get_contact_infos_bulk(self, lead_ids: List[str]) -> Dict[str, ContactInfo]:
+        """Contact info for many leads in one query; {lead_id: ContactInfo}."""
+        rows = await self.get_leads_bulk(lead_ids, select=CONTACT_COLS)
+        return {lead_id: ContactInfo(**_parse_row(_CONTACT_ROW_SPEC, row)) for lead_id, row in rows.items()}
+
+    async def get_tech_enrichment(self, lead_id: str, row: Optional[Dict[str, Any]] = None) -> TechEnrichment:
         """Get tech enrichment data from lead record (imported from Clay CSV)"""
-        async with httpx.AsyncClient(trust_env=False) as client:
-            resp = await client.get(
-                f"{self.base_url}/leads",
-                headers=self._headers(),
-                params={
-                    "id": f"eq.{lead_id}",
-                    "select": "has_gtm,has_ga4,cms_platform,crm_platform,has_booking_system,tech_stack_score,has_chat_widget"
-                }
-            )
-            if resp.status_code == 200:
-                data = resp.json()
-                if data:
-                    row = data[0]
-                    return TechEnrichment(
-                        has_gtm=bool(row.get("has_gtm", False)),
-                        has_ga4=bool(row.get("has_ga4", False)),
-                        cms_platform=str(row.get("cms_platform") or ""),
-                        crm_detected=str(row.get("crm_platform") or ""),
-                        booking_system="yes" if row.get("has_booking_system") else "",
-                        chat_widget="yes" if row.get("has_chat_widget") else "",
-                        tech_score=int(row.get("tech_stack_score") or 0)
-                    )
-            return TechEnrichment()
+        if row is None:
+            row = await self._fetch_row(lead_id, TECH_COLS)
+            if row is None:
+                return TechEnrichment()
+        return TechEnrichment(**_parse_row(_TECH_ROW_SPEC, row))
 
-    async def get_contact_info(self, lead_id: str) -> ContactInfo:
+    async def get_contact_info(self, lead_id: str, row: Optional[Dict[str, Any]] = None) -> ContactInfo:
         """Get contact info from lead record (imported from Clay CSV)"""
-        async with httpx.AsyncClient(trust_env=False) as client:
-            resp = await client.get(
-                f"{self.base_url}/leads",
-                headers=self._headers(),
-                params={
-                    "id": f"eq.{lead_id}",
-                    "select": "owner_email,owner_first_name,owner_last_name,owner_linkedin_url,owner_phone,verified_email,owner_source"
-                }
-            )
-            if resp.status_code == 200:
-                data = resp.json()
-                if data:
-                    row = data[0]
-                    return ContactInfo(
-                        owner_email=str(row.get("owner_email") or ""),
-                        owner_first_name=str(row.get("owner_first_name") or ""),
-                        owner_last_name=str(row.get("owner_last_name") or ""),
-                        owner_linkedin=str(row.get("owner_linkedin_url") or ""),
-                        owner_phone_direct=str(row.get("owner_phone") or ""),
-                        email_verified=bool(row.get("verified_email", False)),
-                        contact_source=str(row.get("owner_source") or "clay_import")
-                    )
-            return ContactInfo()
+        if row is None:
+            row = await self._fetch_row(lead_id, CONTACT_COLS)
+            if row is None:
+                return ContactInfo()
+        return ContactInfo(**_parse_row(_CONTACT_ROW_SPEC, row))
+
+
+# Strings Clay uses for a checked box; module-level so _to_bool is a single
+# global lookup per field.
+_TRUTHY = frozenset(("true", "1", "yes", "y", "t"))
 
 
 class ClayClient:
     """Clay API client for enrichment"""
 
+    ROWS_URL = "https://api.clay.com/v3/tables/{}/rows"
+    # Queuing a row only needs Clay to accept it, not to finish enriching
+    SUBMIT_TIMEOUT = 10.0
+
     def __init__(self):
         self.headers = {
             "Authorization": f"Bearer {CLAY_API_KEY}",
             "Content-Type": "application/json"
         }
 
-    async def enrich_tech_stack(self, website_url: str, business_name: str) -> TechEnrichment:
-        """Get BuiltWith tech enrichment via Clay"""
+    async def _post_clay_row(
+        self,
+        table_id: str,
+        payload: Dict[str, Any],
+        timeout: float
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Insert a row into a Clay table and return the enriched row.
+
+        Returns None on a non-200 response; transport errors propagate so
+        callers can report them alongside their own context.
+        """
+        resp = await _send_with_retry(
+            "POST",
+            self.ROWS_URL.format(table_id),
+            idempotent=False,
+            headers=self.headers,
+            content=_json_body({"data": payload}),
+            timeout=timeout
+        )
+        if resp.status_code != 200:
+            return None
+        data = _loads(resp.content)
+        row = data.get("data", data.get("row", data))
+        if isinstance(row, list) and row:
+            row = row[0]
+        return row
+
+    async def _submit_clay_row(self, table_id: str, payload: Dict[str, Any]) -> bool:
+        """
+        Queue a row in a Clay table without waiting for its enrichment.
+
+        Returns True if Clay accepted the row. The enriched columns reach the
+        leads table through the Clay import, so callers read them later with
+        SupabaseClient instead of holding a task open for minutes.
+        """
+        try:
+            resp = await _send_with_retry(
+                "POST",
+                self.ROWS_URL.format(table_id),
+                idempotent=False,
+                headers=self.headers,
+                content=_json_body({"data": payload}),
+                timeout=self.SUBMIT_TIMEOUT
+            )
+        except Exception as e:
+            logger.warning("Clay submit error: %s", e)
+            return False
+        if resp.status_code not in (200, 201, 202):
+            logger.warning("Clay submit error (%s): %s", resp.status_code, resp.text[:200])
+            return False
+        return True
+
+    async def enrich_tech_stack(
+        self, website_url: str, business_name: str, wait: bool = True
+    ) -> TechEnrichment:
+        """
+        Get BuiltWith tech enrichment via Clay.
+
+        With wait=False the row is only queued (see _submit_clay_row) and an
+        empty TechEnrichment is returned straight away.
+        """
         if not CLAY_BUILTWITH_TABLE_ID or not website_url:
             return TechEnrichment()
 
-        async with httpx.AsyncClient(timeout=120.0, trust_env=False) as client:
-            try:
-                resp = await client.post(
-                    f"https://api.clay.com/v3/tables/{CLAY_BUILTWITH_TABLE_ID}/rows",
-                    headers=self.headers,
-                    json={
-                        "data": {
-                            "business_name": business_name,
-                            "website_url": website_url
-                        }
-                    }
+        payload = {
+            "business_name": business_name,
+            "website_url": website_url
+        }
+        if not wait:
+            await self._submit_clay_row(CLAY_BUILTWITH_TABLE_ID, payload)
+            return TechEnrichment()
+
+        try:
+            row = await self._post_clay_row(CLAY_BUILTWITH_TABLE_ID, payload, timeout=120.0)
+            if row is not None:
+                return TechEnrichment(
+                    has_gtm=self._to_bool(_first_present(row, "has_gtm", "gtm_installed")),
+                    has_ga4=self._to_bool(_first_present(row, "has_ga4", "ga4_installed")),
+                    has_ga_universal=self._to_bool(row.get("has_ga_universal")),
+                    crm_detected=str(_first_present(row, "crm_detected", "crm", default="")),
+                    booking_system=str(_first_present(row, "booking_system", "scheduling_tool", default="")),
+                    cms_platform=str(_first_present(row, "cms_platform", "cms", default="")),
+                    email_marketing=_s(row, "email_marketing"),
+                    chat_widget=_s(row, "chat_widget"),
+                    tech_score=_i(row, "tech_score", 5),
+                    technologies=row.get("technologies", [])
                 )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    row = data.get("data", data.get("row", data))
-                    if isinstance(row, list) and row:
-                        row = row[0]
-                    return TechEnrichment(
-                        has_gtm=self._to_bool(row.get("has_gtm", row.get("gtm_installed"))),
-                        has_ga4=self._to_bool(row.get("has_ga4", row.get("ga4_installed"))),
-                        has_ga_universal=self._to_bool(row.get("has_ga_universal")),
-                        crm_detected=str(row.get("crm_detected", row.get("crm", ""))),
-                        booking_system=str(row.get("booking_system", row.get("scheduling_tool", ""))),
-                        cms_platform=str(row.get("cms_platform", row.get("cms", ""))),
-                        email_marketing=str(row.get("email_marketing", "")),
-                        chat_widget=str(row.get("chat_widget", "")),
-                        tech_score=int(row.get("tech_score", 5)),
-                        technologies=row.get("technologies", [])
-                    )
-            except Exception as e:
-                print(f"  Clay tech enrichment error: {e}")
+        except Exception as e:
+            logger.warning("Clay tech enrichment error: %s", e)
         return TechEnrichment()
 
-    async def enrich_contacts(self, business_name: str, website_url: str, city: str, state: str) -> ContactInfo:
-        """Get contact enrichment via Clay waterfall"""
+    async def enrich_contacts(
+        self, business_name: str, website_url: str, city: str, state: str, wait: bool = True
+    ) -> ContactInfo:
+        """
+        Get contact enrichment via Clay waterfall.
+
+        With wait=False the row is only queued (see _submit_clay_row) and an
+        empty ContactInfo is returned straight away.
+        """
         if not CLAY_CONTACT_TABLE_ID:
             return ContactInfo()
 
-        async with httpx.AsyncClient(timeout=180.0, trust_env=False) as client:
-            try:
-                resp = await client.post(
-                    f"https://api.clay.com/v3/tables/{CLAY_CONTACT_TABLE_ID}/rows",
-                    headers=self.headers,
-                    json={
-                        "data": {
-                            "business_name": business_name,
-                            "website_url": website_url,
-                            "city": city,
-                            "state": state
-                        }
-                    }
+        payload = {
+            "business_name": business_name,
+            "website_url": website_url,
+            "city": city,
+            "state": state
+        }
+        if not wait:
+            await self._submit_clay_row(CLAY_CONTACT_TABLE_ID, payload)
+            return ContactInfo()
+
+        try:
+            row = await self._post_clay_row(CLAY_CONTACT_TABLE_ID, payload, timeout=180.0)
+            if row is not None:
+                return ContactInfo(
+                    owner_email=str(_first_present(row, "owner_email", "email", default="")),
+                    owner_first_name=_s(row, "owner_first_name"),
+                    owner_last_name=_s(row, "owner_last_name"),
+                    owner_linkedin=_s(row, "linkedin_url"),
+                    owner_phone_direct=_s(row, "direct_phone"),
+                    email_verified=self._to_bool(row.get("email_verified")),
+                    contact_source=_s(row, "source", "clay")
                 )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    row = data.get("data", data.get("row", data))
-                    if isinstance(row, list) and row:
-                        row = row[0]
-
-                    return ContactInfo(
-                        owner_email=str(row.get("owner_email", row.get("email", ""))),
-                        owner_first_name=str(row.get("owner_first_name", "")),
-                        owner_last_name=str(row.get("owner_last_name", "")),
-                        owner_linkedin=str(row.get("linkedin_url", "")),
-                        owner_phone_direct=str(row.get("direct_phone", "")),
-                        email_verified=self._to_bool(row.get("email_verified")),
-                        contact_source=str(row.get("source", "clay"))
-                    )
-            except Exception as e:
-                print(f"  Clay contact enrichment error: {e}")
+        except Exception as e:
+            logger.warning("Clay contact enrichment error: %s", e)
 
         return ContactInfo()
 
@@ -265,9 +833,78 @@ class ClayClient:
     def _to_bool(val) -> bool:
         if val is None:
             return False
-        if isinstance(val, bool):
+        # Exact class checks: bool is a subclass of int, and the common JSON
+        # types should not pay for str() coercion.
+        cls = val.__class__
+        if cls is bool:
             return val
-        return str(val).lower() in ("true", "1", "yes")
+        if cls is int:
+            return val == 1
+        if cls is str:
+            return val.lower() in _TRUTHY
+        return str(val).lower() in _TRUTHY
+
+
+# Yext is disabled (see IntelligenceServices.get_yext_listings). These values
+# won't trigger Listings pain signals:
+# - listings_score >= 50 = no "Poor directory presence" signal
+# - listings_found >= 10 = no "Limited directory presence" signal
+# - nap_consistency >= 0.7 = no "Inconsistent business info" signal
+_NEUTRAL_DIRECTORY = DirectoryPresence(
+    listings_score=50,      # Neutral - won't trigger pain signal
+    listings_found=10,      # Neutral - won't trigger pain signal
+    listings_verified=0,    # Unknown
+    nap_consistency=1.0,    # Neutral - won't trigger pain signal
+    scan_id=""              # No scan initiated
+)
+
+
+# Lookups keyed on business identity rather than lead (TDLR, BBB, address)
+# return the same answer for duplicate or franchise leads within a run, so
+# results are memoized for LOOKUP_CACHE_TTL seconds. Concurrent identical
+# lookups share one in-flight task; failures (None) are never cached.
+LOOKUP_CACHE_TTL = 3600.0
+LOOKUP_CACHE_SIZE = 4096
+
+_lookup_cache: "OrderedDict[tuple, Tuple[float, Any]]" = OrderedDict()
+
+
+def _lookup_key(*parts) -> tuple:
+    return tuple(p.strip().lower() if p.__class__ is str else p for p in parts)
+
+
+async def _cached_lookup(key: tuple, fetch):
+    """Return a copy of fetch()'s result for ``key``, sharing in-flight calls."""
+    now = time.monotonic()
+    entry = _lookup_cache.get(key)
+    if entry is not None and entry[0] > now:
+        value = entry[1]
+        if not isinstance(value, asyncio.Task):
+            _lookup_cache.move_to_end(key)
+            return dataclasses.replace(value)
+        if value.get_loop() is asyncio.get_running_loop():
+            result = await asyncio.shield(value)
+            return dataclasses.replace(result) if result is not None else None
+
+    task = asyncio.ensure_future(fetch())
+
+    def settle(done: asyncio.Task):
+        current = _lookup_cache.get(key)
+        if current is None or current[1] is not done:
+            return
+        if done.cancelled() or done.exception() is not None or done.result() is None:
+            del _lookup_cache[key]
+        else:
+            _lookup_cache[key] = (current[0], done.result())
+
+    task.add_done_callback(settle)
+    _lookup_cache[key] = (now + LOOKUP_CACHE_TTL, task)
+    _lookup_cache.move_to_end(key)
+    if len(_lookup_cache) > LOOKUP_CACHE_SIZE:
+        _lookup_cache.popitem(last=False)
+    result = await asyncio.shield(task)
+    # Callers get their own copy; the dataclasses are mutable
+    return dataclasses.replace(result) if result is not None else None
 
 
 class IntelligenceServices:
@@ -276,61 +913,50 @@ class IntelligenceServices:
     @staticmethod
     async def get_visual_analysis(lead: Lead) -> VisualAnalysis:
         """Screenshot and visual analysis"""
-        async with httpx.AsyncClient(timeout=90.0, trust_env=False) as client:
-            try:
-                resp = await client.post(
-                    f"{SCREENSHOT_SERVICE_URL}/analyze",
-                    json={
-                        "url": lead.website_url,
-                        "include_mobile": True,
-                        "include_screenshots": False,
-                        "lead_id": lead.id
-                    }
+        try:
+            resp = await _send_with_retry(
+                "POST",
+                f"{SCREENSHOT_SERVICE_URL}/analyze",
+                headers=_JSON_HEADERS,
+                content=_json_body({
+                    "url": lead.website_url,
+                    "include_mobile": True,
+                    "include_screenshots": False,
+                    "lead_id": lead.id
+                }),
+                timeout=90.0
+            )
+            if resp.status_code == 200:
+                data = _loads(resp.content)
+                social = data.get("social_links") or {}
+                return VisualAnalysis(
+                    **_parse_payload(_VISUAL_SPEC, data),
+                    **_parse_payload(_SOCIAL_SPEC, social)
                 )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    return VisualAnalysis(
-                        visual_score=int(data.get("visual_score", 50)),
-                        design_era=str(data.get("design_era", "Unknown")),
-                        mobile_responsive=data.get("mobile_responsive", True),
-                        social_facebook=str(data.get("social_links", {}).get("facebook", "")),
-                        social_instagram=str(data.get("social_links", {}).get("instagram", "")),
-                        social_linkedin=str(data.get("social_links", {}).get("linkedin", "")),
-                        trust_signals=int(data.get("trust_signals", 0)),
-                        has_hero_image=data.get("has_hero_image", False),
-                        has_clear_cta=data.get("has_clear_cta", False)
-                    )
-            except Exception as e:
-                print(f"  Visual analysis error: {e}")
+        except Exception as e:
+            logger.warning("Visual analysis error: %s", e)
         return VisualAnalysis()
 
     @staticmethod
     async def get_pagespeed(lead: Lead) -> TechnicalScores:
         """PageSpeed analysis"""
-        async with httpx.AsyncClient(timeout=90.0, trust_env=False) as client:
-            try:
-                resp = await client.post(
-                    f"{PAGESPEED_API_URL}/analyze",
-                    json={
-                        "url": lead.website_url,
-                        "strategy": "mobile",
-                        "lead_id": lead.id
-                    }
-                )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    return TechnicalScores(
-                        performance_score=int(data.get("performance_score", 50)),
-                        mobile_score=int(data.get("mobile_score", 50)),
-                        seo_score=int(data.get("seo_score", 50)),
-                        accessibility_score=int(data.get("accessibility_score", 50)),
-                        has_https=data.get("has_https", True),
-                        lcp_ms=int(data.get("lcp_ms", 0)),
-                        fid_ms=int(data.get("fid_ms", 0)),
-                        cls=float(data.get("cls", 0))
-                    )
-            except Exception as e:
-                print(f"  PageSpeed error: {e}")
+        try:
+            resp = await _send_with_retry(
+                "POST",
+                f"{PAGESPEED_API_URL}/analyze",
+                headers=_JSON_HEADERS,
+                content=_json_body({
+                    "url": lead.website_url,
+                    "strategy": "mobile",
+                    "lead_id": lead.id
+                }),
+                timeout=90.0
+            )
+            if resp.status_code == 200:
+                data = _loads(resp.content)
+                return TechnicalScores(**_parse_payload(_PAGESPEED_SPEC, data))
+        except Exception as e:
+            logger.warning("PageSpeed error: %s", e)
         return TechnicalScores()
 
     @staticmethod
@@ -346,21 +972,10 @@ class IntelligenceServices:
         Disabled: December 15, 2025
 
         Returns neutral DirectoryPresence values that won't trigger
-        any pain point signals in scoring.
-        """
-        print(f"  Yext: DISABLED - Returning neutral values (API cannot retrieve scan results)")
-
-        # Return neutral values that won't trigger Listings pain signals:
-        # - listings_score >= 50 = no "Poor directory presence" signal
-        # - listings_found >= 10 = no "Limited directory presence" signal
-        # - nap_consistency >= 0.7 = no "Inconsistent business info" signal
-        return DirectoryPresence(
-            listings_score=50,      # Neutral - won't trigger pain signal
-            listings_found=10,      # Neutral - won't trigger pain signal
-            listings_verified=0,    # Unknown
-            nap_consistency=1.0,    # Neutral - won't trigger pain signal
-            scan_id=""              # No scan initiated
-        )
+        any pain point signals in scoring. gather_all uses the constant
+        directly rather than scheduling this coroutine.
+        """
+        return dataclasses.replace(_NEUTRAL_DIRECTORY)
 
     @staticmethod
     async def get_owner_extraction(lead: Lead) -> OwnerExtraction:
@@ -373,30 +988,22 @@ class IntelligenceServices:
         if not lead.website_url:
             return OwnerExtraction(error="No website URL")
 
-        async with httpx.AsyncClient(timeout=90.0, trust_env=False) as client:
-            try:
-                resp = await client.post(
-                    f"{OWNER_EXTRACTOR_URL}/extract-owner",
-                    json={
-                        "url": lead.website_url,
-                        "lead_id": lead.id
-                    }
-                )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    return OwnerExtraction(
-                        owner_first_name=str(data.get("owner_first_name") or ""),
-                        owner_last_name=str(data.get("owner_last_name") or ""),
-                        owner_full_name=str(data.get("owner_full_name") or ""),
-                        license_number=str(data.get("license_number") or ""),
-                        email=str(data.get("email") or ""),
-                        phone=str(data.get("phone") or ""),
-                        confidence=str(data.get("confidence", "low")),
-                        extraction_method=str(data.get("extraction_method", "")),
-                        error=str(data.get("error") or "")
-                    )
-            except Exception as e:
-                print(f"  Owner extraction error: {e}")
+        try:
+            resp = await _send_with_retry(
+                "POST",
+                f"{OWNER_EXTRACTOR_URL}/extract-owner",
+                headers=_JSON_HEADERS,
+                content=_json_body({
+                    "url": lead.website_url,
+                    "lead_id": lead.id
+                }),
+                timeout=90.0
+            )
+            if resp.status_code == 200:
+                data = _loads(resp.content)
+                return OwnerExtraction(**_parse_payload(_OWNER_SPEC, data))
+        except Exception as e:
+            logger.warning("Owner extraction error: %s", e)
         return OwnerExtraction(error="Failed to extract owner info")
 
     @staticmethod
@@ -405,113 +1012,154 @@ class IntelligenceServices:
         TDLR license verification with waterfall search.
 
         Search order (stops at first successful match):
-        1. License number (if owner_data has it) - most accurate
-        2. Owner name (if owner_data has first/last name)
+        1. License number (if owner_data has it) - direct lookup, most accurate
+        2. Owner name (if owner_data has first/last name), via the waterfall
         3. Business name (fallback)
 
         Args:
             lead: Lead data with business_name and city
             owner_data: Optional OwnerExtraction with owner name and license number
         """
-        async with httpx.AsyncClient(timeout=60.0, trust_env=False) as client:
-            try:
-                # Use waterfall search if we have owner data
-                if owner_data and (owner_data.license_number or owner_data.owner_first_name):
-                    print(f"  TDLR: Using waterfall search with owner data")
-                    print(f"    License: {owner_data.license_number or 'N/A'}")
-                    print(f"    Owner: {owner_data.owner_first_name} {owner_data.owner_last_name}")
-
-                    resp = await client.post(
-                        f"{TDLR_SCRAPER_URL}/search/waterfall",
-                        json={
-                            "license_number": owner_data.license_number or None,
-                            "owner_first_name": owner_data.owner_first_name or None,
-                            "owner_last_name": owner_data.owner_last_name or None,
-                            "business_name": lead.business_name,
-                            "city": lead.city,
-                            "lead_id": lead.id
-                        }
-                    )
-                else:
-                    # Fallback to business name only search
-                    print(f"  TDLR: Using business name search (no owner data)")
-                    resp = await client.post(
-                        f"{TDLR_SCRAPER_URL}/search/business",
-                        json={
-                            "business_name": lead.business_name,
-                            "city": lead.city,
-                            "lead_id": lead.id
-                        }
-                    )
+        if owner_data and (owner_data.license_number or owner_data.owner_first_name):
+            key = _lookup_key(
+                "tdlr", owner_data.license_number, owner_data.owner_first_name,
+                owner_data.owner_last_name, lead.business_name, lead.city
+            )
+        else:
+            key = _lookup_key("tdlr", lead.business_name, lead.city)
+        license_info = await _cached_lookup(
+            key, lambda: IntelligenceServices._fetch_tdlr_license(lead, owner_data)
+        )
+        return license_info or LicenseInfo()
 
+    @staticmethod
+    async def _fetch_tdlr_license(lead: Lead, owner_data: Optional[OwnerExtraction]) -> Optional[LicenseInfo]:
+        """One TDLR lookup; None on failure so the result isn't cached."""
+        try:
+            # A license number from the website is an exact key, so look it
+            # up directly instead of running the fuzzy waterfall; names are
+            # only searched if that finds nothing.
+            if owner_data and owner_data.license_number:
+                logger.info("TDLR: Looking up license %s", owner_data.license_number)
+                resp = await _send_with_retry(
+                    "POST",
+                    f"{TDLR_SCRAPER_URL}/search/license",
+                    headers=_JSON_HEADERS,
+                    content=_json_body({
+                        "license_number": owner_data.license_number,
+                        "lead_id": lead.id
+                    }),
+                    timeout=60.0
+                )
                 if resp.status_code == 200:
-                    data = resp.json()
-                    return LicenseInfo(
-                        license_status=str(data.get("license_status", "Unknown")),
-                        owner_name=str(data.get("owner_name", "")),
-                        license_number=str(data.get("license_number", "")),
-                        license_type=str(data.get("license_type", "")),
-                        expiry_date=str(data.get("license_expiry", ""))
-                    )
-            except Exception as e:
-                print(f"  TDLR error: {e}")
-        return LicenseInfo()
+                    data = _loads(resp.content)
+                    if data.get("license_status") not in (None, "Not Found") and not data.get("error"):
+                        return LicenseInfo(**_parse_payload(_LICENSE_SPEC, data))
+                logger.info("TDLR: License %s not matched, searching by name", owner_data.license_number)
+
+            # Use waterfall search if we have owner data
+            if owner_data and owner_data.owner_first_name:
+                logger.info(
+                    "TDLR: Using waterfall search with owner data (owner: %s %s)",
+                    owner_data.owner_first_name,
+                    owner_data.owner_last_name
+                )
 
-    @staticmethod
-    async def get_bbb_reputation(lead: Lead) -> ReputationData:
-        """BBB reputation check"""
-        async with httpx.AsyncClient(timeout=60.0, trust_env=False) as client:
-            try:
-                resp = await client.post(
-                    f"{BBB_SCRAPER_URL}/search",
-                    json={
+                resp = await _send_with_retry(
+                    "POST",
+                    f"{TDLR_SCRAPER_URL}/search/waterfall",
+                    headers=_JSON_HEADERS,
+                    content=_json_body({
+                        "owner_first_name": owner_data.owner_first_name,
+                        "owner_last_name": owner_data.owner_last_name or None,
                         "business_name": lead.business_name,
                         "city": lead.city,
-                        "state": lead.state,
-                        "google_rating": lead.google_rating,
                         "lead_id": lead.id
-                    }
+                    }),
+                    timeout=60.0
                 )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    return ReputationData(
-                        bbb_rating=str(data.get("bbb_rating", "NR")),
-                        bbb_accredited=data.get("bbb_accredited", False),
-                        complaints_3yr=int(data.get("complaints_3yr", 0)),
-                        complaints_total=int(data.get("complaints_total", 0)),
-                        reputation_gap=float(data.get("reputation_gap", 0)),
-                        years_in_business=int(data.get("years_in_business") or 0)
-                    )
-            except Exception as e:
-                print(f"  BBB error: {e}")
-        return ReputationData()
+            else:
+                # Fallback to business name only search
+                logger.info("TDLR: Using business name search (no owner name)")
+                resp = await _send_with_retry(
+                    "POST",
+                    f"{TDLR_SCRAPER_URL}/search/business",
+                    headers=_JSON_HEADERS,
+                    content=_json_body({
+                        "business_name": lead.business_name,
+                        "city": lead.city,
+                        "lead_id": lead.id
+                    }),
+                    timeout=60.0
+                )
+
+            if resp.status_code == 200:
+                data = _loads(resp.content)
+                return LicenseInfo(**_parse_payload(_LICENSE_SPEC, data))
+        except Exception as e:
+            logger.warning("TDLR error: %s", e)
+        return None
+
+    @staticmethod
+    async def get_bbb_reputation(lead: Lead) -> ReputationData:
+        """BBB reputation check"""
+        # google_rating is part of the key: the reputation gap is derived from it
+        key = _lookup_key("bbb", lead.business_name, lead.city, lead.state, lead.google_rating)
+        reputation = await _cached_lookup(key, lambda: IntelligenceServices._fetch_bbb_reputation(lead))
+        return reputation or ReputationData()
+
+    @staticmethod
+    async def _fetch_bbb_reputation(lead: Lead) -> Optional[ReputationData]:
+        try:
+            resp = await _send_with_retry(
+                "POST",
+                f"{BBB_SCRAPER_URL}/search",
+                headers=_JSON_HEADERS,
+                content=_json_body({
+                    "business_name": lead.business_name,
+                    "city": lead.city,
+                    "state": lead.state,
+                    "google_rating": lead.google_rating,
+                    "lead_id": lead.id
+                }),
+                timeout=60.0
+            )
+            if resp.status_code == 200:
+                data = _loads(resp.content)
+                return ReputationData(**_parse_payload(_REPUTATION_SPEC, data))
+        except Exception as e:
+            logger.warning("BBB error: %s", e)
+        return None
 
     @staticmethod
     async def get_address_verification(lead: Lead) -> AddressVerification:
         """Address verification - residential vs commercial"""
-        async with httpx.AsyncClient(timeout=30.0, trust_env=False) as client:
-            try:
-                resp = await client.post(
-                    f"{ADDRESS_VERIFIER_URL}/verify",
-                    json={
-                        "address": lead.address,
-                        "city": lead.city,
-                        "state": lead.state,
-                        "zip_code": lead.zip_code,
-                        "lead_id": lead.id
-                    }
-                )
-                if resp.status_code == 200:
-                    data = resp.json()
-                    return AddressVerification(
-                        is_residential=bool(data.get("is_residential", False)),
-                        address_type=str(data.get("address_type", "unknown")),
-                        verified=bool(data.get("verified", False)),
-                        formatted_address=str(data.get("formatted_address", ""))
-                    )
-            except Exception as e:
-                print(f"  Address verification error: {e}")
-        return AddressVerification()
+        key = _lookup_key("address", lead.address, lead.city, lead.state, lead.zip_code)
+        address = await _cached_lookup(key, lambda: IntelligenceServices._fetch_address_verification(lead))
+        return address or AddressVerification()
+
+    @staticmethod
+    async def _fetch_address_verification(lead: Lead) -> Optional[AddressVerification]:
+        try:
+            resp = await _send_with_retry(
+                "POST",
+                f"{ADDRESS_VERIFIER_URL}/verify",
+                headers=_JSON_HEADERS,
+                content=_json_body({
+                    "address": lead.address,
+                    "city": lead.city,
+                    "state": lead.state,
+                    "zip_code": lead.zip_code,
+                    "lead_id": lead.id
+                }),
+                timeout=30.0
+            )
+            if resp.status_code == 200:
+                data = _loads(resp.content)
+                return AddressVerification(**_parse_payload(_ADDRESS_SPEC, data))
+        except Exception as e:
+            logger.warning("Address verification error: %s", e)
+        return None
 
     @classmethod
     async def gather_all(cls, lead: Lead, website_url: str) -> tuple:
@@ -519,29 +1167,38 @@ class IntelligenceServices:
         Run all intelligence gathering with optimized flow.
 
         Flow:
-        1. FIRST: Extract owner info from website (needed for TDLR waterfall)
-        2. PARALLEL: Visual, PageSpeed, Yext, BBB, Address
-        3. TDLR with waterfall using owner data
+        1. PARALLEL: Owner extraction, Visual, PageSpeed, BBB, Address
+           (Yext is disabled and filled with neutral values)
+        2. TDLR with waterfall starts as soon as owner extraction finishes
+           (only TDLR waits on the owner data, nothing else does)
 
         Returns:
             tuple: (visual, pagespeed, yext, tdlr, bbb, address, owner_extraction)
         """
-        owner_data = OwnerExtraction()
-
-        # STEP 1: Extract owner info first (KEY for TDLR waterfall)
-        if website_url:
-            print("  Phase 2D-Prep: Extracting owner info from website...")
+        # Owner extraction runs alongside everything else; TDLR is the only
+        # consumer of its result so it is the only task that waits for it.
+        async def extract_owner() -> OwnerExtraction:
+            if not website_url:
+                return OwnerExtraction()
+            logger.info("Phase 2D-Prep: Extracting owner info from website...")
             try:
-                owner_data = await cls.get_owner_extraction(lead)
-                if owner_data.owner_first_name:
-                    print(f"  Owner found: {owner_data.owner_first_name} {owner_data.owner_last_name}")
-                if owner_data.license_number:
-                    print(f"  License found on website: {owner_data.license_number}")
+                owner = await cls.get_owner_extraction(lead)
             except Exception as e:
-                print(f"  Owner extraction failed: {e}")
-                owner_data = OwnerExtraction(error=str(e))
+                logger.warning("Owner extraction failed: %s", e)
+                return OwnerExtraction(error=str(e))
+            if owner.owner_first_name:
+                logger.info("Owner found: %s %s", owner.owner_first_name, owner.owner_last_name)
+            if owner.license_number:
+                logger.info("License found on website: %s", owner.license_number)
+            return owner
+
+        owner_task = asyncio.create_task(extract_owner())
 
-        # STEP 2: Build parallel task list
+        async def tdlr_after_owner() -> LicenseInfo:
+            # Pass owner data for waterfall
+            return await cls.get_tdlr_license(lead, await owner_task)
+
+        # Build parallel task list
         tasks = []
         if website_url:
             tasks.append(cls.get_visual_analysis(lead))
@@ -553,27 +1210,45 @@ class IntelligenceServices:
             tasks.append(empty_technical())
 
         tasks.extend([
-            cls.get_yext_listings(lead),
-            cls.get_tdlr_license(lead, owner_data),  # Pass owner data for waterfall
+            tdlr_after_owner(),
             cls.get_bbb_reputation(lead),
             cls.get_address_verification(lead)
         ])
 
         results = await asyncio.gather(*tasks, return_exceptions=True)
+        owner_data = await owner_task
 
         # Handle any exceptions
         visual = results[0] if not isinstance(results[0], Exception) else VisualAnalysis()
         pagespeed = results[1] if not isinstance(results[1], Exception) else TechnicalScores()
-        yext = results[2] if not isinstance(results[2], Exception) else DirectoryPresence()
-        tdlr = results[3] if not isinstance(results[3], Exception) else LicenseInfo()
-        bbb = results[4] if not isinstance(results[4], Exception) else ReputationData()
-        address = results[5] if not isinstance(results[5], Exception) else AddressVerification()
+        tdlr = results[2] if not isinstance(results[2], Exception) else LicenseInfo()
+        bbb = results[3] if not isinstance(results[3], Exception) else ReputationData()
+        address = results[4] if not isinstance(results[4], Exception) else AddressVerification()
+        # Yext is disabled; no task is scheduled for it
+        yext = dataclasses.replace(_NEUTRAL_DIRECTORY)
 
-        return visual, pagespeed, yext, tdlr, bbb, address
+        return visual, pagespeed, yext, tdlr, bbb, address, owner_data
 
 
 class InstantlyClient:
-    """Instantly.ai email sending"""
+    """
+    Instantly.ai email sending.
+
+    The lead/add endpoint accepts a list of leads, so add_lead calls are
+    coalesced: each call queues its lead and a background flusher posts the
+    queue in batches of up to BATCH_SIZE, at the latest FLUSH_INTERVAL
+    seconds after the first queued lead. Every caller gets the result of
+    the batch its lead was sent in.
+    """
+
+    ADD_LEAD_URL = "https://api.instantly.ai/api/v1/lead/add"
+    BATCH_SIZE = 100
+    FLUSH_INTERVAL = 0.5  # seconds
+
+    def __init__(self):
+        self._queue: List[tuple] = []  # (lead dict, asyncio.Future)
+        self._wake: Optional[asyncio.Event] = None
+        self._flush_task: Optional[asyncio.Task] = None
 
     async def add_lead(
         self,
@@ -587,101 +1262,243 @@ class InstantlyClient:
         if not INSTANTLY_API_KEY or not INSTANTLY_CAMPAIGN_ID:
             return {"success": False, "error": "Instantly not configured"}
 
-        async with httpx.AsyncClient(timeout=30.0, trust_env=False) as client:
-            try:
-                resp = await client.post(
-                    "https://api.instantly.ai/api/v1/lead/add",
-                    json={
-                        "api_key": INSTANTLY_API_KEY,
-                        "campaign_id": INSTANTLY_CAMPAIGN_ID,
-                        "skip_if_in_workspace": True,
-                        "leads": [{
-                            "email": email,
-                            "first_name": first_name,
-                            "last_name": last_name,
-                            "company_name": company_name,
-                            "custom_variables": custom_variables or {}
-                        }]
-                    }
-                )
-                if resp.status_code == 200:
-                    return {"success": True, "response": resp.json()}
-                return {"success": False, "error": resp.text}
-            except Exception as e:
-                print(f"  Instantly error: {e}")
-                return {"success": False, "error": str(e)}
+        future = asyncio.get_running_loop().create_future()
+        self._queue.append(({
+            "email": email,
+            "first_name": first_name,
+            "last_name": last_name,
+            "company_name": company_name,
+            "custom_variables": custom_variables or {}
+        }, future))
+
+        if self._flush_task is None or self._flush_task.done():
+            self._wake = asyncio.Event()
+            self._flush_task = asyncio.create_task(self._flusher())
+        elif len(self._queue) >= self.BATCH_SIZE:
+            self._wake.set()
+
+        return await future
+
+    async def add_leads_batch(self, leads: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Add many leads at once, BATCH_SIZE leads per request.
+
+        Each lead dict takes the add_lead arguments as keys. Use this when
+        the leads are already in hand; add_lead coalesces calls that arrive
+        one by one. Returns overall success plus each request's result.
+        """
+        if not INSTANTLY_API_KEY or not INSTANTLY_CAMPAIGN_ID:
+            return {"success": False, "error": "Instantly not configured"}
+
+        payloads = [{
+            "email": lead.get("email", ""),
+            "first_name": lead.get("first_name", ""),
+            "last_name": lead.get("last_name", ""),
+            "company_name": lead.get("company_name", ""),
+            "custom_variables": lead.get("custom_variables") or {}
+        } for lead in leads]
+        batches = await gather_structured(*(
+            self._post_leads(payloads[i:i + self.BATCH_SIZE])
+            for i in range(0, len(payloads), self.BATCH_SIZE)
+        ))
+        return {"success": all(b["success"] for b in batches), "batches": batches}
+
+    async def _flusher(self):
+        """Drain the queue in batches; exits once the queue is empty."""
+        while self._queue:
+            if len(self._queue) < self.BATCH_SIZE:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=self.FLUSH_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+            self._wake.clear()
+
+            batch = self._queue[:self.BATCH_SIZE]
+            del self._queue[:self.BATCH_SIZE]
+            result = await self._post_leads([lead for lead, _ in batch])
+            for _, future in batch:
+                if not future.done():
+                    future.set_result(result)
+
+    async def _post_leads(self, leads: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """POST a list of leads to the Instantly campaign in one request."""
+        try:
+            resp = await _send_with_retry(
+                "POST",
+                self.ADD_LEAD_URL,
+                idempotent=False,
+                headers=_JSON_HEADERS,
+                content=_json_body({
+                    "api_key": INSTANTLY_API_KEY,
+                    "campaign_id": INSTANTLY_CAMPAIGN_ID,
+                    "skip_if_in_workspace": True,
+                    "leads": leads
+                }),
+                timeout=30.0
+            )
+            if resp.status_code == 200:
+                return {"success": True, "response": _loads(resp.content)}
+            return {"success": False, "error": resp.text}
+        except Exception as e:
+            logger.warning("Instantly error: %s", e)
+            return {"success": False, "error": str(e)}
+
+
+# Chart.js configs are static apart from a few fields, so each chart type is
+# serialized once at import. Placeholder strings ("@@NAME@@", quotes
+# included) are swapped for the JSON-encoded value per call, in one pass so
+# user text that happens to contain a placeholder is left alone.
+_CHART_PLACEHOLDER = re.compile(r'"@@([A-Z]+)@@"')
+
+
+def _fill_chart(template: str, **fields: Any) -> str:
+    encoded = {name.upper(): _dumps(value) for name, value in fields.items()}
+    return _CHART_PLACEHOLDER.sub(lambda m: encoded[m.group(1)], template)
+
+
+_PAIN_SCORE_TEMPLATE = _dumps({
+    "type": "gauge",
+    "data": {
+        "datasets": [{
+            "value": "@@VALUE@@",
+            "minValue": 0,
+            "maxValue": 100,
+            "data": [30, 50, 70, 100],
+            "backgroundColor": ["#4ade80", "#facc15", "#fb923c", "#ef4444"]
+        }]
+    },
+    "options": {
+        "title": {
+            "display": True,
+            "text": "@@TITLE@@"
+        }
+    }
+})
+
+_SCORE_BAR_TEMPLATE = _dumps({
+    "type": "bar",
+    "data": {
+        "labels": "@@LABELS@@",
+        "datasets": [{
+            "label": "Score",
+            "data": "@@DATA@@",
+            "backgroundColor": [
+                "#3b82f6", "#8b5cf6", "#ec4899", "#f97316", "#22c55e"
+            ]
+        }]
+    },
+    "options": {
+        "title": {"display": True, "text": "@@TITLE@@"},
+        "scales": {"yAxes": [{"ticks": {"beginAtZero": True, "max": 100}}]}
+    }
+})
+
+_FUNNEL_TEMPLATE = _dumps({
+    "type": "horizontalBar",
+    "data": {
+        "labels": "@@LABELS@@",
+        "datasets": [{
+            "data": "@@DATA@@",
+            "backgroundColor": [
+                "#3b82f6", "#6366f1", "#8b5cf6", "#a855f7", "#d946ef"
+            ]
+        }]
+    },
+    "options": {
+        "title": {"display": True, "text": "@@TITLE@@"},
+        "legend": {"display": False},
+        "scales": {"xAxes": [{"ticks": {"beginAtZero": True}}]}
+    }
+})
+
+_RADAR_TEMPLATE = _dumps({
+    "type": "radar",
+    "data": {
+        "labels": "@@LABELS@@",
+        "datasets": [{
+            "label": "Score",
+            "data": "@@DATA@@",
+            "backgroundColor": "rgba(59, 130, 246, 0.2)",
+            "borderColor": "#3b82f6",
+            "pointBackgroundColor": "#3b82f6"
+        }]
+    },
+    "options": {
+        "title": {"display": True, "text": "@@TITLE@@"},
+        "scale": {"ticks": {"beginAtZero": True, "max": 100}}
+    }
+})
 
 
 class QuickChartClient:
     """QuickChart.io for generating chart images"""
 
     BASE_URL = "https://quickchart.io/chart"
+    URL_PREFIX = BASE_URL + "?"
 
     async def generate_chart(
         self,
-        chart_config: Dict[str, Any],
+        chart_config: Union[Dict[str, Any], str],
         width: int = 500,
         height: int = 300,
         format: str = "png",
-        background_color: str = "white"
+        background_color: str = "white",
+        include_check: bool = False
     ) -> Optional[str]:
         """
         Generate a chart image URL from Chart.js config.
 
+        chart_config may be a dict or an already-serialized JSON string.
+
+        QuickChart GET URLs are shareable by design, so by default the URL is
+        built locally without a round trip. Pass include_check=True to have
+        QuickChart render the chart first and return None if it rejects it.
+
         Returns the image URL or None on failure.
         """
-        async with httpx.AsyncClient(timeout=30.0, trust_env=False) as client:
-            try:
-                resp = await client.post(
-                    self.BASE_URL,
-                    json={
-                        "chart": chart_config,
-                        "width": width,
-                        "height": height,
-                        "format": format,
-                        "backgroundColor": background_color
-                    }
-                )
-                if resp.status_code == 200:
-                    # POST returns the image directly, use GET URL for shareable link
-                    return self._build_url(chart_config, width, height, background_color)
-            except Exception as e:
-                print(f"  QuickChart error: {e}")
+        if not include_check:
+            return self._build_url(chart_config, width, height, background_color)
+
+        client = get_http_client()
+        try:
+            resp = await client.post(
+                self.BASE_URL,
+                headers=_JSON_HEADERS,
+                content=_json_body({
+                    "chart": chart_config,
+                    "width": width,
+                    "height": height,
+                    "format": format,
+                    "backgroundColor": background_color
+                }),
+                timeout=30.0
+            )
+            if resp.status_code == 200:
+                # POST returns the image directly, use GET URL for shareable link
+                return self._build_url(chart_config, width, height, background_color)
+        except Exception as e:
+            logger.warning("QuickChart error: %s", e)
         return None
 
     def _build_url(
         self,
-        chart_config: Dict[str, Any],
+        chart_config: Union[Dict[str, Any], str],
         width: int,
         height: int,
         background_color: str
     ) -> str:
         """Build a shareable chart URL."""
-        import urllib.parse
-        config_str = json.dumps(chart_config)
-        encoded = urllib.parse.quote(config_str)
-        return f"{self.BASE_URL}?c={encoded}&w={width}&h={height}&bkg={background_color}"
+        if not isinstance(chart_config, str):
+            chart_config = _dumps(chart_config)
+        query = urlencode(
+            {"c": chart_config, "w": width, "h": height, "bkg": background_color},
+            quote_via=quote
+        )
+        return self.URL_PREFIX + query
 
     async def pain_score_gauge(self, score: int, business_name: str) -> Optional[str]:
         """Generate a pain score gauge chart."""
-        config = {
-            "type": "gauge",
-            "data": {
-                "datasets": [{
-                    "value": score,
-                    "minValue": 0,
-                    "maxValue": 100,
-                    "data": [30, 50, 70, 100],
-                    "backgroundColor": ["#4ade80", "#facc15", "#fb923c", "#ef4444"]
-                }]
-            },
-            "options": {
-                "title": {
-                    "display": True,
-                    "text": f"Pain Score: {business_name}"
-                }
-            }
-        }
+        config = _fill_chart(_PAIN_SCORE_TEMPLATE, value=score, title=f"Pain Score: {business_name}")
         return await self.generate_chart(config, width=400, height=300)
 
     async def score_comparison_bar(
@@ -691,23 +1508,7 @@ class QuickChartClient:
         title: str = "Score Comparison"
     ) -> Optional[str]:
         """Generate a bar chart comparing scores."""
-        config = {
-            "type": "bar",
-            "data": {
-                "labels": labels,
-                "datasets": [{
-                    "label": "Score",
-                    "data": scores,
-                    "backgroundColor": [
-                        "#3b82f6", "#8b5cf6", "#ec4899", "#f97316", "#22c55e"
-                    ]
-                }]
-            },
-            "options": {
-                "title": {"display": True, "text": title},
-                "scales": {"yAxes": [{"ticks": {"beginAtZero": True, "max": 100}}]}
-            }
-        }
+        config = _fill_chart(_SCORE_BAR_TEMPLATE, labels=labels, data=scores, title=title)
         return await self.generate_chart(config, width=600, height=400)
 
     async def pipeline_funnel(
@@ -717,23 +1518,7 @@ class QuickChartClient:
         title: str = "Pipeline Funnel"
     ) -> Optional[str]:
         """Generate a funnel chart for pipeline stages."""
-        config = {
-            "type": "horizontalBar",
-            "data": {
-                "labels": stages,
-                "datasets": [{
-                    "data": counts,
-                    "backgroundColor": [
-                        "#3b82f6", "#6366f1", "#8b5cf6", "#a855f7", "#d946ef"
-                    ]
-                }]
-            },
-            "options": {
-                "title": {"display": True, "text": title},
-                "legend": {"display": False},
-                "scales": {"xAxes": [{"ticks": {"beginAtZero": True}}]}
-            }
-        }
+        config = _fill_chart(_FUNNEL_TEMPLATE, labels=stages, data=counts, title=title)
         return await self.generate_chart(config, width=500, height=300)
 
     async def tech_stack_radar(
@@ -743,36 +1528,250 @@ class QuickChartClient:
         title: str = "Tech Stack Analysis"
     ) -> Optional[str]:
         """Generate a radar chart for tech stack analysis."""
-        config = {
-            "type": "radar",
-            "data": {
-                "labels": categories,
-                "datasets": [{
-                    "label": "Score",
-                    "data": scores,
-                    "backgroundColor": "rgba(59, 130, 246, 0.2)",
-                    "borderColor": "#3b82f6",
-                    "pointBackgroundColor": "#3b82f6"
-                }]
-            },
-            "options": {
-                "title": {"display": True, "text": title},
-                "scale": {"ticks": {"beginAtZero": True, "max": 100}}
-            }
-        }
+        config = _fill_chart(_RADAR_TEMPLATE, labels=categories, data=scores, title=title)
         return await self.generate_chart(config, width=500, height=500)
 
 
+@lru_cache(maxsize=8192)
+def _normalize_domain(domain: str) -> str:
+    """Reduce a website URL to a bare host ("https://www.x.com/a" -> "x.com")."""
+    domain = domain.strip().lower()
+    host = urlsplit(domain if "://" in domain else "http://" + domain).netloc
+    return host.removeprefix("www.")
+
+
+# Shared by every FullEnrich payload; a tuple serializes as a JSON array
+_ENRICH_FIELDS = ("contact.emails", "contact.phones")
+
+
+def _lower_name(name: Optional[str]) -> str:
+    """Strip and lowercase a contact name, skipping the copy when already lowercase."""
+    name = (name or "").strip()
+    return name if name.islower() else name.lower()
+
+
+# FullEnrich pushes job completion to FULLENRICH_WEBHOOK_URL. Jobs being
+# polled in this process wait on a future keyed by enrichment_id (created on
+# register, removed when the wait ends); an in-process webhook receiver can
+# call resolve_fullenrich_webhook() with the posted body to wake them early. The URL usually points at a separate service that can't reach
+# these futures, so status polling always runs on its normal schedule.
+_fullenrich_waiters: Dict[str, asyncio.Future] = {}
+
+
+def _fullenrich_waiter(enrichment_id: str) -> asyncio.Future:
+    waiter = _fullenrich_waiters.get(enrichment_id)
+    if waiter is None:
+        waiter = _fullenrich_waiters[enrichment_id] = asyncio.get_running_loop().create_future()
+    return waiter
+
+
+def _fullenrich_outcome(data: Dict[str, Any]) -> Tuple[bool, Optional[List[Dict[str, Any]]]]:
+    """(finished, results) for a bulk job body; results is None if it failed."""
+    status = data.get("status", "")
+    if status == "completed":
+        return True, data.get("results", [])
+    if status == "failed":
+        return True, None
+    return False, None
+
+
+def resolve_fullenrich_webhook(payload: Dict[str, Any]) -> bool:
+    """
+    Hand a FullEnrich webhook body to the job waiting on it.
+
+    Integration hook: nothing in this repo calls it. A deployment that
+    receives FullEnrich webhooks in the same process as the pipeline (e.g.
+    an API route) must call it with each posted body; otherwise jobs simply
+    finish through polling. The payload has the same shape as the bulk
+    status endpoint. Returns False if no job in this process is waiting on
+    that enrichment (or it hasn't finished yet).
+    """
+    enrichment_id = payload.get("enrichment_id") or payload.get("id")
+    waiter = _fullenrich_waiters.get(enrichment_id) if enrichment_id else None
+    if waiter is None or waiter.done():
+        return False
+    finished, results = _fullenrich_outcome(payload)
+    if not finished:
+        return False
+    waiter.set_result(results)
+    return True
+
+
+class _FullEnrichPoller:
+    """
+    One status-poll loop shared by every pending FullEnrich job.
+
+    FullEnrich has no batched status endpoint, so checks are still one GET
+    per job, sent through _send_with_retry (shared client, host semaphore,
+    retries). This loop only decides when: it starts each due check as its
+    own task and goes back to sleeping until the next one, so a slow or
+    throttled check never holds up other jobs. Each job keeps its own
+    schedule (FullEnrichClient._poll_delay), and a Retry-After from the API
+    pushes its next check back. Finished jobs resolve their future in
+    _fullenrich_waiters, the same one resolve_fullenrich_webhook() sets.
+    """
+
+    def __init__(self):
+        self.loop = asyncio.get_running_loop()
+        self._jobs: Dict[str, list] = {}  # enrichment_id -> [next check (loop time), attempt, FullEnrichClient]
+        self._wake = asyncio.Event()
+        self._task: Optional[asyncio.Task] = None
+        self._in_flight: Dict[str, asyncio.Task] = {}  # enrichment_id -> running check
+
+    def register(self, enrichment_id: str, client: "FullEnrichClient") -> asyncio.Future:
+        """Start checking on a job; returns the future its results land in."""
+        waiter = _fullenrich_waiter(enrichment_id)
+        if enrichment_id not in self._jobs:
+            self._jobs[enrichment_id] = [0.0, 0, client]
+            self._reschedule(enrichment_id)
+            self._wake.set()
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+        return waiter
+
+    def unregister(self, enrichment_id: str):
+        self._jobs.pop(enrichment_id, None)
+        _fullenrich_waiters.pop(enrichment_id, None)
+
+    def _reschedule(self, enrichment_id: str, delay: Optional[float] = None):
+        job = self._jobs[enrichment_id]
+        if delay is None:
+            # Jitter keeps jobs started together from polling in lockstep
+            delay = job[2]._poll_delay(job[1]) + random.uniform(0, 0.25)
+            job[1] += 1
+        job[0] = self.loop.time() + delay
+
+    async def _run(self):
+        """Sleep until the earliest check is due, start every due check, repeat."""
+        while self._jobs:
+            self._wake.clear()
+            now = self.loop.time()
+            waiting = [
+                (job[0], enrichment_id) for enrichment_id, job in self._jobs.items()
+                if enrichment_id not in self._in_flight
+            ]
+            for due_at, enrichment_id in waiting:
+                if due_at <= now:
+                    self._in_flight[enrichment_id] = asyncio.create_task(self._check(enrichment_id))
+            upcoming = [due_at for due_at, _ in waiting if due_at > now]
+            # Finished checks and new jobs set _wake, so with every job in
+            # flight there's nothing to time out on
+            timeout = min(upcoming) - now if upcoming else None
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    async def _check(self, enrichment_id: str):
+        try:
+            await self._check_status(enrichment_id)
+        finally:
+            self._in_flight.pop(enrichment_id, None)
+            self._wake.set()
+
+    async def _check_status(self, enrichment_id: str):
+        job = self._jobs.get(enrichment_id)
+        if job is None:
+            return
+        client = job[2]
+        retry_after: Optional[float] = None
+        try:
+            resp = await _send_with_retry(
+                "GET",
+                f"{client.BASE_URL}/contact/enrich/bulk/{enrichment_id}",
+                headers=client.headers
+            )
+            retry_after = _retry_after(resp)
+
+            if resp.status_code == 200:
+                finished, results = _fullenrich_outcome(_loads(resp.content))
+                if finished:
+                    if results is None:
+                        logger.warning("FullEnrich enrichment failed: %s", enrichment_id)
+                    waiter = _fullenrich_waiters.get(enrichment_id)
+                    if waiter is not None and not waiter.done():
+                        waiter.set_result(results)
+                    self._jobs.pop(enrichment_id, None)
+                    return
+                logger.debug("FullEnrich polling %s...", enrichment_id)
+
+        except Exception as e:
+            logger.warning("FullEnrich poll error: %s", e)
+
+        if enrichment_id in self._jobs:
+            self._reschedule(enrichment_id, retry_after)
+
+
+_fullenrich_poller: Optional[_FullEnrichPoller] = None
+
+
+def _get_fullenrich_poller() -> _FullEnrichPoller:
+    # Rebuilt when the event loop changes (each asyncio.run in the CLIs/tests)
+    global _fullenrich_poller
+    if _fullenrich_poller is None or _fullenrich_poller.loop is not asyncio.get_running_loop():
+        _fullenrich_poller = _FullEnrichPoller()
+    return _fullenrich_poller
+
+
 class FullEnrichClient:
-    """FullEnrich waterfall contact enrichment API"""
+    """
+    FullEnrich waterfall contact enrichment API.
+
+    Enrichment only exists as a bulk job, so enrich_contact calls are
+    coalesced like InstantlyClient.add_lead: each call queues its contact and
+    a background flusher starts one job per MAX_BATCH_SIZE contacts, at the
+    latest FLUSH_INTERVAL seconds after the first queued contact. Results are
+    matched back to callers through a reference in each contact's ``custom``.
+    """
 
-    BASE_URL = "https://app.fullenrich.com/api/v1"
+    HOST = "app.fullenrich.com"
+    BASE_URL = f"https://{HOST}/api/v1"
+    MAX_BATCH_SIZE = 100
+    FLUSH_INTERVAL = 2.0  # seconds; small next to a job's own run time
+    POLL_MAX_INTERVAL = 30  # seconds between status checks, at most
+    # First waits between status checks; front-loaded so jobs that finish in
+    # well under a second aren't held for a full backoff step. After the
+    # schedule runs out, waits keep doubling up to POLL_MAX_INTERVAL.
+    POLL_SCHEDULE = (0.5, 1.0, 1.0, 2.0, 3.0, 5.0)
 
     def __init__(self):
         self.headers = {
             "Authorization": f"Bearer {FULLENRICH_API_KEY}",
             "Content-Type": "application/json"
         }
+        self._queue: List[tuple] = []  # (contact payload, asyncio.Future)
+        self._wake: Optional[asyncio.Event] = None
+        self._flush_task: Optional[asyncio.Task] = None
+        self._jobs: set = set()  # running coalesced jobs, kept referenced
+
+    @classmethod
+    def _poll_delay(cls, attempt: int) -> float:
+        """Wait before status check number ``attempt`` (0-based), without jitter."""
+        if attempt < len(cls.POLL_SCHEDULE):
+            return cls.POLL_SCHEDULE[attempt]
+        return min(cls.POLL_MAX_INTERVAL, cls.POLL_SCHEDULE[-1] * 2 ** (attempt - len(cls.POLL_SCHEDULE) + 1))
+
+    @staticmethod
+    def _contact_payload(
+        first_name: Optional[str],
+        last_name: Optional[str],
+        domain: Optional[str] = "",
+        company_name: Optional[str] = "",
+        linkedin_url: Optional[str] = ""
+    ) -> Dict[str, Any]:
+        """Build one FullEnrich contact entry (domain wins over company_name)."""
+        contact_data = {
+            "firstname": _lower_name(first_name),
+            "lastname": _lower_name(last_name),
+            "enrich_fields": _ENRICH_FIELDS
+        }
+        if domain:
+            contact_data["domain"] = _normalize_domain(domain)
+        elif company_name:
+            contact_data["company_name"] = company_name
+        if linkedin_url:
+            contact_data["linkedin_url"] = linkedin_url
+        return contact_data
 
     async def enrich_contact(
         self,
@@ -798,136 +1797,160 @@ class FullEnrichClient:
             ContactInfo with enriched data
         """
         if not FULLENRICH_API_KEY:
-            print("  FullEnrich API key not configured")
+            logger.warning("FullEnrich API key not configured")
             return ContactInfo()
 
-        # Build contact data
-        contact_data = {
-            "firstname": first_name.lower(),
-            "lastname": last_name.lower(),
-            "enrich_fields": ["contact.emails", "contact.phones"]
-        }
-
-        if domain:
-            contact_data["domain"] = domain.lower().replace("https://", "").replace("http://", "").replace("www.", "").split("/")[0]
-        elif company_name:
-            contact_data["company_name"] = company_name
-
-        if linkedin_url:
-            contact_data["linkedin_url"] = linkedin_url
-
+        contact_data = self._contact_payload(first_name, last_name, domain, company_name, linkedin_url)
         if custom_data:
             contact_data["custom"] = custom_data
 
-        async with httpx.AsyncClient(timeout=180.0, trust_env=False) as client:
-            try:
-                # Start enrichment
-                resp = await client.post(
-                    f"{self.BASE_URL}/contact/enrich/bulk",
-                    headers=self.headers,
-                    json={
-                        "name": f"pipeline_{first_name}_{last_name}",
-                        "datas": [contact_data],
-                        "webhook_url": FULLENRICH_WEBHOOK_URL if FULLENRICH_WEBHOOK_URL else None
-                    }
-                )
-
-                if resp.status_code != 200:
-                    print(f"  FullEnrich start error: {resp.status_code} - {resp.text[:200]}")
-                    return ContactInfo()
-
-                enrichment_id = resp.json().get("enrichment_id")
-                if not enrichment_id:
-                    print("  FullEnrich: No enrichment_id returned")
-                    return ContactInfo()
-
-                print(f"  FullEnrich enrichment started: {enrichment_id}")
+        future = asyncio.get_running_loop().create_future()
+        self._queue.append((contact_data, future))
+
+        if self._flush_task is None or self._flush_task.done():
+            self._wake = asyncio.Event()
+            self._flush_task = asyncio.create_task(self._flusher())
+        elif len(self._queue) >= self.MAX_BATCH_SIZE:
+            self._wake.set()
+
+        return await future
+
+    async def _flusher(self):
+        """Drain the queue into bulk jobs; exits once the queue is empty."""
+        while self._queue:
+            if len(self._queue) < self.MAX_BATCH_SIZE:
+                try:
+                    await asyncio.wait_for(self._wake.wait(), timeout=self.FLUSH_INTERVAL)
+                except asyncio.TimeoutError:
+                    pass
+            self._wake.clear()
+
+            batch = self._queue[:self.MAX_BATCH_SIZE]
+            del self._queue[:self.MAX_BATCH_SIZE]
+            # A job can take a minute to finish; don't hold up the next batch
+            job = asyncio.create_task(self._enrich_queued(batch))
+            self._jobs.add(job)
+            job.add_done_callback(self._jobs.discard)
+
+    async def _enrich_queued(self, batch: List[tuple]):
+        """Run one bulk job for queued contacts and resolve their futures."""
+        datas = [
+            {**contact, "custom": {**contact.get("custom", {}), "pipeline_ref": str(i)}}
+            for i, (contact, _) in enumerate(batch)
+        ]
+        results: Optional[List[Dict[str, Any]]] = None
+        try:
+            enrichment_id = await self._start_job(f"pipeline_contacts_{len(datas)}", datas, timeout=180.0)
+            if enrichment_id:
+                results = await self._poll_single(enrichment_id, max_wait=60)
+        except Exception as e:
+            logger.warning("FullEnrich error: %s", e)
+
+        by_ref = {}
+        for pos, result in enumerate(results or []):
+            by_ref[(result.get("custom") or {}).get("pipeline_ref", str(pos))] = result
+        for i, (_, future) in enumerate(batch):
+            if not future.done():
+                result = by_ref.get(str(i))
+                future.set_result(self._parse_result(result) if result else ContactInfo())
+
+    async def _start_job(
+        self,
+        name: str,
+        datas: List[Dict[str, Any]],
+        timeout: float = 300.0
+    ) -> Optional[str]:
+        """Start a bulk enrichment job; returns its enrichment_id or None."""
+        # Each start spends credits, so only retry when the job can't have
+        # been created; status polls are idempotent and retry normally.
+        resp = await _send_with_retry(
+            "POST",
+            f"{self.BASE_URL}/contact/enrich/bulk",
+            idempotent=False,
+            headers=self.headers,
+            content=_json_body({
+                "name": name,
+                "datas": datas,
+                "webhook_url": FULLENRICH_WEBHOOK_URL if FULLENRICH_WEBHOOK_URL else None
+            }),
+            timeout=timeout
+        )
 
-                # Poll for results (max 60 seconds)
-                result = await self._poll_for_results(client, enrichment_id, max_wait=60)
-                return result
+        if resp.status_code != 200:
+            logger.warning("FullEnrich start error: %s - %s", resp.status_code, resp.text[:200])
+            return None
 
-            except Exception as e:
-                print(f"  FullEnrich error: {e}")
-                return ContactInfo()
+        enrichment_id = _loads(resp.content).get("enrichment_id")
+        if not enrichment_id:
+            logger.warning("FullEnrich: No enrichment_id returned")
+            return None
+        logger.info("FullEnrich job started: %s (%s contacts)", enrichment_id, len(datas))
+        return enrichment_id
 
-    async def _poll_for_results(
+    async def _poll_single(
         self,
-        client: httpx.AsyncClient,
         enrichment_id: str,
-        max_wait: int = 60
-    ) -> ContactInfo:
-        """Poll FullEnrich API for enrichment results."""
-        poll_interval = 3  # seconds
-        elapsed = 0
-
-        while elapsed < max_wait:
-            await asyncio.sleep(poll_interval)
-            elapsed += poll_interval
-
-            try:
-                resp = await client.get(
-                    f"{self.BASE_URL}/contact/enrich/bulk/{enrichment_id}",
-                    headers=self.headers
-                )
-
-                if resp.status_code != 200:
-                    continue
-
-                data = resp.json()
-                status = data.get("status", "")
-
-                if status == "completed":
-                    # Parse results
-                    results = data.get("results", [])
-                    if results:
-                        return self._parse_result(results[0])
-                    return ContactInfo()
-
-                elif status == "failed":
-                    print(f"  FullEnrich enrichment failed")
-                    return ContactInfo()
-
-                # Still processing, continue polling
-                print(f"  FullEnrich polling... ({elapsed}s)")
-
-            except Exception as e:
-                print(f"  FullEnrich poll error: {e}")
+        max_wait: int
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Wait for one enrichment to complete or fail, up to max_wait seconds.
+
+        Status checks run on the shared _FullEnrichPoller: waits follow
+        POLL_SCHEDULE and then double up to POLL_MAX_INTERVAL, and a
+        Retry-After header from the API overrides the next wait. A
+        webhook delivered through resolve_fullenrich_webhook() ends the wait
+        early; polling doesn't rely on it. Returns the raw results list on
+        completion, otherwise None.
+        """
+        poller = _get_fullenrich_poller()
+        try:
+            return await asyncio.wait_for(poller.register(enrichment_id, self), timeout=max_wait)
+        except asyncio.TimeoutError:
+            logger.warning("FullEnrich timeout after %ss", max_wait)
+            return None
+        finally:
+            poller.unregister(enrichment_id)
 
-        print(f"  FullEnrich timeout after {max_wait}s")
-        return ContactInfo()
+    @staticmethod
+    def _pick(items: List[Dict[str, Any]], value_key: str, *preferred: str) -> Tuple[str, str]:
+        """
+        Single pass over items: return the value of the most preferred type
+        present (earlier in ``preferred`` wins), else the first non-empty
+        value, along with the type that matched ("" if none did).
+        """
+        best = [""] * len(preferred)
+        first = ""
+        for item in items:
+            value = item.get(value_key)
+            if not value:
+                continue
+            if not first:
+                first = value
+            kind = item.get("type")
+            if kind in preferred:
+                rank = preferred.index(kind)
+                if rank == 0:
+                    return value, kind
+                if not best[rank]:
+                    best[rank] = value
+        for kind, value in zip(preferred, best):
+            if value:
+                return value, kind
+        return first, ""
 
     def _parse_result(self, result: Dict[str, Any]) -> ContactInfo:
         """Parse FullEnrich result into ContactInfo."""
-        emails = result.get("emails", [])
-        phones = result.get("phones", [])
-
-        # Get best email (work email preferred)
-        work_email = ""
-        personal_email = ""
-        for email_obj in emails:
-            email = email_obj.get("email", "")
-            email_type = email_obj.get("type", "")
-            if email_type == "work" and not work_email:
-                work_email = email
-            elif email_type == "personal" and not personal_email:
-                personal_email = email
-
-        # Get best phone (mobile preferred)
-        mobile_phone = ""
-        for phone_obj in phones:
-            phone = phone_obj.get("phone", "")
-            phone_type = phone_obj.get("type", "")
-            if phone_type == "mobile" and not mobile_phone:
-                mobile_phone = phone
+        # Best email (work, then personal, then any); best phone (mobile first)
+        email, email_type = self._pick(result.get("emails", []), "email", "work", "personal")
+        phone, _ = self._pick(result.get("phones", []), "phone", "mobile")
 
         return ContactInfo(
-            owner_email=work_email or personal_email or (emails[0].get("email", "") if emails else ""),
+            owner_email=email,
             owner_first_name=result.get("firstname", ""),
             owner_last_name=result.get("lastname", ""),
             owner_linkedin=result.get("linkedin_url", ""),
-            owner_phone_direct=mobile_phone or (phones[0].get("phone", "") if phones else ""),
-            email_verified=True if work_email else False,
+            owner_phone_direct=phone,
+            email_verified=email_type == "work",
             contact_source="fullenrich"
         )
 
@@ -937,7 +1960,11 @@ class FullEnrichClient:
         batch_name: str = "pipeline_batch"
     ) -> list:
         """
-        Enrich multiple contacts in a single batch (max 100).
+        Enrich multiple contacts in bulk.
+
+        FullEnrich accepts up to MAX_BATCH_SIZE contacts per bulk job; larger
+        lists are split into several jobs that are started and polled
+        concurrently, so total wait is the slowest job rather than the sum.
 
         Args:
             contacts: List of dicts with firstname, lastname, domain/company_name
@@ -950,102 +1977,92 @@ class FullEnrichClient:
             return []
 
         # Prepare batch data
-        datas = []
-        for c in contacts[:100]:  # Max 100 per batch
-            contact_data = {
-                "firstname": c.get("firstname", "").lower(),
-                "lastname": c.get("lastname", "").lower(),
-                "enrich_fields": ["contact.emails", "contact.phones"]
-            }
-            if c.get("domain"):
-                contact_data["domain"] = c["domain"]
-            elif c.get("company_name"):
-                contact_data["company_name"] = c["company_name"]
-            if c.get("linkedin_url"):
-                contact_data["linkedin_url"] = c["linkedin_url"]
-            datas.append(contact_data)
-
-        async with httpx.AsyncClient(timeout=300.0, trust_env=False) as client:
-            try:
-                resp = await client.post(
-                    f"{self.BASE_URL}/contact/enrich/bulk",
-                    headers=self.headers,
-                    json={
-                        "name": batch_name,
-                        "datas": datas,
-                        "webhook_url": FULLENRICH_WEBHOOK_URL if FULLENRICH_WEBHOOK_URL else None
-                    }
-                )
-
-                if resp.status_code != 200:
-                    print(f"  FullEnrich batch error: {resp.text[:200]}")
-                    return []
-
-                enrichment_id = resp.json().get("enrichment_id")
-                print(f"  FullEnrich batch started: {enrichment_id} ({len(datas)} contacts)")
-
-                # Poll for results (longer timeout for batch)
-                return await self._poll_batch_results(client, enrichment_id, max_wait=180)
+        datas = [
+            self._contact_payload(
+                c.get("firstname"), c.get("lastname"),
+                c.get("domain"), c.get("company_name"), c.get("linkedin_url")
+            )
+            for c in contacts
+        ]
 
-            except Exception as e:
-                print(f"  FullEnrich batch error: {e}")
-                return []
+        chunks = [datas[i:i + self.MAX_BATCH_SIZE] for i in range(0, len(datas), self.MAX_BATCH_SIZE)]
+        if len(chunks) == 1:
+            names = [batch_name]
+        else:
+            names = [f"{batch_name}_{n}" for n in range(1, len(chunks) + 1)]
+
+        try:
+            # A chunk that fails to start mustn't strand the ones that did:
+            # their credits are spent, so poll them regardless
+            job_ids = await asyncio.gather(
+                *(self._start_job(n, c) for n, c in zip(names, chunks)),
+                return_exceptions=True
+            )
+            started = []
+            for name, job_id in zip(names, job_ids):
+                if isinstance(job_id, Exception):
+                    logger.warning("FullEnrich start error for %s: %s", name, job_id)
+                elif job_id:
+                    started.append(job_id)
+
+            # Poll for results (longer timeout for batch)
+            polled = await self._poll_many(started, max_wait=180)
+            return [contact for job_id in started for contact in polled[job_id]]
+
+        except Exception as e:
+            logger.warning("FullEnrich batch error: %s", e)
+            return []
 
     async def _poll_batch_results(
         self,
-        client: httpx.AsyncClient,
         enrichment_id: str,
         max_wait: int = 180
     ) -> list:
         """Poll for batch enrichment results."""
-        poll_interval = 5
-        elapsed = 0
-
-        while elapsed < max_wait:
-            await asyncio.sleep(poll_interval)
-            elapsed += poll_interval
-
-            try:
-                resp = await client.get(
-                    f"{self.BASE_URL}/contact/enrich/bulk/{enrichment_id}",
-                    headers=self.headers
-                )
+        results = await self._poll_single(enrichment_id, max_wait)
+        return [self._parse_result(r) for r in results or []]
 
-                if resp.status_code != 200:
-                    continue
-
-                data = resp.json()
-                status = data.get("status", "")
-
-                if status == "completed":
-                    results = data.get("results", [])
-                    return [self._parse_result(r) for r in results]
-                elif status == "failed":
-                    return []
-
-            except Exception:
-                pass
-
-        return []
+    async def _poll_many(
+        self,
+        enrichment_ids: List[str],
+        max_wait: int = 180
+    ) -> Dict[str, list]:
+        """Poll several bulk jobs concurrently; returns {enrichment_id: [ContactInfo]}."""
+        batches = await asyncio.gather(*(
+            self._poll_batch_results(enrichment_id, max_wait)
+            for enrichment_id in enrichment_ids
+        ))
+        return dict(zip(enrichment_ids, batches))
 
     async def check_credits(self) -> Dict[str, Any]:
         """Check remaining FullEnrich credits."""
         if not FULLENRICH_API_KEY:
             return {"error": "API key not configured"}
 
-        async with httpx.AsyncClient(timeout=30.0, trust_env=False) as client:
-            try:
-                resp = await client.get(
-                    f"{self.BASE_URL}/account/credits",
-                    headers=self.headers
-                )
-                if resp.status_code == 200:
-                    return resp.json()
-            except Exception as e:
-                return {"error": str(e)}
+        try:
+            resp = await _send_with_retry(
+                "GET",
+                f"{self.BASE_URL}/account/credits",
+                headers=self.headers,
+                timeout=30.0
+            )
+            if resp.status_code == 200:
+                return _loads(resp.content)
+        except Exception as e:
+            return {"error": str(e)}
         return {"error": "Failed to check credits"}
 
 
+# Batch lead dict key -> HeyReach API field, for the optional lead fields
+_HEYREACH_FIELD_MAP = (
+    ("first_name", "firstName"),
+    ("last_name", "lastName"),
+    ("company_name", "companyName"),
+    ("email", "email"),
+    ("custom_variables", "customVariables"),
+)
+
+
 class HeyReachClient:
     """HeyReach LinkedIn automation API"""
 
@@ -1056,6 +2073,9 @@ class HeyReachClient:
             "X-API-KEY": HEYREACH_API_KEY,
             "Content-Type": "application/json"
         }
+        # Campaign is fixed per deployment, so build its URLs once
+        self.campaign_url = f"{self.BASE_URL}/campaigns/{HEYREACH_CAMPAIGN_ID}"
+        self.leads_url = f"{self.campaign_url}/leads"
 
     async def add_lead_to_campaign(
         self,
@@ -1101,21 +2121,23 @@ class HeyReachClient:
         if custom_variables:
             lead_data["customVariables"] = custom_variables
 
-        async with httpx.AsyncClient(timeout=30.0, trust_env=False) as client:
-            try:
-                resp = await client.post(
-                    f"{self.BASE_URL}/campaigns/{HEYREACH_CAMPAIGN_ID}/leads",
-                    headers=self.headers,
-                    json={"leads": [lead_data]}
-                )
+        try:
+            resp = await _send_with_retry(
+                "POST",
+                self.leads_url,
+                idempotent=False,
+                headers=self.headers,
+                content=_json_body({"leads": [lead_data]}),
+                timeout=30.0
+            )
 
-                if resp.status_code in [200, 201]:
-                    return {"success": True, "response": resp.json()}
-                return {"success": False, "error": resp.text}
+            if resp.status_code in (200, 201):
+                return {"success": True, "response": _loads(resp.content)}
+            return {"success": False, "error": resp.text}
 
-            except Exception as e:
-                print(f"  HeyReach error: {e}")
-                return {"success": False, "error": str(e)}
+        except Exception as e:
+            logger.warning("HeyReach error: %s", e)
+            return {"success": False, "error": str(e)}
 
     async def add_leads_batch(
         self,
@@ -1133,63 +2155,65 @@ class HeyReachClient:
         if not HEYREACH_API_KEY or not HEYREACH_CAMPAIGN_ID:
             return {"success": False, "error": "HeyReach not configured"}
 
-        # Format leads for API
-        formatted_leads = []
-        for lead in leads:
-            lead_data = {"linkedinUrl": lead.get("linkedin_url", "")}
-            if lead.get("first_name"):
-                lead_data["firstName"] = lead["first_name"]
-            if lead.get("last_name"):
-                lead_data["lastName"] = lead["last_name"]
-            if lead.get("company_name"):
-                lead_data["companyName"] = lead["company_name"]
-            if lead.get("email"):
-                lead_data["email"] = lead["email"]
-            if lead.get("custom_variables"):
-                lead_data["customVariables"] = lead["custom_variables"]
-            if lead_data["linkedinUrl"]:
-                formatted_leads.append(lead_data)
+        # Format leads for API (blank optional fields are left out)
+        formatted_leads = [
+            {"linkedinUrl": url, **{dst: v for src, dst in _HEYREACH_FIELD_MAP if (v := lead.get(src))}}
+            for lead in leads
+            if (url := lead.get("linkedin_url"))
+        ]
 
         if not formatted_leads:
             return {"success": False, "error": "No valid leads with LinkedIn URLs"}
 
-        async with httpx.AsyncClient(timeout=60.0, trust_env=False) as client:
-            try:
-                resp = await client.post(
-                    f"{self.BASE_URL}/campaigns/{HEYREACH_CAMPAIGN_ID}/leads",
-                    headers=self.headers,
-                    json={"leads": formatted_leads}
-                )
+        try:
+            resp = await _send_with_retry(
+                "POST",
+                self.leads_url,
+                idempotent=False,
+                headers=self.headers,
+                content=_json_body({"leads": formatted_leads}),
+                timeout=60.0
+            )
 
-                if resp.status_code in [200, 201]:
-                    return {"success": True, "response": resp.json(), "count": len(formatted_leads)}
-                return {"success": False, "error": resp.text}
+            if resp.status_code in (200, 201):
+                return {"success": True, "response": _loads(resp.content), "count": len(formatted_leads)}
+            return {"success": False, "error": resp.text}
 
-            except Exception as e:
-                print(f"  HeyReach batch error: {e}")
-                return {"success": False, "error": str(e)}
+        except Exception as e:
+            logger.warning("HeyReach batch error: %s", e)
+            return {"success": False, "error": str(e)}
 
     async def get_campaign_stats(self) -> Dict[str, Any]:
         """Get campaign statistics."""
         if not HEYREACH_API_KEY or not HEYREACH_CAMPAIGN_ID:
             return {"error": "HeyReach not configured"}
 
-        async with httpx.AsyncClient(timeout=30.0, trust_env=False) as client:
-            try:
-                resp = await client.get(
-                    f"{self.BASE_URL}/campaigns/{HEYREACH_CAMPAIGN_ID}",
-                    headers=self.headers
-                )
-                if resp.status_code == 200:
-                    return resp.json()
-            except Exception as e:
-                return {"error": str(e)}
+        try:
+            resp = await _send_with_retry(
+                "GET",
+                self.campaign_url,
+                headers=self.headers,
+                timeout=30.0
+            )
+            if resp.status_code == 200:
+                return _loads(resp.content)
+        except Exception as e:
+            return {"error": str(e)}
         return {"error": "Failed to get campaign stats"}
 
 
 class GHLClient:
     """GoHighLevel CRM integration"""
 
+    MAX_CONCURRENT_CALLS = 20  # GHL has no bulk contact endpoint
+
+    def __init__(self):
+        self._headers = {
+            "Authorization": f"Bearer {GHL_API_KEY}",
+            "Content-Type": "application/json",
+            "Version": "2021-07-28"
+        }
+
     async def create_contact(
         self,
         email: str,
@@ -1203,32 +2227,42 @@ class GHLClient:
         if not GHL_API_KEY or not GHL_LOCATION_ID:
             return {"success": False, "error": "GHL not configured"}
 
-        async with httpx.AsyncClient(timeout=30.0, trust_env=False) as client:
-            try:
-                resp = await client.post(
-                    "https://services.leadconnectorhq.com/contacts/",
-                    headers={
-                        "Authorization": f"Bearer {GHL_API_KEY}",
-                        "Content-Type": "application/json",
-                        "Version": "2021-07-28"
-                    },
-                    json={
-                        "locationId": GHL_LOCATION_ID,
-                        "firstName": first_name,
-                        "lastName": last_name,
-                        "email": email,
-                        "phone": phone,
-                        "companyName": company_name,
-                        "source": "Rise Local AI Pipeline",
-                        "tags": tags or ["ai-generated", "pipeline-python"]
-                    }
-                )
-                if resp.status_code in [200, 201]:
-                    return {"success": True, "response": resp.json()}
-                return {"success": False, "error": resp.text}
-            except Exception as e:
-                print(f"  GHL error: {e}")
-                return {"success": False, "error": str(e)}
+        try:
+            resp = await _send_with_retry(
+                "POST",
+                "https://services.leadconnectorhq.com/contacts/",
+                idempotent=False,
+                headers=self._headers,
+                content=_json_body({
+                    "locationId": GHL_LOCATION_ID,
+                    "firstName": first_name,
+                    "lastName": last_name,
+                    "email": email,
+                    "phone": phone,
+                    "companyName": company_name,
+                    "source": "Rise Local AI Pipeline",
+                    "tags": tags or ["ai-generated", "pipeline-python"]
+                }),
+                timeout=30.0
+            )
+            if resp.status_code in (200, 201):
+                return {"success": True, "response": _loads(resp.content)}
+            return {"success": False, "error": resp.text}
+        except Exception as e:
+            logger.warning("GHL error: %s", e)
+            return {"success": False, "error": str(e)}
+
+    async def create_contacts_batch(self, contacts: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Create many contacts, at most MAX_CONCURRENT_CALLS requests at a time.
+
+        Each contact dict takes the create_contact arguments as keys; results
+        come back in the same order.
+        """
+        return await gather_with_concurrency(
+            self.MAX_CONCURRENT_CALLS,
+            *(self.create_contact(**contact) for contact in contacts)
+        )
 
 
 class RAGService:
@@ -1239,79 +2273,216 @@ class RAGService:
     """
 
     OPENAI_EMBEDDING_URL = "https://api.openai.com/v1/embeddings"
+    EMBEDDING_BATCH_SIZE = 256  # OpenAI accepts up to 2048 inputs per request
+    EMBEDDING_CACHE_SIZE = 4096
+    CONTEXT_CACHE_SIZE = 1024
+    CONTEXT_CACHE_TTL = 3600  # seconds
 
     def __init__(self):
         self.supabase_url = SUPABASE_URL
         self.supabase_key = SUPABASE_SERVICE_KEY
         self.embedding_model = RAG_EMBEDDING_MODEL
+        # Only the v3 embedding models accept a "dimensions" parameter
+        self._embedding_params: Dict[str, Any] = {"model": self.embedding_model}
+        if self.embedding_model.startswith("text-embedding-3-"):
+            self._embedding_params["dimensions"] = RAG_EMBEDDING_DIMENSIONS
+        # Request headers are fixed, so build them once per service
+        self._openai_headers = {
+            "Authorization": f"Bearer {OPENAI_API_KEY}",
+            "Content-Type": "application/json"
+        }
+        self._supabase_headers = {
+            "apikey": self.supabase_key,
+            "Authorization": f"Bearer {self.supabase_key}",
+            "Content-Type": "application/json"
+        }
+        self._supabase_insert_headers = {**self._supabase_headers, "Prefer": "return=minimal"}
+        # LRU of (model, text digest) -> vector; leads in the same city with
+        # the same pain points produce identical search queries
+        self._embed_cache: "OrderedDict[Tuple[str, bytes], List[float]]" = OrderedDict()
+        # LRU of search query digest -> (expiry, assembled email context)
+        self._context_cache: "OrderedDict[str, Tuple[float, Dict[str, Any]]]" = OrderedDict()
+        # Cleared on first 404 from the combined match_email_context RPC
+        self._context_rpc_available = True
+        # Cleared when the tables turn out to lack a content_hash column
+        self._content_hash_supported = True
+
+    def _embed_key(self, text: str) -> Tuple[str, bytes]:
+        return self.embedding_model, hashlib.blake2b(text.encode(), digest_size=16).digest()
+
+    def _cache_embedding(self, key: Tuple[str, bytes], embedding: List[float]) -> None:
+        self._embed_cache[key] = embedding
+        self._embed_cache.move_to_end(key)
+        if len(self._embed_cache) > self.EMBEDDING_CACHE_SIZE:
+            self._embed_cache.popitem(last=False)
 
     async def generate_embedding(self, text: str) -> List[float]:
         """Generate embedding vector for text using OpenAI."""
+        return (await self.generate_embeddings([text]))[0]
+
+    async def generate_embeddings(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embedding vectors for many texts using OpenAI.
+
+        The embeddings endpoint accepts a list input, so texts are sent
+        EMBEDDING_BATCH_SIZE at a time instead of one request per text.
+        Returns one vector per input text, in order; texts whose batch
+        failed get an empty list. Previously embedded texts are served from
+        the in-memory LRU without calling OpenAI.
+        """
+        embeddings: List[List[float]] = [[] for _ in texts]
         if not OPENAI_API_KEY:
-            print("  RAG: OpenAI API key not configured")
-            return []
+            logger.warning("RAG: OpenAI API key not configured")
+            return embeddings
+
+        keys = [self._embed_key(text) for text in texts]
+        misses: List[int] = []
+        for i, key in enumerate(keys):
+            cached = self._embed_cache.get(key)
+            if cached is not None:
+                self._embed_cache.move_to_end(key)
+                embeddings[i] = cached
+            else:
+                misses.append(i)
 
-        async with httpx.AsyncClient(timeout=30.0, trust_env=False) as client:
+        client = get_http_client()
+        for start in range(0, len(misses), self.EMBEDDING_BATCH_SIZE):
+            indices = misses[start:start + self.EMBEDDING_BATCH_SIZE]
+            batch = [texts[i] for i in indices]
             try:
                 resp = await client.post(
                     self.OPENAI_EMBEDDING_URL,
-                    headers={
-                        "Authorization": f"Bearer {OPENAI_API_KEY}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": self.embedding_model,
-                        "input": text
-                    }
+                    headers=self._openai_headers,
+                    content=_json_body({**self._embedding_params, "input": batch}),
+                    timeout=30.0
                 )
 
                 if resp.status_code == 200:
-                    data = resp.json()
-                    return data["data"][0]["embedding"]
+                    for item in _loads(resp.content)["data"]:
+                        i = indices[item["index"]]
+                        embeddings[i] = item["embedding"]
+                        self._cache_embedding(keys[i], item["embedding"])
                 else:
-                    print(f"  RAG embedding error: {resp.status_code} - {resp.text[:200]}")
+                    logger.warning("RAG embedding error: %s - %s", resp.status_code, resp.text[:200])
 
             except Exception as e:
-                print(f"  RAG embedding error: {e}")
+                logger.warning("RAG embedding error: %s", e)
 
-        return []
+        return embeddings
 
-    async def add_knowledge_document(
-        self,
-        title: str,
-        content: str,
-        category: str = "general",
-        metadata: Dict[str, Any] = None
-    ) -> bool:
-        """Add a document to the knowledge base with embedding."""
-        # Generate embedding
-        embedding = await self.generate_embedding(f"{title}\n\n{content}")
-        if not embedding:
-            return False
+    @staticmethod
+    def _content_hash(text: str) -> str:
+        return hashlib.sha256(text.encode()).hexdigest()
+
+    async def _embed_with_dedup(self, table: str, texts: List[str]) -> Tuple[List[List[float]], List[str]]:
+        """
+        Embed texts for insertion into table, reusing stored vectors.
+
+        Rows carry a content_hash (sha256 of the embedded text); texts whose
+        hash already exists in table reuse that row's embedding instead of
+        calling OpenAI again, so re-seeding or re-running ingestion is free.
+        If the table has no content_hash column (PostgREST 400), dedup is
+        switched off for this service and everything is embedded as before.
+
+        Returns (embeddings, hashes), one entry per text.
+        """
+        hashes = [self._content_hash(text) for text in texts]
+        stored: Dict[str, List[float]] = {}
 
-        async with httpx.AsyncClient(timeout=30.0, trust_env=False) as client:
+        if self._content_hash_supported:
+            client = get_http_client()
             try:
-                resp = await client.post(
-                    f"{self.supabase_url}/rest/v1/knowledge_documents",
-                    headers={
-                        "apikey": self.supabase_key,
-                        "Authorization": f"Bearer {self.supabase_key}",
-                        "Content-Type": "application/json",
-                        "Prefer": "return=minimal"
+                resp = await client.get(
+                    f"{self.supabase_url}/rest/v1/{table}",
+                    headers=self._supabase_headers,
+                    params={
+                        "select": "content_hash,embedding",
+                        "content_hash": f"in.({','.join(set(hashes))})"
                     },
-                    json={
-                        "title": title,
-                        "content": content,
-                        "category": category,
-                        "metadata": metadata or {},
-                        "embedding": embedding
-                    }
+                    timeout=30.0
                 )
-                return resp.status_code in [200, 201]
+                if resp.status_code == 200:
+                    for row in _loads(resp.content):
+                        embedding = row.get("embedding")
+                        # pgvector columns come back as "[0.1,...]" strings
+                        if isinstance(embedding, str):
+                            embedding = _loads(embedding)
+                        if embedding:
+                            stored[row["content_hash"]] = embedding
+                elif resp.status_code == 400:
+                    self._content_hash_supported = False
 
             except Exception as e:
-                print(f"  RAG add document error: {e}")
-                return False
+                logger.warning("RAG dedup lookup error: %s", e)
+
+        missing = [i for i, h in enumerate(hashes) if h not in stored]
+        fresh = await self.generate_embeddings([texts[i] for i in missing]) if missing else []
+        embeddings = [stored.get(h, []) for h in hashes]
+        for i, embedding in zip(missing, fresh):
+            embeddings[i] = embedding
+        return embeddings, hashes
+
+    async def add_knowledge_documents(self, documents: List[Dict[str, Any]]) -> int:
+        """
+        Add several documents to the knowledge base.
+
+        Each document is a dict with title, content and optional category /
+        metadata. Embeddings for new content come from one OpenAI call and
+        all rows are inserted in one Supabase request. Returns the number of
+        rows added.
+        """
+        embeddings, hashes = await self._embed_with_dedup(
+            "knowledge_documents",
+            [f"{doc['title']}\n\n{doc['content']}" for doc in documents]
+        )
+        rows = []
+        for doc, embedding, content_hash in zip(documents, embeddings, hashes):
+            if not embedding:
+                continue
+            row = {
+                "title": doc["title"],
+                "content": doc["content"],
+                "category": doc.get("category", "general"),
+                "metadata": doc.get("metadata") or {},
+                "embedding": embedding
+            }
+            if self._content_hash_supported:
+                row["content_hash"] = content_hash
+            rows.append(row)
+        if not rows:
+            return 0
+
+        client = get_http_client()
+        try:
+            resp = await client.post(
+                f"{self.supabase_url}/rest/v1/knowledge_documents",
+                headers=self._supabase_insert_headers,
+                content=_json_body(rows),
+                timeout=30.0
+            )
+            if resp.status_code in (200, 201):
+                return len(rows)
+            logger.warning("RAG add documents error: %s - %s", resp.status_code, resp.text[:200])
+
+        except Exception as e:
+            logger.warning("RAG add documents error: %s", e)
+        return 0
+
+    async def add_knowledge_document(
+        self,
+        title: str,
+        content: str,
+        category: str = "general",
+        metadata: Dict[str, Any] = None
+    ) -> bool:
+        """Add a document to the knowledge base with embedding."""
+        added = await self.add_knowledge_documents([{
+            "title": title,
+            "content": content,
+            "category": category,
+            "metadata": metadata
+        }])
+        return added == 1
 
     async def add_email_template(
         self,
@@ -1325,35 +2496,35 @@ class RAGService:
         """Add an email template with embedding for similarity matching."""
         # Generate embedding from combined template content
         embed_text = f"{use_case}\n{subject_template}\n{body_template}"
-        embedding = await self.generate_embedding(embed_text)
+        (embedding,), (content_hash,) = await self._embed_with_dedup("email_templates", [embed_text])
         if not embedding:
             return False
 
-        async with httpx.AsyncClient(timeout=30.0, trust_env=False) as client:
-            try:
-                resp = await client.post(
-                    f"{self.supabase_url}/rest/v1/email_templates",
-                    headers={
-                        "apikey": self.supabase_key,
-                        "Authorization": f"Bearer {self.supabase_key}",
-                        "Content-Type": "application/json",
-                        "Prefer": "return=minimal"
-                    },
-                    json={
-                        "name": name,
-                        "subject_template": subject_template,
-                        "body_template": body_template,
-                        "use_case": use_case,
-                        "pain_points": pain_points or [],
-                        "performance_score": performance_score,
-                        "embedding": embedding
-                    }
-                )
-                return resp.status_code in [200, 201]
+        row = {
+            "name": name,
+            "subject_template": subject_template,
+            "body_template": body_template,
+            "use_case": use_case,
+            "pain_points": pain_points or [],
+            "performance_score": performance_score,
+            "embedding": embedding
+        }
+        if self._content_hash_supported:
+            row["content_hash"] = content_hash
+
+        client = get_http_client()
+        try:
+            resp = await client.post(
+                f"{self.supabase_url}/rest/v1/email_templates",
+                headers=self._supabase_insert_headers,
+                content=_json_body(row),
+                timeout=30.0
+            )
+            return resp.status_code in (200, 201)
 
-            except Exception as e:
-                print(f"  RAG add template error: {e}")
-                return False
+        except Exception as e:
+            logger.warning("RAG add template error: %s", e)
+            return False
 
     async def search_knowledge(
         self,
@@ -1367,32 +2538,40 @@ class RAGService:
         query_embedding = await self.generate_embedding(query)
         if not query_embedding:
             return []
+        return await self.search_knowledge_by_embedding(
+            query_embedding, category, match_threshold, match_count
+        )
 
-        async with httpx.AsyncClient(timeout=30.0, trust_env=False) as client:
-            try:
-                # Call the match_knowledge_documents function via RPC
-                resp = await client.post(
-                    f"{self.supabase_url}/rest/v1/rpc/match_knowledge_documents",
-                    headers={
-                        "apikey": self.supabase_key,
-                        "Authorization": f"Bearer {self.supabase_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "query_embedding": query_embedding,
-                        "match_threshold": match_threshold,
-                        "match_count": match_count,
-                        "filter_category": category
-                    }
-                )
+    async def search_knowledge_by_embedding(
+        self,
+        query_embedding: List[float],
+        category: str = None,
+        match_threshold: float = 0.7,
+        match_count: int = 5
+    ) -> List[Dict[str, Any]]:
+        """Search knowledge base with a precomputed query embedding."""
+        client = get_http_client()
+        try:
+            # Call the match_knowledge_documents function via RPC
+            resp = await client.post(
+                f"{self.supabase_url}/rest/v1/rpc/match_knowledge_documents",
+                headers=self._supabase_headers,
+                content=_json_body({
+                    "query_embedding": query_embedding,
+                    "match_threshold": match_threshold,
+                    "match_count": match_count,
+                    "filter_category": category
+                }),
+                timeout=30.0
+            )
 
-                if resp.status_code == 200:
-                    return resp.json()
-                else:
-                    print(f"  RAG search error: {resp.status_code}")
+            if resp.status_code == 200:
+                return _loads(resp.content)
+            else:
+                logger.warning("RAG search error: %s", resp.status_code)
 
-            except Exception as e:
-                print(f"  RAG search error: {e}")
+        except Exception as e:
+            logger.warning("RAG search error: %s", e)
 
         return []
 
@@ -1406,30 +2585,95 @@ class RAGService:
         query_embedding = await self.generate_embedding(query)
         if not query_embedding:
             return []
+        return await self.search_email_templates_by_embedding(
+            query_embedding, match_threshold, match_count
+        )
+
+    async def search_email_templates_by_embedding(
+        self,
+        query_embedding: List[float],
+        match_threshold: float = 0.6,
+        match_count: int = 3
+    ) -> List[Dict[str, Any]]:
+        """Search for similar email templates with a precomputed query embedding."""
+        client = get_http_client()
+        try:
+            resp = await client.post(
+                f"{self.supabase_url}/rest/v1/rpc/match_email_templates",
+                headers=self._supabase_headers,
+                content=_json_body({
+                    "query_embedding": query_embedding,
+                    "match_threshold": match_threshold,
+                    "match_count": match_count
+                }),
+                timeout=30.0
+            )
+
+            if resp.status_code == 200:
+                return _loads(resp.content)
+
+        except Exception as e:
+            logger.warning("RAG template search error: %s", e)
 
-        async with httpx.AsyncClient(timeout=30.0, trust_env=False) as client:
+        return []
+
+    async def search_context_by_embedding(
+        self,
+        query_embedding: List[float],
+        category: str = "email_guidance",
+        knowledge_count: int = 3,
+        template_count: int = 2
+    ) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Run the knowledge and template searches in one Supabase round trip.
+
+        Calls the match_email_context RPC, which runs both match_* queries
+        and returns {"knowledge": [...], "templates": [...]}. If the function
+        isn't deployed (PostgREST 404), fall back to the two separate RPCs
+        and stop trying it for the life of this service.
+
+        Returns (knowledge_docs, email_templates).
+        """
+        if self._context_rpc_available:
+            client = get_http_client()
             try:
                 resp = await client.post(
-                    f"{self.supabase_url}/rest/v1/rpc/match_email_templates",
-                    headers={
-                        "apikey": self.supabase_key,
-                        "Authorization": f"Bearer {self.supabase_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
+                    f"{self.supabase_url}/rest/v1/rpc/match_email_context",
+                    headers=self._supabase_headers,
+                    content=_json_body({
                         "query_embedding": query_embedding,
-                        "match_threshold": match_threshold,
-                        "match_count": match_count
-                    }
+                        "filter_category": category,
+                        "knowledge_threshold": 0.7,
+                        "knowledge_count": knowledge_count,
+                        "template_threshold": 0.6,
+                        "template_count": template_count
+                    }),
+                    timeout=30.0
                 )
 
                 if resp.status_code == 200:
-                    return resp.json()
+                    data = _loads(resp.content) or {}
+                    return data.get("knowledge") or [], data.get("templates") or []
+                if resp.status_code == 404:
+                    self._context_rpc_available = False
+                else:
+                    logger.warning("RAG context search error: %s", resp.status_code)
 
             except Exception as e:
-                print(f"  RAG template search error: {e}")
+                logger.warning("RAG context search error: %s", e)
 
-        return []
+        knowledge_docs, email_templates = await asyncio.gather(
+            self.search_knowledge_by_embedding(
+                query_embedding,
+                category=category,
+                match_count=knowledge_count
+            ),
+            self.search_email_templates_by_embedding(
+                query_embedding,
+                match_count=template_count
+            )
+        )
+        return knowledge_docs, email_templates
 
     async def get_context_for_email(
         self,
@@ -1454,21 +2698,23 @@ class RAGService:
 
         search_query = " ".join(search_parts)
 
-        # Search in parallel
-        knowledge_task = self.search_knowledge(
-            query=search_query,
-            category="email_guidance",
-            match_count=3
-        )
-        template_task = self.search_email_templates(
-            query=search_query,
-            match_count=2
-        )
-
-        knowledge_docs, email_templates = await asyncio.gather(
-            knowledge_task,
-            template_task
-        )
+        # Leads reprocessed within the hour produce the same query; reuse
+        # the assembled context instead of re-embedding and re-searching
+        cache_key = hashlib.blake2b(search_query.encode(), digest_size=16).hexdigest()
+        cached = self._context_cache.get(cache_key)
+        if cached is not None:
+            expires_at, cached_context = cached
+            if expires_at > time.monotonic():
+                self._context_cache.move_to_end(cache_key)
+                return dict(cached_context)
+            del self._context_cache[cache_key]
+
+        # Both searches use the same query, so embed it once
+        query_embedding = await self.generate_embedding(search_query)
+        if query_embedding:
+            knowledge_docs, email_templates = await self.search_context_by_embedding(query_embedding)
+        else:
+            knowledge_docs, email_templates = [], []
 
         # Format context for LLM
         context = {
@@ -1501,6 +2747,11 @@ class RAGService:
             ]
             context["has_context"] = True
 
+        if query_embedding:
+            self._context_cache[cache_key] = (time.monotonic() + self.CONTEXT_CACHE_TTL, context)
+            if len(self._context_cache) > self.CONTEXT_CACHE_SIZE:
+                self._context_cache.popitem(last=False)
+
         return context
 
     async def seed_initial_knowledge(self) -> int:
@@ -1550,16 +2801,41 @@ class RAGService:
             }
         ]
 
-        added = 0
-        for doc in documents:
-            success = await self.add_knowledge_document(**doc)
-            if success:
-                added += 1
-                print(f"  Added: {doc['title']}")
-
+        added = await self.add_knowledge_documents(documents)
+        logger.info("Added %s/%s knowledge documents", added, len(documents))
         return added
 
 
+# Cleanlab verification prompts for HallucinationDetector.verify_email_content.
+# Only the lead-specific fields change between calls.
+_SUBJECT_CHECK_PROMPT = """Given this business context:
+{context}
+
+Is this email subject line relevant and accurate? Subject: "{subject}"
+Answer only 'yes' or 'no' and explain why."""
+_SUBJECT_CHECK_RESPONSE = "The subject line '{subject}' is relevant to the business context."
+
+_BODY_CHECK_PROMPT = """Business context: {context}
+
+Review this email for factual accuracy and relevance:
+{body}
+
+Does this email contain accurate, relevant information without false claims?"""
+_BODY_CHECK_RESPONSE = "The email content is accurate and makes no false claims about the business."
+
+_PAIN_CHECK_PROMPT = """Business context: {context}
+
+Are these pain points accurate observations?
+Pain points: {pain_points}"""
+_PAIN_CHECK_RESPONSE = "The pain points ({pain_points}) are accurate observations based on the business data."
+
+
+# Trust score cut-offs for HallucinationDetector._get_risk_level: a score at
+# or above _RISK_CUTS[i] (and below the next cut) maps to _RISK_LABELS[i + 1]
+_RISK_CUTS = (0.5, 0.7, 0.85)
+_RISK_LABELS = ("critical", "high", "medium", "low")
+
+
 class HallucinationDetector:
     """
     Hallucination detection using Cleanlab TLM.
@@ -1569,10 +2845,19 @@ class HallucinationDetector:
     """
 
     CLEANLAB_API_URL = "https://api.cleanlab.ai/v1"
+    MAX_CONCURRENT_CALLS = 8
+    SCORE_CACHE_SIZE = 10000
+    SCORE_CACHE_TTL = 3600  # seconds
 
     def __init__(self, threshold: float = None):
         self.api_key = CLEANLAB_API_KEY
         self.threshold = threshold or HALLUCINATION_THRESHOLD
+        self._headers = {
+            "Authorization": f"Bearer {self.api_key}",
+            "Content-Type": "application/json"
+        }
+        # LRU of (prompt, response) digest -> (expiry, successful score result)
+        self._score_cache: "OrderedDict[bytes, Tuple[float, Dict[str, Any]]]" = OrderedDict()
 
     async def get_trustworthiness_score(
         self,
@@ -1601,48 +2886,61 @@ class HallucinationDetector:
                 "error": "Cleanlab API key not configured"
             }
 
-        async with httpx.AsyncClient(timeout=60.0, trust_env=False) as client:
-            try:
-                resp = await client.post(
-                    f"{self.CLEANLAB_API_URL}/trustworthiness",
-                    headers={
-                        "Authorization": f"Bearer {self.api_key}",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "prompt": prompt,
-                        "response": response
-                    }
-                )
-
-                if resp.status_code == 200:
-                    data = resp.json()
-                    score = data.get("trustworthiness_score", 0.5)
-
-                    return {
-                        "trustworthiness_score": score,
-                        "is_trustworthy": score >= self.threshold,
-                        "risk_level": self._get_risk_level(score),
-                        "raw_response": data
-                    }
-                else:
-                    print(f"  Cleanlab error: {resp.status_code} - {resp.text[:200]}")
-                    return {
-                        "trustworthiness_score": 0.5,
-                        "is_trustworthy": True,
-                        "risk_level": "unknown",
-                        "error": f"API error: {resp.status_code}"
-                    }
+        # Reprocessed leads re-verify identical text; skip the API for those
+        cache_key = hashlib.blake2b(f"{prompt}\x00{response}".encode(), digest_size=16).digest()
+        cached = self._score_cache.get(cache_key)
+        if cached is not None:
+            expires_at, cached_result = cached
+            if expires_at > time.monotonic():
+                self._score_cache.move_to_end(cache_key)
+                return dict(cached_result)
+            del self._score_cache[cache_key]
+
+        try:
+            resp = await _send_with_retry(
+                "POST",
+                f"{self.CLEANLAB_API_URL}/trustworthiness",
+                idempotent=False,
+                headers=self._headers,
+                content=_json_body({
+                    "prompt": prompt,
+                    "response": response
+                }),
+                timeout=60.0
+            )
 
-            except Exception as e:
-                print(f"  Cleanlab error: {e}")
+            if resp.status_code == 200:
+                data = _loads(resp.content)
+                score = data.get("trustworthiness_score", 0.5)
+
+                result = {
+                    "trustworthiness_score": score,
+                    "is_trustworthy": score >= self.threshold,
+                    "risk_level": self._get_risk_level(score),
+                    "raw_response": data
+                }
+                self._score_cache[cache_key] = (time.monotonic() + self.SCORE_CACHE_TTL, result)
+                if len(self._score_cache) > self.SCORE_CACHE_SIZE:
+                    self._score_cache.popitem(last=False)
+                return dict(result)
+            else:
+                logger.warning("Cleanlab error (%s): %s", resp.status_code, resp.text[:200])
                 return {
                     "trustworthiness_score": 0.5,
                     "is_trustworthy": True,
                     "risk_level": "unknown",
-                    "error": str(e)
+                    "error": f"API error: {resp.status_code}"
                 }
 
+        except Exception as e:
+            logger.warning("Cleanlab error: %s", e)
+            return {
+                "trustworthiness_score": 0.5,
+                "is_trustworthy": True,
+                "risk_level": "unknown",
+                "error": str(e)
+            }
+
     async def verify_email_content(
         self,
         lead_context: str,
@@ -1664,56 +2962,35 @@ class HallucinationDetector:
             "checks": []
         }
 
-        # Check 1: Subject line relevance
-        subject_prompt = f"""Given this business context:
-{lead_context}
-
-Is this email subject line relevant and accurate? Subject: "{email_subject}"
-Answer only 'yes' or 'no' and explain why."""
-
-        subject_check = await self.get_trustworthiness_score(
-            prompt=subject_prompt,
-            response=f"The subject line '{email_subject}' is relevant to the business context."
-        )
-        results["checks"].append({
-            "type": "subject_relevance",
-            "score": subject_check["trustworthiness_score"],
-            "passed": subject_check["is_trustworthy"]
-        })
-
-        # Check 2: Body content - no false claims
-        body_prompt = f"""Business context: {lead_context}
-
-Review this email for factual accuracy and relevance:
-{email_body}
-
-Does this email contain accurate, relevant information without false claims?"""
-
-        body_check = await self.get_trustworthiness_score(
-            prompt=body_prompt,
-            response="The email content is accurate and makes no false claims about the business."
-        )
-        results["checks"].append({
-            "type": "body_accuracy",
-            "score": body_check["trustworthiness_score"],
-            "passed": body_check["is_trustworthy"]
-        })
+        # Check 1: Subject line relevance; Check 2: body content - no false claims
+        checks = [
+            ("subject_relevance",
+             _SUBJECT_CHECK_PROMPT.format(context=lead_context, subject=email_subject),
+             _SUBJECT_CHECK_RESPONSE.format(subject=email_subject)),
+            ("body_accuracy",
+             _BODY_CHECK_PROMPT.format(context=lead_context, body=email_body),
+             _BODY_CHECK_RESPONSE)
+        ]
 
         # Check 3: Pain points are justified
         if pain_points:
-            pain_prompt = f"""Business context: {lead_context}
-
-Are these pain points accurate observations?
-Pain points: {', '.join(pain_points[:3])}"""
-
-            pain_check = await self.get_trustworthiness_score(
-                prompt=pain_prompt,
-                response=f"The pain points ({', '.join(pain_points[:3])}) are accurate observations based on the business data."
-            )
+            top_pain_points = ", ".join(pain_points[:3])
+            checks.append((
+                "pain_points_justified",
+                _PAIN_CHECK_PROMPT.format(context=lead_context, pain_points=top_pain_points),
+                _PAIN_CHECK_RESPONSE.format(pain_points=top_pain_points)
+            ))
+
+        # The checks are independent, so score them concurrently
+        scored = await self.batch_score([
+            {"prompt": prompt, "response": response}
+            for _, prompt, response in checks
+        ])
+        for (check_type, _, _), check in zip(checks, scored):
             results["checks"].append({
-                "type": "pain_points_justified",
-                "score": pain_check["trustworthiness_score"],
-                "passed": pain_check["is_trustworthy"]
+                "type": check_type,
+                "score": check["trustworthiness_score"],
+                "passed": check["is_trustworthy"]
             })
 
         # Calculate overall score
@@ -1742,24 +3019,19 @@ Pain points: {', '.join(pain_points[:3])}"""
             self.get_trustworthiness_score(item["prompt"], item["response"])
             for item in items
         ]
-        return await asyncio.gather(*tasks)
+        return await gather_with_concurrency(self.MAX_CONCURRENT_CALLS, *tasks)
 
-    def _get_risk_level(self, score: float) -> str:
+    @staticmethod
+    def _get_risk_level(score: float) -> str:
         """Convert score to risk level."""
-        if score >= 0.85:
-            return "low"
-        elif score >= 0.7:
-            return "medium"
-        elif score >= 0.5:
-            return "high"
-        else:
-            return "critical"
+        return _RISK_LABELS[bisect.bisect_right(_RISK_CUTS, score)]
 
     async def generate_with_verification(
         self,
         prompt: str,
         generate_func,
-        max_retries: int = 2
+        max_retries: int = 2,
+        speculative: bool = False
     ) -> Dict[str, Any]:
         """
         Generate content with automatic verification and retry.
@@ -1771,51 +3043,68 @@ Pain points: {', '.join(pain_points[:3])}"""
             prompt: The generation prompt
             generate_func: Async function that generates content
             max_retries: Max regeneration attempts
+            speculative: Start the next (enhanced) generation while the
+                current attempt is being verified, cancelling it if the
+                attempt passes. Hides the verify round trip at the cost of
+                tokens spent on generations that get thrown away.
 
         Returns:
             Dict with final content and verification results
         """
-        attempts = []
-
-        for attempt in range(max_retries + 1):
-            # Generate content
-            if attempt == 0:
-                content = await generate_func(prompt)
-            else:
-                # Add verification feedback to prompt
-                enhanced_prompt = f"""{prompt}
+        # Add verification feedback to prompt for retries
+        enhanced_prompt = f"""{prompt}
 
 IMPORTANT: Previous attempts had low confidence scores. Please ensure:
 - All claims are factually accurate
 - No assumptions or guesses
 - Only include information directly supported by the provided data
 - Be specific and avoid generalizations"""
-                content = await generate_func(enhanced_prompt)
 
-            # Verify
-            score_result = await self.get_trustworthiness_score(
-                prompt=prompt,
-                response=content
-            )
+        attempts = []
+        best_attempt: Optional[Dict[str, Any]] = None
+        next_generation: Optional[asyncio.Task] = None
+
+        try:
+            for attempt in range(max_retries + 1):
+                # Generate content
+                if next_generation is not None:
+                    content = await next_generation
+                    next_generation = None
+                else:
+                    content = await generate_func(prompt if attempt == 0 else enhanced_prompt)
 
-            attempts.append({
-                "attempt": attempt + 1,
-                "content": content,
-                "score": score_result["trustworthiness_score"],
-                "trustworthy": score_result["is_trustworthy"]
-            })
+                if speculative and attempt < max_retries:
+                    next_generation = asyncio.create_task(generate_func(enhanced_prompt))
 
-            if score_result["is_trustworthy"]:
-                return {
+                # Verify
+                score_result = await self.get_trustworthiness_score(
+                    prompt=prompt,
+                    response=content
+                )
+
+                result = {
+                    "attempt": attempt + 1,
                     "content": content,
-                    "trustworthiness_score": score_result["trustworthiness_score"],
-                    "risk_level": score_result["risk_level"],
-                    "attempts": attempts,
-                    "verified": True
+                    "score": score_result["trustworthiness_score"],
+                    "trustworthy": score_result["is_trustworthy"]
                 }
+                attempts.append(result)
+                if best_attempt is None or result["score"] > best_attempt["score"]:
+                    best_attempt = result
+
+                if score_result["is_trustworthy"]:
+                    return {
+                        "content": content,
+                        "trustworthiness_score": score_result["trustworthiness_score"],
+                        "risk_level": score_result["risk_level"],
+                        "attempts": attempts,
+                        "verified": True
+                    }
+        finally:
+            if next_generation is not None:
+                next_generation.cancel()
 
         # Return best attempt if all failed verification
-        best_attempt = max(attempts, key=lambda x: x["score"])
         return {
             "content": best_attempt["content"],
             "trustworthiness_score": best_attempt["score"],
@@ -1826,6 +3115,25 @@ IMPORTANT: Previous attempts had low confidence scores. Please ensure:
         }
 
 
+@lru_cache(maxsize=1024)
+def _format_pain_points(pain_points: Tuple[str, ...]) -> str:
+    """Bulleted pain-point list for council prompts; leads in one trade repeat these."""
+    return "\n".join(f"- {pp}" for pp in pain_points)
+
+
+# Agent calls made while processing one lead, keyed by a digest of
+# (agent, task, context). Nothing sets this automatically: code that runs
+# council reviews calls LLMCouncil.reset_lead_scope() before each lead. Each
+# asyncio task gets its own copy of the context, so concurrent leads don't
+# share entries. None (the default) disables deduplication.
+_council_call_cache: ContextVar[Optional[Dict[bytes, list]]] = ContextVar(
+    "council_call_cache", default=None
+)
+
+# Agents often wrap their JSON in ```json ... ``` fences (sometimes unclosed)
+_FENCE_RE = re.compile(r"^\s*```(?:json)?\s*(.*?)\s*(?:```\s*)?$", re.DOTALL)
+
+
 class LLMCouncil:
     """
     LLM Council using CrewAI for multi-agent consensus decisions.
@@ -1841,9 +3149,19 @@ class LLMCouncil:
     """
 
     ANTHROPIC_API_URL = "https://api.anthropic.com/v1/messages"
+    MAX_CONCURRENT_CALLS = 8  # across all council methods, to stay under Anthropic rate limits
 
-    def __init__(self):
+    def __init__(self, fused: bool = False):
+        """
+        Args:
+            fused: Ask all agents of a review in one Anthropic call instead of
+                one call per agent. The shared context is sent (and billed)
+                once, at the cost of the agents no longer being independent
+                requests.
+        """
         self.api_key = ANTHROPIC_API_KEY
+        self.fused = fused
+        self._semaphore = asyncio.Semaphore(self.MAX_CONCURRENT_CALLS)
         # Agent personas with specialized expertise
         self.agents = {
             "lead_analyst": {
@@ -1867,6 +3185,100 @@ class LLMCouncil:
                 "personality": "Cautious, thorough, protective"
             }
         }
+        # Agents don't change after construction, so build their system
+        # prompts and the request headers once
+        self._system_prompts = {
+            name: f"""You are a {agent['role']} with expertise in {agent['expertise']}.
+Your personality: {agent['personality']}.
+
+Analyze the given context and provide your professional assessment.
+Be concise but thorough. Focus on your area of expertise.
+Format your response as JSON with keys: assessment, confidence (0-1), concerns (list), recommendations (list)."""
+            for name, agent in self.agents.items()
+        }
+        self._system_blocks = {
+            name: self._cached_system(prompt) for name, prompt in self._system_prompts.items()
+        }
+        self._headers = {
+            "x-api-key": self.api_key,
+            "anthropic-version": "2023-06-01",
+            "anthropic-beta": "prompt-caching-2024-07-31",
+            "Content-Type": "application/json"
+        }
+
+    @staticmethod
+    def _cached_system(prompt: str) -> List[Dict[str, Any]]:
+        """
+        System prompt as a content block marked for Anthropic prompt caching.
+
+        Persona prompts repeat on every lead, so caching them server-side cuts
+        billed input tokens. The API only caches prompts above a model
+        minimum (2048 tokens for Haiku); shorter ones are sent uncached.
+        """
+        return [{"type": "text", "text": prompt, "cache_control": {"type": "ephemeral"}}]
+
+    async def _request_completion(
+        self,
+        system: List[Dict[str, Any]],
+        task: str,
+        context: str,
+        max_tokens: int
+    ) -> httpx.Response:
+        """
+        POST one Anthropic message, within the council's concurrency cap.
+
+        Only rejections the model never ran for (connection failures, 429/503
+        with Retry-After) are retried, so a reply lost mid-response isn't
+        paid for twice; otherwise the agent falls back to its unsuccessful
+        placeholder.
+        """
+        async with self._semaphore:
+            return await _send_with_retry(
+                "POST",
+                self.ANTHROPIC_API_URL,
+                idempotent=False,
+                headers=self._headers,
+                content=_json_body({
+                    "model": "claude-3-haiku-20240307",
+                    "max_tokens": max_tokens,
+                    "system": system,
+                    "messages": [
+                        {
+                            "role": "user",
+                            "content": f"Task: {task}\n\nContext:\n{context}"
+                        }
+                    ]
+                }),
+                timeout=60.0
+            )
+
+    @staticmethod
+    def _parse_agent_json(content: str) -> Dict[str, Any]:
+        """Parse an agent reply as JSON, unwrapping a markdown code fence."""
+        fenced = _FENCE_RE.match(content)
+        try:
+            return _loads(fenced.group(1) if fenced else content.strip())
+        except ValueError:
+            return {
+                "assessment": content,
+                "confidence": 0.5,
+                "concerns": [],
+                "recommendations": []
+            }
+
+    @staticmethod
+    def reset_lead_scope():
+        """
+        Start deduplicating agent calls for the lead about to be processed.
+
+        Within the current task (and tasks it spawns), identical agent calls
+        - same agent, task and context - are made once and their result is
+        shared, so overlapping reviews of one lead don't pay for the same
+        answer twice. Callers that run council reviews must call this once
+        per lead themselves (the pipeline doesn't); the scope ends with the
+        task.
+        """
+        _council_call_cache.set({})
 
     async def _call_agent(
         self,
@@ -1874,85 +3286,142 @@ class LLMCouncil:
         task: str,
         context: str,
         max_tokens: int = 500
+    ) -> Dict[str, Any]:
+        """Execute a single agent's analysis, reusing an identical call for this lead."""
+        cache = _council_call_cache.get()
+        if cache is None:
+            return await self._call_agent_uncached(agent_name, task, context, max_tokens)
+
+        key = hashlib.blake2b(
+            f"{agent_name}\x00{task}\x00{context}".encode(), digest_size=16
+        ).digest()
+        entry = cache.get(key)
+        if entry is None:
+            # [shared call, number of callers awaiting it]
+            entry = cache[key] = [asyncio.ensure_future(
+                self._call_agent_uncached(agent_name, task, context, max_tokens)
+            ), 0]
+        call = entry[0]
+        entry[1] += 1
+        try:
+            # Shielded so one cancelled caller (e.g. an early-exit vote)
+            # doesn't cancel the call out from under the other callers
+            result = await asyncio.shield(call)
+        finally:
+            entry[1] -= 1
+            if not entry[1] and not call.done():
+                # Last caller gave up; stop paying for the request
+                call.cancel()
+                if cache.get(key) is entry:
+                    del cache[key]
+        if not result["success"] and cache.get(key) is entry:
+            del cache[key]  # let a later review retry a failed call
+        return dict(result)
+
+    async def _call_agent_uncached(
+        self,
+        agent_name: str,
+        task: str,
+        context: str,
+        max_tokens: int
     ) -> Dict[str, Any]:
         """Execute a single agent's analysis."""
         agent = self.agents.get(agent_name, {})
 
-        system_prompt = f"""You are a {agent['role']} with expertise in {agent['expertise']}.
-Your personality: {agent['personality']}.
-
-Analyze the given context and provide your professional assessment.
-Be concise but thorough. Focus on your area of expertise.
-Format your response as JSON with keys: assessment, confidence (0-1), concerns (list), recommendations (list)."""
-
-        async with httpx.AsyncClient(timeout=60.0, trust_env=False) as client:
-            try:
-                resp = await client.post(
-                    self.ANTHROPIC_API_URL,
-                    headers={
-                        "x-api-key": self.api_key,
-                        "anthropic-version": "2023-06-01",
-                        "Content-Type": "application/json"
-                    },
-                    json={
-                        "model": "claude-3-haiku-20240307",
-                        "max_tokens": max_tokens,
-                        "system": system_prompt,
-                        "messages": [
-                            {
-                                "role": "user",
-                                "content": f"Task: {task}\n\nContext:\n{context}"
-                            }
-                        ]
-                    }
-                )
-
-                if resp.status_code == 200:
-                    data = resp.json()
-                    content = data["content"][0]["text"]
-
-                    # Try to parse as JSON
-                    try:
-                        # Clean up potential markdown formatting
-                        content_clean = content.strip()
-                        if content_clean.startswith("```json"):
-                            content_clean = content_clean[7:]
-                        if content_clean.startswith("```"):
-                            content_clean = content_clean[3:]
-                        if content_clean.endswith("```"):
-                            content_clean = content_clean[:-3]
-
-                        result = json.loads(content_clean.strip())
-                    except json.JSONDecodeError:
-                        result = {
-                            "assessment": content,
-                            "confidence": 0.5,
-                            "concerns": [],
-                            "recommendations": []
-                        }
-
-                    return {
-                        "agent": agent_name,
-                        "role": agent["role"],
-                        "result": result,
-                        "success": True
-                    }
-                else:
-                    return {
-                        "agent": agent_name,
-                        "role": agent["role"],
-                        "result": {"error": f"API error: {resp.status_code}"},
-                        "success": False
-                    }
+        try:
+            resp = await self._request_completion(
+                self._system_blocks[agent_name], task, context, max_tokens
+            )
 
-            except Exception as e:
+            if resp.status_code == 200:
+                data = _loads(resp.content)
+                return {
+                    "agent": agent_name,
+                    "role": agent["role"],
+                    "result": self._parse_agent_json(data["content"][0]["text"]),
+                    "success": True
+                }
+            else:
                 return {
                     "agent": agent_name,
                     "role": agent["role"],
-                    "result": {"error": str(e)},
+                    "result": {"error": f"API error: {resp.status_code}"},
                     "success": False
                 }
 
+        except Exception as e:
+            return {
+                "agent": agent_name,
+                "role": agent["role"],
+                "result": {"error": str(e)},
+                "success": False
+            }
+
+    async def _call_agents_fused(
+        self,
+        agent_names: List[str],
+        task: str,
+        context: str,
+        max_tokens: int = 500
+    ) -> List[Dict[str, Any]]:
+        """
+        Run several agents in one Anthropic call.
+
+        The context is sent once and the model answers for every agent in a
+        JSON object keyed by agent name, which is split back into the same
+        per-agent results _call_agent returns. Agents missing from the reply
+        come back unsuccessful.
+        """
+        personas = "\n".join(
+            f"- {name}: {self.agents[name]['role']} with expertise in "
+            f"{self.agents[name]['expertise']}. Personality: {self.agents[name]['personality']}."
+            for name in agent_names
+        )
+        system_prompt = f"""You are a council of independent expert reviewers:
+{personas}
+
+Each reviewer analyzes the given context from their own area of expertise.
+Be concise but thorough.
+Respond with a single JSON object keyed by reviewer name ({', '.join(agent_names)}).
+Each value is that reviewer's response in the format the task asks for, or by default an object with keys: assessment, confidence (0-1), concerns (list), recommendations (list)."""
+
+        try:
+            resp = await self._request_completion(
+                self._cached_system(system_prompt), task, context, max_tokens * len(agent_names)
+            )
+            if resp.status_code == 200:
+                data = _loads(resp.content)
+                combined = self._parse_agent_json(data["content"][0]["text"])
+                error = None
+            else:
+                combined, error = {}, f"API error: {resp.status_code}"
+        except Exception as e:
+            combined, error = {}, str(e)
+
+        results = []
+        for name in agent_names:
+            result = combined.get(name)
+            results.append({
+                "agent": name,
+                "role": self.agents[name]["role"],
+                "result": result if isinstance(result, dict) else {"error": error or "Missing from fused response"},
+                "success": isinstance(result, dict)
+            })
+        return results
+
+    async def _run_agents(
+        self,
+        agent_names: List[str],
+        task: str,
+        context: str
+    ) -> List[Dict[str, Any]]:
+        """Run agents as one fused call or as parallel calls, per self.fused."""
+        if self.fused:
+            return await self._call_agents_fused(agent_names, task, context)
+        return await gather_structured(*(
+            self._call_agent(name, task, context) for name in agent_names
+        ))
+
     async def evaluate_lead(
         self,
         lead_data: Dict[str, Any],
@@ -1983,15 +3452,28 @@ ENRICHMENT DATA:
         task = "Evaluate this lead for qualification. Should we pursue this lead? Rate their potential value and identify any concerns."
 
         # Run agents in parallel
-        agent_tasks = [
-            self._call_agent("lead_analyst", task, context),
-            self._call_agent("risk_assessor", task, context)
-        ]
-
-        results = await asyncio.gather(*agent_tasks)
+        results = await self._run_agents(["lead_analyst", "risk_assessor"], task, context)
 
         return self._build_consensus(results, "lead_evaluation")
 
+    async def evaluate_leads_batch(
+        self,
+        leads: List[Tuple[Dict[str, Any], Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """
+        Evaluate many leads at once.
+
+        Takes (lead_data, enrichment_data) pairs and returns one consensus
+        per lead, in order. Every agent call for every lead is issued
+        together; the council's semaphore keeps at most MAX_CONCURRENT_CALLS
+        in flight, so the batch runs at the rate limit instead of one lead
+        at a time.
+        """
+        return await gather_structured(*(
+            self.evaluate_lead(lead_data, enrichment_data)
+            for lead_data, enrichment_data in leads
+        ))
+
     async def review_pain_points(
         self,
         lead_data: Dict[str, Any],
@@ -2010,7 +3492,7 @@ LEAD DATA:
 - Website: {lead_data.get('website_url', 'None')}
 
 IDENTIFIED PAIN POINTS:
-{chr(10).join(f'- {pp}' for pp in identified_pain_points)}
+{_format_pain_points(tuple(identified_pain_points))}
 
 SUPPORTING DATA:
 - Google Rating: {lead_data.get('google_rating', 'N/A')} ({lead_data.get('review_count', 0)} reviews)
@@ -2027,12 +3509,7 @@ SUPPORTING DATA:
 3. Are any pain points missing?
 4. Are any pain points incorrect or overstated?"""
 
-        agent_tasks = [
-            self._call_agent("lead_analyst", task, context),
-            self._call_agent("quality_reviewer", task, context)
-        ]
-
-        results = await asyncio.gather(*agent_tasks)
+        results = await self._run_agents(["lead_analyst", "quality_reviewer"], task, context)
 
         return self._build_consensus(results, "pain_point_review")
 
@@ -2053,7 +3530,7 @@ LEAD CONTEXT:
 {lead_context}
 
 TARGETED PAIN POINTS:
-{chr(10).join(f'- {pp}' for pp in pain_points)}
+{_format_pain_points(tuple(pain_points))}
 
 GENERATED EMAIL:
 Subject: {email_subject}
@@ -2069,13 +3546,9 @@ Body:
 4. Professionalism - Is the tone appropriate?
 5. Compliance - Any red flags or potential issues?"""
 
-        agent_tasks = [
-            self._call_agent("email_strategist", task, context),
-            self._call_agent("quality_reviewer", task, context),
-            self._call_agent("risk_assessor", task, context)
-        ]
-
-        results = await asyncio.gather(*agent_tasks)
+        results = await self._run_agents(
+            ["email_strategist", "quality_reviewer", "risk_assessor"], task, context
+        )
 
         return self._build_consensus(results, "email_review")
 
@@ -2084,12 +3557,18 @@ Body:
         lead_data: Dict[str, Any],
         enrichment_data: Dict[str, Any],
         pain_score: int,
-        email_content: Dict[str, str]
+        email_content: Dict[str, str],
+        early_exit_on_block: bool = True
     ) -> Dict[str, Any]:
         """
         Final council vote on whether to proceed with this lead.
 
-        All agents vote, and consensus determines the outcome.
+        All agents vote, and consensus determines the outcome. Any blocking
+        concern forces a "blocked" decision, so with early_exit_on_block the
+        remaining votes are cancelled as soon as one arrives; the result then
+        holds only the votes received. Pass False for a full audit of every
+        agent's vote. (Fused councils answer in one call and always return
+        every vote.)
         """
         context = f"""
 FINAL REVIEW - READY TO SEND?
@@ -2117,15 +3596,36 @@ Respond with:
 - blocking_concerns: Any issues that must be resolved"""
 
         # All agents vote
-        agent_tasks = [
-            self._call_agent(name, task, context)
-            for name in self.agents.keys()
-        ]
-
-        results = await asyncio.gather(*agent_tasks)
+        if early_exit_on_block and not self.fused:
+            results = await self._vote_until_blocked(list(self.agents), task, context)
+        else:
+            results = await self._run_agents(list(self.agents), task, context)
 
         return self._build_voting_result(results)
 
+    async def _vote_until_blocked(
+        self,
+        agent_names: List[str],
+        task: str,
+        context: str
+    ) -> List[Dict[str, Any]]:
+        """Collect agent votes as they finish, cancelling the rest on the first blocking concern."""
+        tasks = [asyncio.create_task(self._call_agent(name, task, context)) for name in agent_names]
+        results = []
+        try:
+            for next_vote in asyncio.as_completed(tasks):
+                result = await next_vote
+                results.append(result)
+                if result.get("success") and result.get("result", {}).get("blocking_concerns"):
+                    break
+        finally:
+            for pending in tasks:
+                pending.cancel()
+
+        # Report votes in agent order, not completion order
+        order = {name: i for i, name in enumerate(agent_names)}
+        return sorted(results, key=lambda r: order[r["agent"]])
+
     def _build_consensus(
         self,
         results: List[Dict[str, Any]],
@@ -2144,34 +3644,31 @@ Respond with:
                 "all_recommendations": []
             }
 
-        # Aggregate concerns and recommendations
-        all_concerns = []
-        all_recommendations = []
+        # Aggregate concerns and recommendations, deduplicated in first-seen
+        # order (dict keys) so the output is stable across runs
+        unique_concerns: Dict[Any, None] = {}
+        unique_recommendations: Dict[Any, None] = {}
         confidence_scores = []
 
         for r in successful:
             result = r.get("result", {})
             if isinstance(result.get("concerns"), list):
-                all_concerns.extend(result["concerns"])
+                unique_concerns.update(dict.fromkeys(result["concerns"]))
             if isinstance(result.get("recommendations"), list):
-                all_recommendations.extend(result["recommendations"])
+                unique_recommendations.update(dict.fromkeys(result["recommendations"]))
             if isinstance(result.get("confidence"), (int, float)):
                 confidence_scores.append(result["confidence"])
 
         # Calculate average confidence
         avg_confidence = sum(confidence_scores) / len(confidence_scores) if confidence_scores else 0.5
 
-        # Deduplicate concerns and recommendations
-        unique_concerns = list(set(all_concerns))
-        unique_recommendations = list(set(all_recommendations))
-
         return {
             "decision_type": decision_type,
             "consensus": "approved" if avg_confidence >= 0.6 else "needs_review",
             "confidence": round(avg_confidence, 2),
             "agent_results": results,
-            "all_concerns": unique_concerns,
-            "all_recommendations": unique_recommendations,
+            "all_concerns": list(unique_concerns),
+            "all_recommendations": list(unique_recommendations),
             "agents_consulted": len(successful)
         }
 
@@ -2181,7 +3678,7 @@ Respond with:
     ) -> Dict[str, Any]:
         """Build voting result from agent votes."""
         votes = {"yes": 0, "no": 0, "abstain": 0}
-        blocking_concerns = []
+        blocking_concerns: Dict[Any, None] = {}  # ordered set
 
         for r in results:
             if not r.get("success"):
@@ -2198,9 +3695,9 @@ Respond with:
 
             # Collect blocking concerns
             if isinstance(result.get("blocking_concerns"), list):
-                blocking_concerns.extend(result["blocking_concerns"])
+                blocking_concerns.update(dict.fromkeys(result["blocking_concerns"]))
             elif result.get("blocking_concerns"):
-                blocking_concerns.append(str(result["blocking_concerns"]))
+                blocking_concerns[str(result["blocking_concerns"])] = None
 
         # Determine outcome
         total_votes = votes["yes"] + votes["no"]
@@ -2220,7 +3717,7 @@ Respond with:
         return {
             "decision": decision,
             "votes": votes,
-            "blocking_concerns": list(set(blocking_concerns)),
+            "blocking_concerns": list(blocking_concerns),
             "agent_results": results,
             "approval_rate": votes["yes"] / total_votes if total_votes > 0 else 0
         }
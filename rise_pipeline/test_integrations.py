@@ -50,7 +50,18 @@ async def test_quickchart():
         "Config structure valid"
     )
 
-    # Test 3: All chart methods exist
+    # Test 3: Precompiled templates match the equivalent dict config
+    import services
+    filled = services._fill_chart(services._PAIN_SCORE_TEMPLATE, value=75, title='Pain Score: "@@VALUE@@" Co')
+    parsed = json.loads(filled)
+    test_result(
+        "Chart template fill",
+        parsed["data"]["datasets"][0]["value"] == 75
+        and parsed["options"]["title"]["text"] == 'Pain Score: "@@VALUE@@" Co',
+        "Placeholders replaced once, values JSON-encoded"
+    )
+
+    # Test 4: All chart methods exist
     methods = ["pain_score_gauge", "score_comparison_bar", "pipeline_funnel", "tech_stack_radar"]
     all_exist = all(hasattr(client, m) for m in methods)
     test_result("Chart methods exist", all_exist, f"Methods: {methods}")
@@ -93,6 +104,17 @@ async def test_fullenrich():
         f"Got: {parsed.owner_phone_direct}"
     )
 
+    fallback = client._parse_result({"emails": [
+        {"email": "", "type": "work"},
+        {"email": "info@company.com", "type": "generic"},
+        {"email": "john@gmail.com", "type": "personal"}
+    ]})
+    test_result(
+        "Parse result - personal before other emails",
+        fallback.owner_email == "john@gmail.com" and not fallback.email_verified,
+        f"Got: {fallback.owner_email}"
+    )
+
     test_result(
         "Parse result - source attribution",
         parsed.contact_source == "fullenrich",
@@ -104,10 +126,14 @@ async def test_fullenrich():
         ("https://www.example.com/page", "example.com"),
         ("http://example.com", "example.com"),
         ("www.example.com", "example.com"),
+        (" Example.com?ref=x ", "example.com"),
+        ("https://shop.example.com/www.promo", "shop.example.com"),
     ]
 
+    from services import _normalize_domain
+
     for input_domain, expected in test_domains:
-        cleaned = input_domain.lower().replace("https://", "").replace("http://", "").replace("www.", "").split("/")[0]
+        cleaned = _normalize_domain(input_domain)
         test_result(
             f"Domain cleaning: {input_domain[:30]}",
             cleaned == expected,
@@ -115,41 +141,264 @@ async def test_fullenrich():
         )
 
 
+async def test_fullenrich_batching():
+    """Test FullEnrich bulk chunking and concurrent polling."""
+    print("\n=== Testing FullEnrichClient Batching ===")
+
+    import httpx
+    import services
+    from services import FullEnrichClient
+
+    started = []
+
+    def handler(request):
+        if request.method == "POST":
+            body = json.loads(request.content)
+            started.append(len(body["datas"]))
+            return httpx.Response(200, json={"enrichment_id": f"job{len(started)}"})
+        job = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json={
+            "status": "completed",
+            "results": [{"emails": [{"email": f"{job}@example.com", "type": "work"}]}]
+        })
+
+    contacts = [{"firstname": "A", "lastname": str(i), "domain": "acme.com"} for i in range(250)]
+    services.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    with patch.object(services, "FULLENRICH_API_KEY", "test"), \
+            patch("asyncio.sleep", AsyncMock()):
+        enriched = await FullEnrichClient().enrich_batch(contacts)
+    await services.close_http_client()
+
+    test_result(
+        "Large batch split into bulk jobs",
+        started == [100, 100, 50],
+        f"Job sizes: {started}"
+    )
+    test_result(
+        "Jobs polled and merged in order",
+        [c.owner_email for c in enriched] == ["job1@example.com", "job2@example.com", "job3@example.com"],
+        f"Emails: {[c.owner_email for c in enriched]}"
+    )
+
+    # A chunk that fails to start doesn't strand the jobs that did start
+    started.clear()
+
+    def second_start_fails(request):
+        if request.method == "POST" and len(started) == 1:
+            started.append(None)
+            raise httpx.ReadError("connection reset")
+        return handler(request)
+
+    services.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(second_start_fails)))
+    with patch.object(services, "FULLENRICH_API_KEY", "test"), \
+            patch.object(services.FullEnrichClient, "POLL_SCHEDULE", (0.01,)):
+        partial = await FullEnrichClient().enrich_batch(contacts)
+    await services.close_http_client()
+    services._circuit_breakers.clear()
+
+    test_result(
+        "Failed chunk start keeps started jobs",
+        len(partial) == 2 and all(c.owner_email for c in partial),
+        f"Emails: {[c.owner_email for c in partial]}"
+    )
+
+    # Concurrent single-contact calls share one bulk job, matched by reference
+    started.clear()
+
+    def coalesced(request):
+        if request.method == "POST":
+            datas = json.loads(request.content)["datas"]
+            started.append(len(datas))
+            coalesced.results = [
+                {"custom": d["custom"], "emails": [{"email": f"{d['lastname']}@acme.com", "type": "work"}]}
+                for d in reversed(datas)
+            ]
+            return httpx.Response(200, json={"enrichment_id": "job_single"})
+        return httpx.Response(200, json={"status": "completed", "results": coalesced.results})
+
+    client = FullEnrichClient()
+    client.FLUSH_INTERVAL = 0.01
+    services.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(coalesced)))
+    with patch.object(services, "FULLENRICH_API_KEY", "test"), \
+            patch.object(services.FullEnrichClient, "POLL_SCHEDULE", (0.01,)):
+        singles = await asyncio.gather(*(
+            client.enrich_contact("Owner", f"n{i}", domain="acme.com") for i in range(3)
+        ))
+    await services.close_http_client()
+
+    test_result(
+        "enrich_contact calls share one bulk job",
+        started == [3] and [c.owner_email for c in singles] == ["n0@acme.com", "n1@acme.com", "n2@acme.com"],
+        f"Job sizes: {started}, emails: {[c.owner_email for c in singles]}"
+    )
+
+    # Retry-After from the status endpoint overrides the backoff
+    polls = {"n": 0}
+    polled_at = []
+
+    def throttled(request):
+        polls["n"] += 1
+        polled_at.append(asyncio.get_running_loop().time())
+        if polls["n"] == 1:
+            return httpx.Response(429, headers={"Retry-After": "2"})
+        return httpx.Response(200, json={"status": "completed", "results": []})
+
+    services.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(throttled)))
+    registered = asyncio.get_running_loop().time()
+    await FullEnrichClient()._poll_single("job", 60)
+    await services.close_http_client()
+
+    waits = [b - a for a, b in zip([registered] + polled_at, polled_at)]
+    test_result(
+        "Polling honours Retry-After",
+        len(waits) == 2 and 0.45 <= waits[0] < 0.8 and 1.9 <= waits[1] < 2.3,
+        f"Waits: {[round(w, 2) for w in waits]}"
+    )
+
+    # Concurrent jobs share one poll loop, and each keeps its own result
+    def per_job(request):
+        job = request.url.path.rsplit("/", 1)[-1]
+        return httpx.Response(200, json={"status": "completed", "results": [{"job": job}]})
+
+    services.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(per_job)))
+    fe = FullEnrichClient()
+    with patch.object(services.FullEnrichClient, "POLL_SCHEDULE", (0.01,)):
+        jobs = await asyncio.gather(*(fe._poll_single(f"job{i}", 5) for i in range(5)))
+        poller = services._get_fullenrich_poller()
+        await asyncio.sleep(0)
+    await services.close_http_client()
+
+    test_result(
+        "Concurrent jobs share one poller",
+        jobs == [[{"job": f"job{i}"}] for i in range(5)]
+        and not poller._jobs and poller._task.done(),
+        f"Results: {jobs}"
+    )
+
+    # A slow status check doesn't hold up other jobs' checks
+    async def one_slow(request):
+        if request.url.path.endswith("/job_slow"):
+            await asyncio.sleep(1)
+        return per_job(request)
+
+    services.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(one_slow)))
+    with patch.object(services.FullEnrichClient, "POLL_SCHEDULE", (0.01,)):
+        slow = asyncio.create_task(fe._poll_single("job_slow", 5))
+        await asyncio.sleep(0.05)
+        loop = asyncio.get_running_loop()
+        started_at = loop.time()
+        fast = await fe._poll_single("job_fast", 5)
+        fast_wait = loop.time() - started_at
+        await slow
+    await services.close_http_client()
+
+    test_result(
+        "Slow check doesn't block other jobs",
+        fast == [{"job": "job_fast"}] and fast_wait < 0.5,
+        f"Fast job waited {fast_wait:.2f}s"
+    )
+
+    delays = [FullEnrichClient._poll_delay(i) for i in range(10)]
+    test_result(
+        "Poll schedule front-loads checks",
+        delays[:6] == list(FullEnrichClient.POLL_SCHEDULE) and delays[6] == 10
+        and delays[-1] == FullEnrichClient.POLL_MAX_INTERVAL,
+        f"Delays: {delays}"
+    )
+
+    # A webhook delivery ends the wait without any status polls
+    polls["n"] = 0
+    services.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(throttled)))
+    with patch.object(services, "FULLENRICH_WEBHOOK_URL", "https://hooks.example.com/fullenrich"):
+        poll = asyncio.create_task(FullEnrichClient()._poll_single("job_wh", 60))
+        await asyncio.sleep(0)
+        delivered = services.resolve_fullenrich_webhook({
+            "enrichment_id": "job_wh", "status": "completed", "results": [{"firstname": "jane"}]
+        })
+        results = await asyncio.wait_for(poll, 1)
+    await services.close_http_client()
+
+    test_result(
+        "Webhook resolves pending enrichment",
+        delivered and results == [{"firstname": "jane"}] and polls["n"] == 0
+        and "job_wh" not in services._fullenrich_waiters,
+        f"Polls: {polls['n']}"
+    )
+
+    # With the URL set but no in-process receiver, polling still finishes the job
+    def completes_on_second_check(request):
+        polls["n"] += 1
+        status = "completed" if polls["n"] >= 2 else "in_progress"
+        return httpx.Response(200, json={"status": status, "results": [{"firstname": "joe"}]})
+
+    polls["n"] = 0
+    services.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(completes_on_second_check)))
+    with patch.object(services, "FULLENRICH_WEBHOOK_URL", "https://hooks.example.com/fullenrich"), \
+            patch.object(services.FullEnrichClient, "POLL_SCHEDULE", (0.01,)):
+        unresolved = await FullEnrichClient()._poll_single("job_nohook", 1)
+    await services.close_http_client()
+
+    test_result(
+        "Webhook URL without receiver keeps polling",
+        unresolved == [{"firstname": "joe"}] and polls["n"] == 2,
+        f"Polls: {polls['n']}, results: {unresolved}"
+    )
+
+    # Starting a job leaves no waiter behind until something polls it
+    services.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(
+        lambda request: httpx.Response(200, json={"enrichment_id": "job_unpolled"})
+    )))
+    with patch.object(services, "FULLENRICH_API_KEY", "test"), \
+            patch.object(services, "FULLENRICH_WEBHOOK_URL", "https://hooks.example.com/fullenrich"):
+        await FullEnrichClient()._start_job("unpolled", [{"firstname": "jane"}])
+    await services.close_http_client()
+
+    test_result(
+        "Job start registers no webhook waiter",
+        "job_unpolled" not in services._fullenrich_waiters,
+        f"Waiters: {list(services._fullenrich_waiters)}"
+    )
+
+
 async def test_heyreach():
     """Test HeyReach client."""
     print("\n=== Testing HeyReachClient ===")
 
+    import httpx
+    import services
     from services import HeyReachClient
     client = HeyReachClient()
 
     # Test 1: Lead data formatting
     test_leads = [
         {"linkedin_url": "https://linkedin.com/in/test1", "first_name": "John", "last_name": "Doe"},
-        {"linkedin_url": "https://linkedin.com/in/test2", "email": "test@example.com"},
+        {"linkedin_url": "https://linkedin.com/in/test2", "email": "test@example.com", "company_name": ""},
         {"first_name": "No LinkedIn"}  # Should be filtered out
     ]
 
-    formatted = []
-    for lead in test_leads:
-        lead_data = {"linkedinUrl": lead.get("linkedin_url", "")}
-        if lead.get("first_name"):
-            lead_data["firstName"] = lead["first_name"]
-        if lead.get("last_name"):
-            lead_data["lastName"] = lead["last_name"]
-        if lead.get("email"):
-            lead_data["email"] = lead["email"]
-        if lead_data["linkedinUrl"]:
-            formatted.append(lead_data)
+    posted = []
+
+    def handler(request):
+        posted.extend(json.loads(request.content)["leads"])
+        return httpx.Response(200, json={"added": len(posted)})
+
+    services.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    with patch.object(services, "HEYREACH_API_KEY", "test"), \
+            patch.object(services, "HEYREACH_CAMPAIGN_ID", "campaign"):
+        batch = await client.add_leads_batch(test_leads)
+    await services.close_http_client()
+    formatted = posted
 
     test_result(
         "Lead formatting - filters no-LinkedIn",
-        len(formatted) == 2,
+        len(formatted) == 2 and batch["count"] == 2,
         f"Kept {len(formatted)} of 3 leads"
     )
 
     test_result(
         "Lead formatting - preserves data",
-        formatted[0].get("firstName") == "John",
+        formatted[0] == {"linkedinUrl": "https://linkedin.com/in/test1", "firstName": "John", "lastName": "Doe"}
+        and formatted[1] == {"linkedinUrl": "https://linkedin.com/in/test2", "email": "test@example.com"},
         f"First name: {formatted[0].get('firstName')}"
     )
 
@@ -215,6 +464,122 @@ async def test_rag_service():
         "Required fields present"
     )
 
+    # Test 4: Batched embeddings keep input order in one request
+    import httpx
+    import services
+
+    requests_seen = []
+
+    def embeddings_api(request):
+        inputs = json.loads(request.content)["input"]
+        requests_seen.append(len(inputs))
+        # Return items out of order; the client must reorder by index
+        data = [{"index": i, "embedding": [float(i)]} for i in range(len(inputs))]
+        return httpx.Response(200, json={"data": list(reversed(data))})
+
+    with patch.object(services, "OPENAI_API_KEY", "test"):
+        services.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(embeddings_api)))
+        vectors = await rag.generate_embeddings(["a", "b", "c"])
+        repeat = await rag.generate_embeddings(["b", "d"])
+        await services.close_http_client()
+
+    test_result(
+        "Batched embeddings",
+        requests_seen[0] == 3 and vectors == [[0.0], [1.0], [2.0]],
+        f"Requests: {requests_seen}"
+    )
+
+    # Test 5: Cached embeddings skip OpenAI
+    test_result(
+        "Embedding cache",
+        requests_seen == [3, 1] and repeat == [[1.0], [0.0]],
+        "Only uncached text sent on repeat"
+    )
+
+    # Test 6: Combined context RPC, with fallback when it isn't deployed
+    rpc_calls = []
+
+    def supabase_rpc(request):
+        name = request.url.path.rsplit("/", 1)[-1]
+        rpc_calls.append(name)
+        if name == "match_email_context":
+            return httpx.Response(404 if deployed["missing"] else 200,
+                                  json={"knowledge": [{"id": 1}], "templates": []})
+        return httpx.Response(200, json=[{"id": name}])
+
+    deployed = {"missing": False}
+    services.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(supabase_rpc)))
+    combined = await rag.search_context_by_embedding([0.1])
+    deployed["missing"] = True
+    fallback = await RAGService().search_context_by_embedding([0.1])
+    await services.close_http_client()
+
+    test_result(
+        "Context RPC single round trip",
+        combined == ([{"id": 1}], []) and rpc_calls[0] == "match_email_context",
+        f"RPC calls: {rpc_calls}"
+    )
+    test_result(
+        "Context RPC fallback",
+        fallback == ([{"id": "match_knowledge_documents"}], [{"id": "match_email_templates"}]),
+        "Separate match_* RPCs used on 404"
+    )
+
+    # Test 7: Stored embeddings reused by content hash
+    known_hash = RAGService._content_hash("Known\n\nBody")
+    embedded = []
+    inserted = []
+
+    def dedup_api(request):
+        if request.url.host == "api.openai.com":
+            inputs = json.loads(request.content)["input"]
+            embedded.extend(inputs)
+            return httpx.Response(200, json={"data": [
+                {"index": i, "embedding": [9.0]} for i in range(len(inputs))
+            ]})
+        if request.method == "GET":
+            return httpx.Response(200, json=[{"content_hash": known_hash, "embedding": "[1.0]"}])
+        inserted.extend(json.loads(request.content))
+        return httpx.Response(201)
+
+    with patch.object(services, "OPENAI_API_KEY", "test"):
+        services.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(dedup_api)))
+        added = await RAGService().add_knowledge_documents([
+            {"title": "Known", "content": "Body"},
+            {"title": "New", "content": "Body"}
+        ])
+        await services.close_http_client()
+
+    test_result(
+        "Embedding dedup by content hash",
+        added == 2 and embedded == ["New\n\nBody"]
+        and [row["embedding"] for row in inserted] == [[1.0], [9.0]]
+        and inserted[0]["content_hash"] == known_hash,
+        f"Embedded: {embedded}"
+    )
+
+    # Test 8: Assembled email context cached per search query
+    context_calls = []
+
+    def context_api(request):
+        context_calls.append(request.url.path)
+        if request.url.host == "api.openai.com":
+            return httpx.Response(200, json={"data": [{"index": 0, "embedding": [0.5]}]})
+        return httpx.Response(200, json={"knowledge": [], "templates": []})
+
+    with patch.object(services, "OPENAI_API_KEY", "test"):
+        services.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(context_api)))
+        cached_rag = RAGService()
+        first = await cached_rag.get_context_for_email(MockLead, pain_points)
+        second = await cached_rag.get_context_for_email(MockLead, pain_points)
+        await services.close_http_client()
+
+    test_result(
+        "Email context cache",
+        len(context_calls) == 2 and first == second,
+        f"Requests: {len(context_calls)}"
+    )
+
 
 async def test_hallucination_detector():
     """Test Hallucination Detector."""
@@ -226,8 +591,11 @@ async def test_hallucination_detector():
     # Test 1: Risk level calculation
     test_cases = [
         (0.9, "low"),
+        (0.85, "low"),
         (0.75, "medium"),
+        (0.7, "medium"),
         (0.6, "high"),
+        (0.5, "high"),
         (0.3, "critical")
     ]
 
@@ -255,6 +623,50 @@ async def test_hallucination_detector():
             f"Returns neutral score with error message"
         )
 
+    # Test 4: Speculative retry overlaps generation with verification
+    generated = []
+    scores = iter([0.1, 0.9])
+
+    async def generate(prompt):
+        generated.append("IMPORTANT" in prompt)
+        await asyncio.sleep(0)
+        return f"draft {len(generated)}"
+
+    async def score(prompt, response):
+        value = next(scores)
+        return {"trustworthiness_score": value, "is_trustworthy": value >= 0.7, "risk_level": "low"}
+
+    with patch.object(detector, "get_trustworthiness_score", score):
+        outcome = await detector.generate_with_verification("prompt", generate, speculative=True)
+
+    test_result(
+        "Speculative generation",
+        outcome["verified"] and outcome["content"] == "draft 2" and generated == [False, True],
+        f"Attempts: {len(outcome['attempts'])}, generations: {len(generated)}"
+    )
+
+    # Test 5: Repeated prompt/response pairs served from the score cache
+    import httpx
+    import services
+
+    cleanlab_calls = []
+
+    def cleanlab(request):
+        cleanlab_calls.append(request.url.path)
+        return httpx.Response(200, json={"trustworthiness_score": 0.9})
+
+    services.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(cleanlab)))
+    with patch.object(detector, "api_key", "test"):
+        first = await detector.get_trustworthiness_score("same prompt", "same response")
+        second = await detector.get_trustworthiness_score("same prompt", "same response")
+    await services.close_http_client()
+
+    test_result(
+        "Trust score cache",
+        len(cleanlab_calls) == 1 and first == second and second["is_trustworthy"],
+        f"Cleanlab calls: {len(cleanlab_calls)}"
+    )
+
 
 async def test_llm_council():
     """Test LLM Council."""
@@ -281,7 +693,110 @@ async def test_llm_council():
             f"Role: {agent.get('role', 'MISSING')[:30]}"
         )
 
-    # Test 3: Consensus building logic
+    # Test 3: Agent replies unwrapped from markdown fences
+    from services import _FENCE_RE
+    replies = ['```json\n{"confidence": 0.9}\n```', '{"confidence": 0.9}', '```json\n{"confidence": 0.9}']
+    unwrapped = [(_FENCE_RE.match(r).group(1) if _FENCE_RE.match(r) else r.strip()) for r in replies]
+    test_result(
+        "Fenced JSON unwrapped",
+        all(json.loads(u) == {"confidence": 0.9} for u in unwrapped),
+        "Closed, bare and unclosed fences"
+    )
+
+    # Test 4: Fused review sends the context once and splits per agent
+    import httpx
+    import services
+
+    anthropic_calls = []
+
+    def anthropic(request):
+        anthropic_calls.append(json.loads(request.content)["system"])
+        text = json.dumps({
+            "email_strategist": {"confidence": 0.8, "concerns": [], "recommendations": []},
+            "quality_reviewer": {"confidence": 0.6, "concerns": ["Tone"], "recommendations": []}
+        })
+        return httpx.Response(200, json={"content": [{"text": f"```json\n{text}\n```"}]})
+
+    services.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(anthropic)))
+    fused = await LLMCouncil(fused=True)._call_agents_fused(
+        ["email_strategist", "quality_reviewer", "risk_assessor"], "Review", "Email"
+    )
+    await services.close_http_client()
+
+    test_result(
+        "Fused council call",
+        len(anthropic_calls) == 1
+        and anthropic_calls[0][0]["cache_control"] == {"type": "ephemeral"}
+        and [r["success"] for r in fused] == [True, True, False]
+        and fused[1]["result"]["concerns"] == ["Tone"],
+        f"Requests: {len(anthropic_calls)}, agents: {[r['agent'] for r in fused]}"
+    )
+
+    # Batch evaluation: one consensus per lead, all under the semaphore
+    seen = []
+
+    async def fake_agent(name, task, context, max_tokens=500):
+        seen.append(name)
+        return {"agent": name, "role": name, "success": True, "result": {"confidence": 0.9}}
+
+    council = LLMCouncil()
+    with patch.object(council, "_call_agent", fake_agent):
+        batch = await council.evaluate_leads_batch([
+            ({"business_name": "A"}, {}), ({"business_name": "B"}, {})
+        ])
+    test_result(
+        "Batch lead evaluation",
+        len(batch) == 2 and len(seen) == 4 and all(c["consensus"] == "approved" for c in batch),
+        f"Agent calls: {len(seen)}"
+    )
+
+    # Final vote stops waiting once a blocking concern arrives
+    started, finished = [], []
+
+    async def voting_agent(name, task, context, max_tokens=500):
+        started.append(name)
+        if name != "risk_assessor":
+            await asyncio.sleep(1)
+        finished.append(name)
+        concerns = ["License expired"] if name == "risk_assessor" else []
+        return {"agent": name, "role": name, "success": True,
+                "result": {"vote": "yes", "blocking_concerns": concerns}}
+
+    with patch.object(council, "_call_agent", voting_agent):
+        vote = await council.final_qualification_vote({}, {}, 80, {})
+    test_result(
+        "Final vote exits early on block",
+        vote["decision"] == "blocked" and finished == ["risk_assessor"] and len(started) == 4,
+        f"Votes received: {len(vote['agent_results'])}"
+    )
+
+    # Identical agent calls within one lead scope are made once
+    requests = []
+
+    async def completion(system, task, context, max_tokens):
+        requests.append(task)
+        await asyncio.sleep(0)
+        return httpx.Response(200, json={"content": [{"text": '{"confidence": 0.9}'}]})
+
+    async def one_lead():
+        council.reset_lead_scope()
+        first, second = await asyncio.gather(
+            council._call_agent("lead_analyst", "Evaluate", "ctx"),
+            council._call_agent("lead_analyst", "Evaluate", "ctx"),
+        )
+        await council._call_agent("lead_analyst", "Evaluate", "other ctx")
+        return first, second
+
+    with patch.object(council, "_request_completion", completion):
+        first, second = await asyncio.create_task(one_lead())
+        await council._call_agent("lead_analyst", "Evaluate", "ctx")  # outside any lead scope
+    test_result(
+        "Agent calls deduped per lead",
+        len(requests) == 3 and first == second and first is not second,
+        f"Requests: {len(requests)}"
+    )
+
+    # Test 5: Consensus building logic
     mock_results = [
         {"success": True, "result": {"confidence": 0.8, "concerns": ["A"], "recommendations": ["X"]}},
         {"success": True, "result": {"confidence": 0.7, "concerns": ["B"], "recommendations": ["Y"]}},
@@ -298,7 +813,7 @@ async def test_llm_council():
 
     test_result(
         "Consensus - aggregates concerns",
-        len(consensus["all_concerns"]) == 2,
+        consensus["all_concerns"] == ["A", "B"],
         f"Concerns: {consensus['all_concerns']}"
     )
 
@@ -308,7 +823,7 @@ async def test_llm_council():
         f"Consulted: {consensus['agents_consulted']} of 3"
     )
 
-    # Test 4: Voting logic
+    # Test 6: Voting logic
     mock_vote_results = [
         {"success": True, "result": {"vote": "yes", "confidence": 0.8, "blocking_concerns": []}},
         {"success": True, "result": {"vote": "yes", "confidence": 0.7, "blocking_concerns": []}},
@@ -330,7 +845,7 @@ async def test_llm_council():
         f"Decision: {vote_result['decision']}"
     )
 
-    # Test 5: Blocking concerns
+    # Test 7: Blocking concerns
     mock_blocked_results = [
         {"success": True, "result": {"vote": "yes", "blocking_concerns": ["License expired"]}},
         {"success": True, "result": {"vote": "yes", "blocking_concerns": []}}
@@ -345,6 +860,622 @@ async def test_llm_council():
     )
 
 
+async def test_bounded_gather():
+    """Test gather_with_concurrency and gather_structured."""
+    print("\n=== Testing Bounded Gather ===")
+
+    from services import gather_with_concurrency
+
+    running = {"now": 0, "peak": 0}
+
+    async def work(i):
+        running["now"] += 1
+        running["peak"] = max(running["peak"], running["now"])
+        await asyncio.sleep(0)
+        running["now"] -= 1
+        return i
+
+    out = await gather_with_concurrency(3, *(work(i) for i in range(10)))
+    test_result(
+        "Concurrency capped, order kept",
+        out == list(range(10)) and running["peak"] == 3,
+        f"Peak in flight: {running['peak']}"
+    )
+
+    async def maybe_fail(i):
+        await asyncio.sleep(0)
+        if i == 1:
+            raise ValueError("lead 1")
+        return i
+
+    mixed = await gather_with_concurrency(2, *(maybe_fail(i) for i in range(4)), return_exceptions=True)
+    test_result(
+        "Bounded gather can return exceptions in place",
+        mixed[0] == 0 and isinstance(mixed[1], ValueError) and mixed[2:] == [2, 3],
+        f"Results: {mixed}"
+    )
+
+    # A failure surfaces as the original exception and stops the siblings
+    import sys
+    from services import gather_structured
+
+    finished = []
+
+    async def slow():
+        await asyncio.sleep(0.05)
+        finished.append("slow")
+
+    async def boom():
+        raise ValueError("boom")
+
+    try:
+        await gather_structured(slow(), boom())
+        raised = False
+    except ValueError:
+        raised = True
+    await asyncio.sleep(0.1)
+    test_result(
+        "Structured gather re-raises and cancels",
+        raised and (finished == [] or sys.version_info < (3, 11)),
+        f"Raised: {raised}, finished: {finished}"
+    )
+
+    # Phase 2: only TDLR waits on owner extraction; the rest start at once
+    from services import IntelligenceServices as intel
+    from models import (
+        Lead, OwnerExtraction, VisualAnalysis, LicenseInfo,
+        TechnicalScores, ReputationData, AddressVerification
+    )
+
+    events = []
+
+    async def owner(lead):
+        events.append("owner_start")
+        await asyncio.sleep(0.05)
+        events.append("owner_done")
+        return OwnerExtraction(owner_first_name="Jane")
+
+    async def visual(lead):
+        events.append("visual_start")
+        return VisualAnalysis(visual_score=70)
+
+    async def tdlr(lead, owner_data=None):
+        events.append(f"tdlr:{owner_data.owner_first_name}")
+        return LicenseInfo()
+
+    with patch.object(intel, "get_owner_extraction", owner), \
+            patch.object(intel, "get_visual_analysis", visual), \
+            patch.object(intel, "get_tdlr_license", tdlr), \
+            patch.object(intel, "get_pagespeed", AsyncMock(return_value=TechnicalScores())), \
+            patch.object(intel, "get_bbb_reputation", AsyncMock(return_value=ReputationData())), \
+            patch.object(intel, "get_address_verification", AsyncMock(return_value=AddressVerification())):
+        out = await intel.gather_all(Lead(id="1", business_name="Acme"), "https://acme.com")
+    test_result(
+        "Owner extraction overlaps other Phase 2 calls",
+        events.index("visual_start") < events.index("owner_done") < events.index("tdlr:Jane")
+        and out[0].visual_score == 70 and out[6].owner_first_name == "Jane",
+        f"Events: {events}"
+    )
+
+
+async def test_supabase_rows():
+    """Test Supabase row parsing."""
+    print("\n=== Testing Supabase Row Parsing ===")
+
+    from services import _parse_row, _LEAD_ROW_SPEC, _TECH_ROW_SPEC
+    from models import Lead, TechEnrichment
+
+    lead = Lead(**_parse_row(_LEAD_ROW_SPEC, {
+        "id": 42,
+        "business_name": "Acme Electric",
+        "address_full": None,
+        "address_street": "1 Main St",
+        "google_rating": 4,
+        "google_review_count": None,
+        "status": None
+    }))
+    test_result(
+        "Lead row coercion",
+        lead.id == "42" and lead.address == "1 Main St" and lead.google_rating == 4.0
+        and lead.review_count == 0 and lead.state == "TX" and lead.status == "discovered",
+        f"Lead: {lead.id}, {lead.address}, {lead.status}"
+    )
+
+    tech = TechEnrichment(**_parse_row(_TECH_ROW_SPEC, {
+        "has_gtm": True,
+        "has_booking_system": True,
+        "has_chat_widget": False,
+        "tech_stack_score": "7"
+    }))
+    test_result(
+        "Tech row coercion",
+        tech.has_gtm and not tech.has_ga4 and tech.booking_system == "yes"
+        and tech.chat_widget == "" and tech.tech_score == 7,
+        f"Booking: {tech.booking_system!r}, score: {tech.tech_score}"
+    )
+
+    # Service payloads keep real zeros; only missing/null keys use defaults
+    from services import _parse_payload, _PAGESPEED_SPEC
+    from models import TechnicalScores
+
+    scores = TechnicalScores(**_parse_payload(_PAGESPEED_SPEC, {
+        "performance_score": 0, "seo_score": "70", "has_https": None, "cls": 1
+    }))
+    test_result(
+        "Service payload coercion",
+        scores.performance_score == 0 and scores.seo_score == 70 and scores.mobile_score == 50
+        and scores.has_https is True and scores.cls == 1.0 and scores.cls.__class__ is float,
+        f"Performance: {scores.performance_score}, SEO: {scores.seo_score}"
+    )
+
+    # Every Supabase method goes through the one pooled client
+    import httpx
+    from services import SupabaseClient, ALL_COLS
+
+    seen = []
+
+    def handler(request):
+        seen.append(request.method)
+        if request.method == "PATCH":
+            return httpx.Response(204)
+        return httpx.Response(200, json=[{"id": 7, "business_name": "Acme", "has_gtm": True}])
+
+    supabase = SupabaseClient()
+    await supabase.aclose()
+    supabase.client = httpx.AsyncClient(transport=httpx.MockTransport(handler))
+    fetched = await supabase.get_lead("7")
+    tech = await supabase.get_tech_enrichment("7")
+    updated = await supabase.update_lead("7", {"status": "enriched"})
+    await supabase.aclose()
+    test_result(
+        "Supabase methods share the pooled client",
+        fetched.id == "7" and tech.has_gtm and updated and seen == ["GET", "GET", "PATCH"],
+        f"Requests: {seen}"
+    )
+
+    # Bulk typed fetch: one in.() query with a narrowed projection
+    queries = []
+
+    def bulk(request):
+        queries.append(dict(request.url.params))
+        return httpx.Response(200, json=[{"id": 1, "has_gtm": True}, {"id": 2, "tech_stack_score": 40}])
+
+    supabase.client = httpx.AsyncClient(transport=httpx.MockTransport(bulk))
+    techs = await supabase.get_tech_enrichments_bulk(["1", "2", "3"])
+    await supabase.aclose()
+    test_result(
+        "Bulk tech enrichment",
+        len(queries) == 1 and queries[0]["id"] == "in.(1,2,3)"
+        and queries[0]["select"].startswith("id,has_gtm")
+        and techs["1"].has_gtm and techs["2"].tech_score == 40 and "3" not in techs,
+        f"Leads: {sorted(techs)}"
+    )
+
+    # Lead bundle: lead, tech and contact from a single GET
+    bundle_requests = []
+
+    def one_row(request):
+        bundle_requests.append(request.url.params["id"])
+        return httpx.Response(200, json=[{
+            "id": 9, "business_name": "Acme", "has_ga4": True, "owner_email": "o@acme.com"
+        }])
+
+    supabase.client = httpx.AsyncClient(transport=httpx.MockTransport(one_row))
+    bundle_lead, bundle_tech, bundle_contact = await supabase.get_lead_bundle("9")
+    await supabase.aclose()
+    test_result(
+        "Lead bundle in one request",
+        bundle_requests == ["eq.9"] and bundle_lead.business_name == "Acme"
+        and bundle_tech.has_ga4 and bundle_contact.owner_email == "o@acme.com",
+        f"Requests: {len(bundle_requests)}"
+    )
+
+    # Explicit column list, falling back to select=* if the schema rejects it
+    selects = []
+
+    def strict(request):
+        selects.append(request.url.params["select"])
+        if request.url.params["select"] != "*":
+            return httpx.Response(400, json={"message": "column leads.place_id does not exist"})
+        return httpx.Response(200, json=[{"id": 5, "business_name": "Acme"}])
+
+    supabase = SupabaseClient()
+    await supabase.aclose()
+    supabase.client = httpx.AsyncClient(transport=httpx.MockTransport(strict))
+    first_row = await supabase._fetch_row("5")
+    await supabase._fetch_row("5")
+    await supabase.aclose()
+    test_result(
+        "Row projection with select=* fallback",
+        first_row["business_name"] == "Acme" and selects == [ALL_COLS, "*", "*"],
+        f"Selects: {[sel[:12] for sel in selects]}"
+    )
+
+
+async def test_clay_submit():
+    """Test Clay fire-and-forget row submission."""
+    print("\n=== Testing ClayClient Submit ===")
+
+    import httpx
+    import services
+    from services import ClayClient
+
+    timeouts = []
+
+    def handler(request):
+        timeouts.append(request.extensions["timeout"]["read"])
+        return httpx.Response(202, json={"id": "row_1"})
+
+    services.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    with patch.object(services, "CLAY_BUILTWITH_TABLE_ID", "t_tech"):
+        tech = await ClayClient().enrich_tech_stack("https://acme.com", "Acme", wait=False)
+    await services.close_http_client()
+
+    test_result(
+        "Clay row queued without waiting",
+        timeouts == [ClayClient.SUBMIT_TIMEOUT] and tech.tech_score == 0,
+        f"Timeouts: {timeouts}"
+    )
+
+    row = {"has_gtm": None, "gtm_installed": "yes", "crm": "HubSpot", "cms_platform": "WordPress", "cms": "Wix"}
+    with patch.object(services, "CLAY_BUILTWITH_TABLE_ID", "t_tech"), \
+            patch.object(ClayClient, "_post_clay_row", AsyncMock(return_value=row)):
+        tech = await ClayClient().enrich_tech_stack("https://acme.com", "Acme")
+
+    test_result(
+        "Clay column aliases fall back in order",
+        tech.has_gtm and tech.crm_detected == "HubSpot" and tech.cms_platform == "WordPress"
+        and tech.booking_system == "",
+        f"GTM: {tech.has_gtm}, CRM: {tech.crm_detected}, CMS: {tech.cms_platform}"
+    )
+
+
+async def test_intelligence_lookups():
+    """Test memoized Phase 2 lookups."""
+    print("\n=== Testing Intelligence Lookup Cache ===")
+
+    import httpx
+    import services
+    from models import Lead
+
+    requests = []
+
+    def handler(request):
+        requests.append(request.url.path)
+        if request.url.path == "/verify":
+            return httpx.Response(500)
+        return httpx.Response(200, json={"bbb_rating": "A+", "bbb_accredited": True})
+
+    services._lookup_cache.clear()
+    services.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(handler)))
+    first = Lead(id="1", business_name="Acme Plumbing", city="Austin", google_rating=4.5)
+    franchise = Lead(id="2", business_name="ACME Plumbing ", city="austin", google_rating=4.5)
+    with patch.object(services, "RETRY_ATTEMPTS", 1):
+        a, b = await asyncio.gather(
+            services.IntelligenceServices.get_bbb_reputation(first),
+            services.IntelligenceServices.get_bbb_reputation(franchise),
+        )
+        a.bbb_rating = "F"
+        c = await services.IntelligenceServices.get_bbb_reputation(franchise)
+        await services.IntelligenceServices.get_address_verification(first)
+        await services.IntelligenceServices.get_address_verification(first)
+    await services.close_http_client()
+    services._lookup_cache.clear()
+    services._circuit_breakers.clear()
+
+    test_result(
+        "Duplicate businesses share one BBB lookup",
+        requests.count("/search") == 1 and b.bbb_rating == "A+" and c.bbb_rating == "A+",
+        f"Requests: {requests}"
+    )
+    test_result(
+        "Failed lookups are not cached",
+        requests.count("/verify") == 2,
+        f"Address requests: {requests.count('/verify')}"
+    )
+
+    # A website license number is looked up directly; names only on a miss
+    from models import OwnerExtraction
+
+    paths = []
+
+    def tdlr(request):
+        paths.append(request.url.path)
+        if request.url.path == "/search/license":
+            number = json.loads(request.content)["license_number"]
+            if number == "TACLA1234":
+                return httpx.Response(200, json={"license_status": "Active", "license_number": number})
+            return httpx.Response(200, json={"license_status": "Not Found"})
+        return httpx.Response(200, json={"license_status": "Active", "owner_name": "Jane Doe"})
+
+    services.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(tdlr)))
+    hit = await services.IntelligenceServices.get_tdlr_license(
+        first, OwnerExtraction(license_number="TACLA1234", owner_first_name="Jane")
+    )
+    miss = await services.IntelligenceServices.get_tdlr_license(
+        first, OwnerExtraction(license_number="TACLA9999", owner_first_name="Jane", owner_last_name="Doe")
+    )
+    await services.close_http_client()
+    services._lookup_cache.clear()
+
+    test_result(
+        "TDLR license number skips the waterfall",
+        hit.license_status == "Active" and miss.owner_name == "Jane Doe"
+        and paths == ["/search/license", "/search/license", "/search/waterfall"],
+        f"Paths: {paths}"
+    )
+
+
+async def test_instantly_batching():
+    """Test Instantly add_lead batching."""
+    print("\n=== Testing InstantlyClient Batching ===")
+
+    import services
+    from services import InstantlyClient
+
+    client = InstantlyClient()
+    client.FLUSH_INTERVAL = 0.01
+    posted = []
+
+    async def fake_post(leads):
+        posted.append(len(leads))
+        return {"success": True, "response": {"count": len(leads)}}
+
+    with patch.object(services, "INSTANTLY_API_KEY", "test"), \
+            patch.object(services, "INSTANTLY_CAMPAIGN_ID", "campaign"), \
+            patch.object(client, "_post_leads", fake_post):
+        results = await asyncio.gather(*(
+            client.add_lead(f"owner{i}@example.com", "Owner", str(i), "Acme")
+            for i in range(5)
+        ))
+
+    test_result(
+        "Concurrent add_lead calls share one POST",
+        posted == [5] and all(r["success"] for r in results),
+        f"POST batch sizes: {posted}"
+    )
+
+    posted.clear()
+    with patch.object(services, "INSTANTLY_API_KEY", "test"), \
+            patch.object(services, "INSTANTLY_CAMPAIGN_ID", "campaign"), \
+            patch.object(client, "_post_leads", fake_post):
+        bulk = await client.add_leads_batch([
+            {"email": f"owner{i}@example.com", "first_name": "Owner"} for i in range(250)
+        ])
+    test_result(
+        "add_leads_batch chunks by BATCH_SIZE",
+        posted == [100, 100, 50] and bulk["success"] and len(bulk["batches"]) == 3,
+        f"POST batch sizes: {posted}"
+    )
+
+
+async def test_http_client():
+    """Test shared HTTP connection pool."""
+    print("\n=== Testing Shared HTTP Client ===")
+
+    from services import get_http_client, close_http_client
+
+    first = get_http_client()
+    second = get_http_client()
+    test_result(
+        "Client reused within event loop",
+        first is second and not first.is_closed,
+        "Same pooled client returned"
+    )
+
+    await first.aclose()
+    replacement = get_http_client()
+    test_result(
+        "Closed client replaced",
+        replacement is not first and not replacement.is_closed,
+        "Fresh client created after close"
+    )
+    await close_http_client()
+    test_result(
+        "Shutdown closes shared client",
+        replacement.is_closed,
+        "close_http_client() released the pool"
+    )
+
+
+async def test_retry_and_circuit():
+    """Test retry with backoff and per-host circuit breaking."""
+    print("\n=== Testing Retry / Circuit Breaker ===")
+
+    import httpx
+    import services
+
+    calls = {"n": 0}
+
+    def flaky(request):
+        calls["n"] += 1
+        return httpx.Response(503 if calls["n"] == 1 else 200, json={"ok": True})
+
+    def down(request):
+        return httpx.Response(500)
+
+    with patch.object(services, "RETRY_BASE_DELAY", 0):
+        services.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(flaky)))
+        resp = await services._send_with_retry("POST", "http://flaky.test/analyze", json={})
+        test_result(
+            "Retries transient 5xx",
+            resp.status_code == 200 and calls["n"] == 2,
+            f"Attempts: {calls['n']}"
+        )
+
+        services.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(down)))
+        for _ in range(services.CIRCUIT_FAILURE_THRESHOLD):
+            await services._send_with_retry("POST", "http://down.test/analyze")
+        try:
+            await services._send_with_retry("POST", "http://down.test/analyze")
+            opened = False
+        except services.CircuitOpenError:
+            opened = True
+        test_result("Circuit opens after repeated failures", opened, "Host short-circuited")
+
+        # A throttled Cleanlab call waits out Retry-After (capped) and retries
+        throttled = {"n": 0}
+
+        def cleanlab(request):
+            throttled["n"] += 1
+            if throttled["n"] == 1:
+                return httpx.Response(429, headers={"Retry-After": "120"})
+            return httpx.Response(200, json={"trustworthiness_score": 0.9})
+
+        services.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(cleanlab)))
+        sleep = AsyncMock()
+        with patch("asyncio.sleep", sleep), patch.object(services, "CLEANLAB_API_KEY", "test"):
+            detector = services.HallucinationDetector()
+            result = await detector.get_trustworthiness_score("prompt", "response")
+        test_result(
+            "Cleanlab 429 honours Retry-After",
+            result["trustworthiness_score"] == 0.9
+            and sleep.await_args.args[0] == services.RETRY_AFTER_MAX,
+            f"Attempts: {throttled['n']}, waited: {sleep.await_args.args[0]}"
+        )
+
+        # Paid model calls aren't resent after a 502, which may follow output
+        bad_gateway = {"n": 0}
+
+        def gateway(request):
+            bad_gateway["n"] += 1
+            return httpx.Response(502)
+
+        services.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(gateway)))
+        with patch.object(services, "CLEANLAB_API_KEY", "test"):
+            await services.HallucinationDetector().get_trustworthiness_score("prompt", "response")
+        cleanlab_attempts = bad_gateway["n"]
+        bad_gateway["n"] = 0
+        council = services.LLMCouncil()
+        await council._request_completion(council._cached_system("system"), "task", "context", 64)
+        services._circuit_breakers.clear()
+        test_result(
+            "Model calls not retried after 502",
+            cleanlab_attempts == 1 and bad_gateway["n"] == 1,
+            f"Cleanlab: {cleanlab_attempts}, council: {bad_gateway['n']}"
+        )
+
+        # Outreach pushes retry a 503 that asks for it, but never resend a
+        # create that may already have gone through
+        calls["n"] = 0
+
+        def throttled_once(request):
+            calls["n"] += 1
+            if calls["n"] == 1:
+                return httpx.Response(503, headers={"Retry-After": "0"})
+            return httpx.Response(200, json={"ok": True})
+
+        services.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(throttled_once)))
+        with patch.object(services, "GHL_API_KEY", "test"), \
+                patch.object(services, "GHL_LOCATION_ID", "loc"):
+            contact = await services.GHLClient().create_contact(
+                "owner@acme.com", "Jane", "Doe", "5125550100", "Acme"
+            )
+        test_result(
+            "GHL contact retried after 503 with Retry-After",
+            contact["success"] and calls["n"] == 2,
+            f"Attempts: {calls['n']}"
+        )
+
+        def reset(request):
+            calls["n"] += 1
+            raise httpx.ReadError("connection reset")
+
+        clay, heyreach = services.ClayClient(), services.HeyReachClient()
+        creates = {
+            "Clay row": lambda: clay._post_clay_row("t_1", {"company": "Acme"}, timeout=5.0),
+            "Clay submit": lambda: clay._submit_clay_row("t_1", {"company": "Acme"}),
+            "Instantly leads": lambda: services.InstantlyClient()._post_leads([{"email": "o@acme.com"}]),
+            "HeyReach lead": lambda: heyreach.add_lead_to_campaign("https://linkedin.com/in/o"),
+            "HeyReach batch": lambda: heyreach.add_leads_batch([{"linkedin_url": "https://linkedin.com/in/o"}]),
+            "GHL contact": lambda: services.GHLClient().create_contact("o@acme.com", "O", "W", "", "Acme"),
+        }
+        attempts = {}
+        services.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(reset)))
+        with patch.object(services, "GHL_API_KEY", "test"), \
+                patch.object(services, "GHL_LOCATION_ID", "loc"), \
+                patch.object(services, "HEYREACH_API_KEY", "test"), \
+                patch.object(services, "HEYREACH_CAMPAIGN_ID", "campaign"):
+            for label, create in creates.items():
+                calls["n"] = 0
+                try:
+                    await create()
+                except httpx.HTTPError:
+                    pass
+                attempts[label] = calls["n"]
+        services._circuit_breakers.clear()
+        await services.close_http_client()
+        test_result(
+            "Record-creating POSTs not retried after ReadError",
+            all(n == 1 for n in attempts.values()),
+            f"Attempts: {attempts}"
+        )
+
+        # Paid FullEnrich job starts only retry when no job can have been created
+        starts = {"n": 0}
+
+        def start_then(first_failure):
+            def handler(request):
+                starts["n"] += 1
+                if starts["n"] == 1:
+                    if isinstance(first_failure, Exception):
+                        raise first_failure
+                    return first_failure
+                return httpx.Response(200, json={"enrichment_id": "job_retry"})
+            return handler
+
+        outcomes = {}
+        for label, first_failure in [
+            ("connect error", httpx.ConnectError("refused")),
+            ("503 with Retry-After", httpx.Response(503, headers={"Retry-After": "0"})),
+            ("503", httpx.Response(503)),
+            ("502", httpx.Response(502)),
+            ("read error", httpx.ReadError("reset")),
+        ]:
+            starts["n"] = 0
+            services.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(start_then(first_failure))))
+            with patch.object(services, "FULLENRICH_API_KEY", "test"):
+                try:
+                    job_id = await services.FullEnrichClient()._start_job("retry", [{"firstname": "jane"}])
+                except httpx.HTTPError:
+                    job_id = None
+            outcomes[label] = (starts["n"], job_id)
+            await services.close_http_client()
+        test_result(
+            "FullEnrich job start retried only when safe",
+            outcomes == {
+                "connect error": (2, "job_retry"),
+                "503 with Retry-After": (2, "job_retry"),
+                "503": (1, None),
+                "502": (1, None),
+                "read error": (1, None),
+            },
+            f"Outcomes: {outcomes}"
+        )
+
+        # In-flight requests per host stay under the host's cap
+        in_flight = {"now": 0, "peak": 0}
+
+        async def slow(request):
+            in_flight["now"] += 1
+            in_flight["peak"] = max(in_flight["peak"], in_flight["now"])
+            await asyncio.sleep(0.01)
+            in_flight["now"] -= 1
+            return httpx.Response(200)
+
+        services.set_http_client(httpx.AsyncClient(transport=httpx.MockTransport(slow)))
+        with patch.dict(services.HOST_CONCURRENCY_OVERRIDES, {"capped.test": 2}):
+            await asyncio.gather(*(services._send_with_retry("GET", "http://capped.test/x") for _ in range(6)))
+        test_result(
+            "Per-host concurrency capped",
+            in_flight["peak"] == 2,
+            f"Peak in flight: {in_flight['peak']}"
+        )
+
+        await services.close_http_client()
+        services._circuit_breakers.clear()
+
+
 async def test_pipeline_integration():
     """Test pipeline imports and initialization."""
     print("\n=== Testing Pipeline Integration ===")
@@ -412,10 +1543,18 @@ async def main():
 
     await test_quickchart()
     await test_fullenrich()
+    await test_fullenrich_batching()
     await test_heyreach()
     await test_rag_service()
     await test_hallucination_detector()
     await test_llm_council()
+    await test_bounded_gather()
+    await test_supabase_rows()
+    await test_clay_submit()
+    await test_intelligence_lookups()
+    await test_instantly_batching()
+    await test_http_client()
+    await test_retry_and_circuit()
     await test_pipeline_integration()
 
     success = print_summary()
@@ -18,7 +18,7 @@ import sys
 from datetime import datetime
 from typing import List, Dict, Any
 
-from rise_pipeline.services import IntelligenceServices
+from rise_pipeline.services import IntelligenceServices, close_http_client
 import httpx
 import os
 from dotenv import load_dotenv
@@ -37,6 +37,8 @@ class Phase2Processor:
         self.supabase_url = os.getenv("SUPABASE_URL")
         self.supabase_key = os.getenv("SUPABASE_SERVICE_KEY")
         self.base_url = f"{self.supabase_url}/rest/v1"
+        # One pooled client for every Supabase call in the run; close with aclose()
+        self.client = httpx.AsyncClient(timeout=30.0)
         self.intelligence = IntelligenceServices()
         self.stats = {
             "total": 0,
@@ -55,44 +57,47 @@ class Phase2Processor:
             "Prefer": "return=representation"
         }
 
+    async def aclose(self):
+        """Close the pooled Supabase connections."""
+        await self.client.aclose()
+
     async def get_leads_for_processing(self, limit: int = None, lead_id: str = None) -> List[Dict]:
         """Fetch leads that need Phase 2 processing"""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            if lead_id:
-                # Process specific lead
-                resp = await client.get(
-                    f"{self.base_url}/leads?id=eq.{lead_id}",
-                    headers=self._headers()
-                )
-                if resp.status_code == 200:
-                    results = resp.json()
-                    return results if results else []
-                return []
-
-            # Fetch leads with tech analysis but no Phase 2 data
-            url = f"{self.base_url}/leads"
-            params = {
-                "select": "id,business_name,website,address_city,address_state,phone,address_full,google_rating,google_review_count",
-                "tech_analysis_at": "not.is.null",
-                "phase_2a_completed_at": "is.null",
-                "order": "tech_stack_ai_score.asc.nullslast"
-            }
+        if lead_id:
+            # Process specific lead
+            resp = await self.client.get(
+                f"{self.base_url}/leads?id=eq.{lead_id}",
+                headers=self._headers()
+            )
+            if resp.status_code == 200:
+                results = resp.json()
+                return results if results else []
+            return []
+
+        # Fetch leads with tech analysis but no Phase 2 data
+        url = f"{self.base_url}/leads"
+        params = {
+            "select": "id,business_name,website,address_city,address_state,phone,address_full,google_rating,google_review_count",
+            "tech_analysis_at": "not.is.null",
+            "phase_2a_completed_at": "is.null",
+            "order": "tech_stack_ai_score.asc.nullslast"
+        }
 
-            if limit:
-                params["limit"] = limit
+        if limit:
+            params["limit"] = limit
 
-            resp = await client.get(url, headers=self._headers(), params=params)
+        resp = await self.client.get(url, headers=self._headers(), params=params)
 
-            print(f"  Query URL: {resp.url}")
-            print(f"  Status: {resp.status_code}")
+        print(f"  Query URL: {resp.url}")
+        print(f"  Status: {resp.status_code}")
 
-            if resp.status_code == 200:
-                results = resp.json()
-                print(f"  Found {len(results)} leads")
-                return results
-            else:
-                print(f"  Error: {resp.text}")
-            return []
+        if resp.status_code == 200:
+            results = resp.json()
+            print(f"  Found {len(results)} leads")
+            return results
+        else:
+            print(f"  Error: {resp.text}")
+        return []
 
     async def process_lead(self, lead_data: Dict) -> bool:
         """Process a single lead through Phase 2"""
@@ -127,7 +132,7 @@ class Phase2Processor:
             print("    - TDLR license lookup (Phase 2D)")
             print("    - BBB reputation check (Phase 2E)")
 
-            visual, technical, directory, license_info, reputation, address = await self.intelligence.gather_all(
+            visual, technical, directory, license_info, reputation, address, owner_data = await self.intelligence.gather_all(
                 lead=lead,
                 website_url=website
             )
@@ -139,19 +144,18 @@ class Phase2Processor:
             print(f"  Address Type: {address.address_type} (residential={address.is_residential})")
 
             # Get tech analysis from database
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.get(
-                    f"{self.base_url}/leads?id=eq.{lead_id}&select=tech_analysis,tech_stack_ai_score,website_type",
-                    headers=self._headers()
-                )
+            resp = await self.client.get(
+                f"{self.base_url}/leads?id=eq.{lead_id}&select=tech_analysis,tech_stack_ai_score,website_type",
+                headers=self._headers()
+            )
 
-                if resp.status_code != 200 or not resp.json():
-                    print("  ERROR: No tech analysis found!")
-                    self.stats["failed"] += 1
-                    return False
+            if resp.status_code != 200 or not resp.json():
+                print("  ERROR: No tech analysis found!")
+                self.stats["failed"] += 1
+                return False
 
-                tech_data = resp.json()[0]
-                tech_analysis = tech_data.get('tech_analysis', {})
+            tech_data = resp.json()[0]
+            tech_analysis = tech_data.get('tech_analysis', {})
 
             # Calculate pain score with AI tech data
             print("  Calculating unified pain score...")
@@ -231,17 +235,16 @@ class Phase2Processor:
                 "updated_at": now
             }
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.patch(
-                    f"{self.base_url}/leads?id=eq.{lead_id}",
-                    headers=self._headers(),
-                    json=update_data
-                )
+            resp = await self.client.patch(
+                f"{self.base_url}/leads?id=eq.{lead_id}",
+                headers=self._headers(),
+                json=update_data
+            )
 
-                if resp.status_code not in [200, 204]:
-                    print(f"  ERROR updating Supabase: {resp.status_code} - {resp.text}")
-                    self.stats["failed"] += 1
-                    return False
+            if resp.status_code not in (200, 204):
+                print(f"  ERROR updating Supabase: {resp.status_code} - {resp.text}")
+                self.stats["failed"] += 1
+                return False
 
             print(f"  Saved to Supabase")
 
@@ -329,7 +332,11 @@ async def main():
         limit = args.limit or 10  # Default to 10
 
     processor = Phase2Processor()
-    await processor.run(limit=limit, lead_id=lead_id, batch_size=args.batch_size)
+    try:
+        await processor.run(limit=limit, lead_id=lead_id, batch_size=args.batch_size)
+    finally:
+        await processor.aclose()
+        await close_http_client()
 
 
 if __name__ == "__main__":
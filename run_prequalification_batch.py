@@ -18,7 +18,7 @@ import argparse
 from datetime import datetime
 from typing import List, Dict, Any
 
-from rise_pipeline.services import IntelligenceServices
+from rise_pipeline.services import IntelligenceServices, close_http_client
 from rise_pipeline.scoring import calculate_pre_qualification_score
 from rise_pipeline.models import (
     Lead, VisualAnalysis, TechnicalScores, DirectoryPresence,
@@ -38,6 +38,8 @@ class PreQualificationProcessor:
         self.supabase_url = os.getenv("SUPABASE_URL")
         self.supabase_key = os.getenv("SUPABASE_SERVICE_KEY")
         self.base_url = f"{self.supabase_url}/rest/v1"
+        # One pooled client for every Supabase call in the run; close with aclose()
+        self.client = httpx.AsyncClient(timeout=30.0)
         self.intelligence = IntelligenceServices()
         self.stats = {
             "total": 0,
@@ -56,43 +58,46 @@ class PreQualificationProcessor:
             "Prefer": "return=representation"
         }
 
+    async def aclose(self):
+        """Close the pooled Supabase connections."""
+        await self.client.aclose()
+
     async def get_leads_for_processing(self, limit: int = None, lead_id: str = None) -> List[Dict]:
         """Fetch leads that need pre-qualification (no prequalification_status yet)"""
-        async with httpx.AsyncClient(timeout=30.0) as client:
-            if lead_id:
-                # Process specific lead
-                resp = await client.get(
-                    f"{self.base_url}/leads?id=eq.{lead_id}",
-                    headers=self._headers()
-                )
-                if resp.status_code == 200:
-                    return resp.json() or []
-                return []
-
-            # Fetch leads WITHOUT pre-qualification status
-            url = f"{self.base_url}/leads"
-            params = {
-                "select": "id,business_name,website,address_city,address_state,phone,address_full,google_rating,google_review_count,address_zip",
-                "prequalification_status": "is.null",
-                "website": "not.is.null",  # Must have website
-                "order": "created_at.desc"
-            }
+        if lead_id:
+            # Process specific lead
+            resp = await self.client.get(
+                f"{self.base_url}/leads?id=eq.{lead_id}",
+                headers=self._headers()
+            )
+            if resp.status_code == 200:
+                return resp.json() or []
+            return []
 
-            if limit:
-                params["limit"] = limit
+        # Fetch leads WITHOUT pre-qualification status
+        url = f"{self.base_url}/leads"
+        params = {
+            "select": "id,business_name,website,address_city,address_state,phone,address_full,google_rating,google_review_count,address_zip",
+            "prequalification_status": "is.null",
+            "website": "not.is.null",  # Must have website
+            "order": "created_at.desc"
+        }
 
-            resp = await client.get(url, headers=self._headers(), params=params)
+        if limit:
+            params["limit"] = limit
 
-            print(f"  Query URL: {resp.url}")
-            print(f"  Status: {resp.status_code}")
+        resp = await self.client.get(url, headers=self._headers(), params=params)
 
-            if resp.status_code == 200:
-                results = resp.json()
-                print(f"  Found {len(results)} leads")
-                return results
-            else:
-                print(f"  Error: {resp.text}")
-            return []
+        print(f"  Query URL: {resp.url}")
+        print(f"  Status: {resp.status_code}")
+
+        if resp.status_code == 200:
+            results = resp.json()
+            print(f"  Found {len(results)} leads")
+            return results
+        else:
+            print(f"  Error: {resp.text}")
+        return []
 
     async def process_lead(self, lead_data: Dict) -> bool:
         """Process a single lead through FREE scrapers for pre-qualification"""
@@ -130,7 +135,7 @@ class PreQualificationProcessor:
             print("    - BBB reputation check (port 8002)")
             print("    - Address verification (port 8006)")
 
-            visual, technical, directory, license_info, reputation, address = await self.intelligence.gather_all(
+            visual, technical, directory, license_info, reputation, address, owner_data = await self.intelligence.gather_all(
                 lead=lead,
                 website_url=website
             )
@@ -142,6 +147,7 @@ class PreQualificationProcessor:
             print(f"    Has HTTPS: {technical.has_https}")
             print(f"    License Status: {license_info.license_status}")
             print(f"    Owner Name: {license_info.owner_name or 'Not found'}")
+            print(f"    Owner (website): {owner_data.owner_full_name or 'Not found'}")
             print(f"    BBB Rating: {reputation.bbb_rating}")
             print(f"    Address Type: {address.address_type}")
 
@@ -208,17 +214,16 @@ class PreQualificationProcessor:
                 "updated_at": now
             }
 
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                resp = await client.patch(
-                    f"{self.base_url}/leads?id=eq.{lead_id}",
-                    headers=self._headers(),
-                    json=update_data
-                )
+            resp = await self.client.patch(
+                f"{self.base_url}/leads?id=eq.{lead_id}",
+                headers=self._headers(),
+                json=update_data
+            )
 
-                if resp.status_code not in [200, 204]:
-                    print(f"  ERROR updating Supabase: {resp.status_code} - {resp.text}")
-                    self.stats["failed"] += 1
-                    return False
+            if resp.status_code not in (200, 204):
+                print(f"  ERROR updating Supabase: {resp.status_code} - {resp.text}")
+                self.stats["failed"] += 1
+                return False
 
             print(f"  Saved to Supabase")
 
@@ -308,7 +313,11 @@ async def main():
         limit = args.limit or 10  # Default to 10
 
     processor = PreQualificationProcessor()
-    await processor.run(limit=limit, lead_id=lead_id, batch_size=args.batch_size)
+    try:
+        await processor.run(limit=limit, lead_id=lead_id, batch_size=args.batch_size)
+    finally:
+        await processor.aclose()
+        await close_http_client()
 
 
 if __name__ == "__main__":